@@ -0,0 +1,155 @@
+from dataclasses import dataclass
+
+# AI-NOTE : 2026-10-19 적 타입별 불변 매개변수 테이블
+# - 이유: 적마다 10~40개 문자열 키 딕셔너리(type_specific_data)를 복사해 들고 있었고
+#   AI 조회마다 .get("kt_optimal_distance", 80.0) 형태의 문자열 해싱 발생
+# - 요구사항: 타입별 테이블은 모듈 로드 시 한 번만 만들고 컴포넌트는 타입 인덱스로 참조
+# - 히스토리: get_specific_ai_behavior()/get_attack_pattern_data() 딕셔너리 병합
+#   -> frozen/slots 데이터클래스, 접두사(kt_/mt_/pb_)는 클래스가 대신하므로 제거
+
+
+@dataclass(frozen=True, slots=True)
+class KoreanTeacherParams:
+    """국어선생님 AI 행동 및 공격 패턴 매개변수"""
+    # 이동 관련
+    approach_speed: float = 100.0              # 접근 속도 (픽셀/프레임)
+    min_attack_distance: float = 600.0         # 최소 공격 거리 (픽셀)
+    max_attack_distance: float = 1000.0        # 최대 공격 거리 (픽셀)
+    optimal_distance: float = 800.0            # 최적 공격 거리 (픽셀)
+
+    # 상태 전환 관련
+    attack_preparation_time: float = 1.5       # 공격 준비 시간 (초)
+    post_attack_cooldown: float = 2.0          # 공격 후 쿨다운 (초)
+    chase_timeout: float = 5.0                 # 추적 포기 시간 (초)
+
+    # AI 판단 관련
+    player_proximity_threshold: float = 1200.0  # 플레이어 감지 거리 (픽셀)
+    retreat_threshold: float = 400.0            # 후퇴 판단 거리 (픽셀)
+
+    # 공격 범위 및 형태
+    attack_angle: float = 90.0                 # 공격 각도 (도) - 부채꼴
+    attack_range: float = 80.0                 # 공격 범위 (픽셀)
+    attack_damage: int = 15                    # 공격 데미지
+
+    # 부채꼴 공격 세부 설정
+    fan_segments: int = 5                      # 부채꼴 분할 수 (더 정밀한 공격)
+    attack_duration: float = 0.5               # 공격 지속 시간 (초)
+
+    # 시각적 효과 관련
+    charge_visual_scale: float = 1.2           # 공격 준비 시 크기 배율
+    attack_visual_flash: float = 0.3           # 공격 시 번쩍임 효과 (초)
+
+    # 공격 빈도 제한
+    attack_cooldown_time: float = 3.0          # 공격 간 최소 간격 (초)
+    consecutive_attack_limit: int = 2          # 연속 공격 최대 횟수
+
+
+@dataclass(frozen=True, slots=True)
+class MathTeacherParams:
+    """수학선생님 AI 행동 및 공격 패턴 매개변수"""
+    # 기본 이동 관련
+    normal_speed: float = 4.0                  # 일반 이동 속도 (픽셀/프레임)
+    approach_distance: float = 150.0           # 돌진 준비 거리 (픽셀)
+    optimal_dash_distance: float = 120.0       # 최적 돌진 시작 거리 (픽셀)
+
+    # 돌진 공격 관련
+    dash_speed_multiplier: float = 3.0         # 돌진 시 속도 배수
+    dash_preparation_time: float = 0.5         # 돌진 준비 시간 (초)
+    dash_duration: float = 1.0                 # 돌진 지속 시간 (초)
+    dash_cooldown: float = 3.0                 # 돌진 후 쿨다운 (초)
+
+    # 상태 전환 관련
+    stunned_duration: float = 0.3              # 돌진 종료 후 기절 시간 (초)
+    retreat_speed_multiplier: float = 0.7      # 쿨다운 중 이동 속도 배수
+
+    # AI 판단 관련
+    player_detection_range: float = 200.0      # 플레이어 감지 거리 (픽셀)
+    dash_min_distance: float = 80.0            # 돌진 최소 거리 (픽셀)
+    dash_max_distance: float = 180.0           # 돌진 최대 거리 (픽셀)
+
+    # 돌진 공격 데미지 및 효과
+    dash_damage: int = 10                      # 돌진 공격 데미지
+    collision_width: float = 25.0              # 돌진 충돌 판정 폭 (픽셀)
+    collision_height: float = 25.0             # 돌진 충돌 판정 높이 (픽셀)
+
+    # 돌진 궤적 및 정확도
+    dash_accuracy: float = 0.95                # 돌진 정확도 (1.0 = 100% 정확)
+    trajectory_deviation: float = 5.0          # 궤적 편차 (도)
+
+    # 시각적 효과
+    dash_trail_duration: float = 0.8           # 돌진 궤적 표시 시간 (초)
+    preparation_scale: float = 1.1             # 돌진 준비 시 크기 배율
+    dash_scale: float = 1.3                    # 돌진 중 크기 배율
+
+    # 연속 공격 제한
+    max_consecutive_dashes: int = 3            # 최대 연속 돌진 횟수
+    forced_cooldown_after: int = 3             # N회 돌진 후 강제 쿨다운
+
+
+@dataclass(frozen=True, slots=True)
+class PrincipalBossParams:
+    """교장선생님 AI 행동 및 공격 패턴 매개변수"""
+    # 기본 행동 매개변수
+    base_speed: float = 3.0                    # 기본 이동 속도
+    phase_transition_delay: float = 2.0        # 페이즈 전환 시 지연 시간 (초)
+    invulnerable_during_special: float = 1.0   # 특수 공격 중 무적 시간 (초)
+
+    # 페이즈별 속도 배율
+    phase1_speed_mult: float = 1.0             # 페이즈 1 속도 배율
+    phase2_speed_mult: float = 1.2             # 페이즈 2 속도 배율
+    phase3_speed_mult: float = 1.5             # 페이즈 3 속도 배율
+
+    # 이동 패턴 관련
+    orbit_radius: float = 200.0                # 플레이어 주위 궤도 반지름
+    orbit_speed: float = 0.5                   # 궤도 회전 속도 (rad/sec)
+    random_movement_range: float = 100.0       # 랜덤 이동 범위
+
+    # 공격 준비 관련
+    attack_telegraph_time: float = 1.0         # 공격 예고 시간 (초)
+    attack_recovery_time: float = 0.8          # 공격 후 회복 시간 (초)
+
+    # 페이즈 3 특수 능력
+    health_regen_interval: float = 10.0        # 체력 회복 간격 (초)
+    health_regen_percent: float = 0.05         # 체력 회복 비율 (5%)
+
+    # 원형 탄막 패턴
+    circular_cooldown: float = 3.0             # 원형 탄막 쿨다운 (초)
+    circular_bullet_count: int = 12            # 원형 탄막 총알 수
+    circular_bullet_speed: float = 8.0         # 원형 탄막 속도
+    circular_damage: int = 15                  # 원형 탄막 데미지
+
+    # 추적 미사일 패턴
+    homing_cooldown: float = 5.0               # 추적 미사일 쿨다운 (초)
+    homing_missile_count: int = 3              # 추적 미사일 수
+    homing_speed: float = 6.0                  # 추적 미사일 속도
+    homing_turn_rate: float = 2.0              # 추적 미사일 회전율 (rad/sec)
+    homing_damage: int = 20                    # 추적 미사일 데미지
+
+    # 순간이동 공격 패턴
+    teleport_cooldown: float = 4.0             # 순간이동 쿨다운 (초)
+    teleport_range: float = 300.0              # 순간이동 범위 (픽셀)
+    teleport_attack_radius: float = 50.0       # 순간이동 공격 범위 (픽셀)
+    teleport_damage: int = 30                  # 순간이동 공격 데미지
+
+    # 레이저 빔 패턴
+    laser_cooldown: float = 6.0                # 레이저 빔 쿨다운 (초)
+    laser_charge_time: float = 2.0             # 레이저 충전 시간 (초)
+    laser_duration: float = 1.5                # 레이저 지속 시간 (초)
+    laser_width: float = 20.0                  # 레이저 폭 (픽셀)
+    laser_damage_per_sec: float = 40.0         # 레이저 초당 데미지
+
+    # 졸병 소환 패턴
+    summon_cooldown: float = 8.0               # 졸병 소환 쿨다운 (초)
+    summon_count: int = 2                      # 한 번에 소환할 졸병 수
+    summon_range: float = 150.0                # 소환 범위 (픽셀)
+    minion_health: int = 20                    # 소환된 졸병 체력
+
+
+EnemyParams = KoreanTeacherParams | MathTeacherParams | PrincipalBossParams
+
+# EnemyType 값으로 인덱싱되는 타입별 매개변수 (모듈 로드 시 한 번 생성)
+ENEMY_PARAMS: tuple[EnemyParams, ...] = (
+    KoreanTeacherParams(),
+    MathTeacherParams(),
+    PrincipalBossParams(),
+)
@@ -0,0 +1,42 @@
+# AI-NOTE : 2026-10-19 열거형 메타데이터 테이블 분리
+# - 이유: enums.py의 프로퍼티가 호출될 때마다 딕셔너리/리스트를 새로 만들었고
+#   ItemSystem, 충돌 처리에서 엔티티마다 매 프레임 호출됨
+# - 요구사항: 모듈 로드 시 한 번 만든 불변 튜플을 enum.value로 인덱싱 (호출 시 할당 없음)
+# - 히스토리: 프로퍼티 안의 리스트 리터럴/람다 몽키패치 -> 이 모듈의 튜플 조회
+# 주의: 각 튜플의 순서는 enums.py의 열거형 값 순서와 일치해야 함
+
+# EntityStatus
+ENTITY_STATUS_NAMES = ("생존", "무적", "사망")
+
+# EnemyType: 국어선생님, 수학선생님, 교장선생님
+ENEMY_TYPE_NAMES = ("국어선생님", "수학선생님", "교장선생님")
+ENEMY_BASE_SPEEDS = (2.0, 4.0, 3.0)             # 느림, 빠름, 중간
+ENEMY_BASE_HEALTHS = (50, 30, 150)              # 중간, 낮음, 높음
+ENEMY_BASE_ATTACK_POWERS = (15, 10, 25)         # 중간, 낮음, 높음
+ENEMY_BASE_EXPERIENCE_YIELDS = (10, 5, 50)      # 중간, 낮음, 높음
+ENEMY_MOVEMENT_MODE_VALUES = (0, 1, 0)          # MovementMode 값: 수학선생님만 군집 이동
+ENEMY_KNOCKBACK_MASSES = (1.0, 0.8, 6.0)        # 넉백 질량: 보스는 거의 밀리지 않음
+
+# MovementMode
+MOVEMENT_MODE_NAMES = ("추적", "군집")
+
+# EnemyState
+ENEMY_STATE_NAMES = ("생성중", "대기", "추적", "공격", "기절", "사망")
+
+# ItemID (아이템 종류는 ItemType 값: 0 무기, 1 능력, 2 기타)
+ITEM_NAMES = (
+    "경험치 구슬", "축구공", "농구공", "야구 배트",
+    "축구화", "농구화", "홍삼", "우유", "자석",
+)
+ITEM_TYPE_VALUES = (2, 0, 0, 0, 1, 1, 1, 1, 1)
+
+# PhysicsBodyType
+PHYSICS_BODY_TYPE_NAMES = ("플레이어", "적", "투사체", "아이템")
+
+# ObstacleType: 책상, 사물함, 기둥
+OBSTACLE_NAMES = ("책상", "사물함", "기둥")
+OBSTACLE_SIZES = ((80, 50), (60, 40), (40, 40))
+OBSTACLE_COLORS = ((139, 90, 43), (112, 128, 144), (169, 169, 169))
+
+# CollisionLayer 단일 비트별 이름 (비트, 이름)
+COLLISION_LAYER_NAMES = ((1, "장애물"), (2, "플레이어"), (4, "적"), (8, "투사체"))
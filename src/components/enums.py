@@ -1,4 +1,24 @@
-from enum import IntEnum
+from enum import IntEnum, IntFlag
+
+from components.enum_tables import (
+    COLLISION_LAYER_NAMES,
+    ENEMY_BASE_ATTACK_POWERS,
+    ENEMY_BASE_EXPERIENCE_YIELDS,
+    ENEMY_BASE_HEALTHS,
+    ENEMY_BASE_SPEEDS,
+    ENEMY_KNOCKBACK_MASSES,
+    ENEMY_MOVEMENT_MODE_VALUES,
+    ENEMY_STATE_NAMES,
+    ENEMY_TYPE_NAMES,
+    ENTITY_STATUS_NAMES,
+    ITEM_NAMES,
+    ITEM_TYPE_VALUES,
+    MOVEMENT_MODE_NAMES,
+    OBSTACLE_COLORS,
+    OBSTACLE_NAMES,
+    OBSTACLE_SIZES,
+    PHYSICS_BODY_TYPE_NAMES,
+)
 
 class EntityStatus(IntEnum):
     ALIVE = 0
@@ -7,7 +27,18 @@ class EntityStatus(IntEnum):
 
     @property
     def display_name(self) -> str:
-        return ["생존", "무적", "사망"][self.value]
+        return ENTITY_STATUS_NAMES[self.value]
+
+# AI-NOTE : 2026-10-19 적 이동 방식 분류
+# - 이유: 수학선생님 대규모 돌격을 개별 직진이 아닌 무리 이동으로 표현
+# - 요구사항: EnemyComponent마다 선택, 기본값은 EnemyType별 테이블
+class MovementMode(IntEnum):
+    SEEK = 0   # 플레이어(또는 흐름장) 방향 직접 추적
+    FLOCK = 1  # 추적 + 이웃과 정렬/응집 (보이드)
+
+    @property
+    def display_name(self) -> str:
+        return MOVEMENT_MODE_NAMES[self.value]
 
 # AI-NOTE : 2025-01-13 적 캐릭터 타입 시스템 도입
 # - 이유: 3종의 서로 다른 적 캐릭터 구현을 위한 게임 기획 요구사항
@@ -18,42 +49,40 @@ class EnemyType(IntEnum):
     MATH_TEACHER = 1    # 수학선생님  
     PRINCIPAL = 2       # 교장선생님
 
-# AI-DEV : 성능 최적화를 위한 배열 인덱스 기반 조회
-# - 문제: 딕셔너리 조회보다 배열 인덱스 조회가 더 빠름 (게임 성능 중요)
-# - 해결책: enum.value를 인덱스로 사용하는 배열 구조 
-# - 주의사항: enum 순서와 배열 인덱스가 일치해야 함
-
-# 클래스 메서드들을 별도로 정의
-def _get_display_name(enemy_type: EnemyType) -> str:
-    _display_names = {
-        EnemyType.KOREAN_TEACHER: "국어선생님",
-        EnemyType.MATH_TEACHER: "수학선생님",
-        EnemyType.PRINCIPAL: "교장선생님"
-    }
-    return _display_names[enemy_type]
-
-def _get_base_speed(enemy_type: EnemyType) -> float:
-    _base_speeds = [2.0, 4.0, 3.0]        # 국어선생님(느림), 수학선생님(빠름), 교장선생님(중간)
-    return _base_speeds[enemy_type.value]
-
-def _get_base_health(enemy_type: EnemyType) -> int:
-    _base_healths = [50, 30, 150]         # 국어선생님(중간), 수학선생님(낮음), 교장선생님(높음)
-    return _base_healths[enemy_type.value]
-
-def _get_base_attack_power(enemy_type: EnemyType) -> int:
-    _base_attack_powers = [15, 10, 25]    # 국어선생님(중간), 수학선생님(낮음), 교장선생님(높음)
-    return _base_attack_powers[enemy_type.value]
-
-def _get_base_experience_yield(enemy_type: EnemyType) -> int:
-    _base_experience_yields = [10, 5, 50] # 국어선생님(중간), 수학선생님(낮음), 교장선생님(높음)
-    return _base_experience_yields[enemy_type.value]
-
-# 동적으로 프로퍼티 추가
-EnemyType.display_name = property(lambda self: _get_display_name(self))
-EnemyType.base_speed = property(lambda self: _get_base_speed(self))  
-EnemyType.base_health = property(lambda self: _get_base_health(self))
-EnemyType.base_attack_power = property(lambda self: _get_base_attack_power(self))
-EnemyType.base_experience_yield = property(lambda self: _get_base_experience_yield(self))
+    # AI-DEV : 성능 최적화를 위한 배열 인덱스 기반 조회
+    # - 문제: 딕셔너리 조회보다 배열 인덱스 조회가 더 빠름 (게임 성능 중요)
+    # - 해결책: enum.value를 인덱스로 사용하는 enum_tables의 불변 튜플
+    # - 주의사항: enum 순서와 튜플 인덱스가 일치해야 함
+    @property
+    def display_name(self) -> str:
+        return ENEMY_TYPE_NAMES[self.value]
+
+    @property
+    def base_speed(self) -> float:
+        return ENEMY_BASE_SPEEDS[self.value]
+
+    @property
+    def base_health(self) -> int:
+        return ENEMY_BASE_HEALTHS[self.value]
+
+    @property
+    def base_attack_power(self) -> int:
+        return ENEMY_BASE_ATTACK_POWERS[self.value]
+
+    @property
+    def base_experience_yield(self) -> int:
+        return ENEMY_BASE_EXPERIENCE_YIELDS[self.value]
+
+    @property
+    def knockback_mass(self) -> float:
+        return ENEMY_KNOCKBACK_MASSES[self.value]
+
+    @property
+    def default_movement_mode(self) -> MovementMode:
+        return _ENEMY_MOVEMENT_MODES[self.value]
+
+# EnemyType 값 -> 기본 MovementMode 멤버
+_ENEMY_MOVEMENT_MODES = tuple(MovementMode(value) for value in ENEMY_MOVEMENT_MODE_VALUES)
 
 class EnemyState(IntEnum):
     SPAWNING = 0     # 생성 중
@@ -65,7 +94,7 @@ class EnemyState(IntEnum):
     
     @property
     def display_name(self) -> str:
-        return ["생성중", "대기", "추적", "공격", "기절", "사망"][self.value]
+        return ENEMY_STATE_NAMES[self.value]
 
 class ItemType(IntEnum):
     WEAPON = 0
@@ -81,19 +110,77 @@ class ItemID(IntEnum):
     BASKETBALL_SHOES = 5
     RED_GINSENG = 6
     MILK = 7
+    MAGNET = 8
 
     @property
     def display_name(self) -> str:
-        return [
-            "경험치 구슬", "축구공", "농구공", "야구 배트",
-            "축구화", "농구화", "홍삼", "우유"
-        ][self.value]
+        return ITEM_NAMES[self.value]
 
     @property
     def item_type(self) -> ItemType:
-        if self.value in [ItemID.SOCCER_BALL, ItemID.BASKETBALL, ItemID.BASEBALL_BAT]:
-            return ItemType.WEAPON
-        elif self.value in [ItemID.SOCCER_SHOES, ItemID.BASKETBALL_SHOES, ItemID.RED_GINSENG, ItemID.MILK]:
-            return ItemType.ABILITY
-        else:
-            return ItemType.MISC
+        return _ITEM_TYPES[self.value]
+
+# ItemID 값 -> ItemType 멤버 (멤버 변환도 로드 시 한 번만)
+_ITEM_TYPES = tuple(ItemType(value) for value in ITEM_TYPE_VALUES)
+
+# AI-NOTE : 2026-10-19 물리 백엔드용 바디 분류 도입
+# - 이유: pymunk collision_type으로 충돌 쌍 종류를 구분해야 함
+# - 요구사항: 플레이어/적/투사체/아이템 간 충돌 콜백 등록
+class PhysicsBodyType(IntEnum):
+    PLAYER = 0
+    ENEMY = 1
+    PROJECTILE = 2
+    ITEM = 3
+
+    @property
+    def display_name(self) -> str:
+        return PHYSICS_BODY_TYPE_NAMES[self.value]
+
+# AI-NOTE : 2026-10-19 교실 장애물 타입 도입
+# - 이유: 빈 직사각형 맵에 책상/사물함/기둥 같은 정적 충돌체가 필요
+# - 요구사항: 타입별 크기와 색상을 배열 인덱스로 조회
+class ObstacleType(IntEnum):
+    DESK = 0     # 책상
+    LOCKER = 1   # 사물함
+    PILLAR = 2   # 기둥
+
+    @property
+    def display_name(self) -> str:
+        return OBSTACLE_NAMES[self.value]
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return OBSTACLE_SIZES[self.value]
+
+    @property
+    def color(self) -> tuple[int, int, int]:
+        return OBSTACLE_COLORS[self.value]
+
+# AI-NOTE : 2026-10-19 행동 트리 노드 실행 결과
+# - 이유: 보스/엘리트 AI를 행동 트리로 구성하면서 노드 간 공통 반환값이 필요
+# - 요구사항: RUNNING이면 부모 복합 노드가 다음 틱에 해당 자식부터 바로 재개
+class BTStatus(IntEnum):
+    SUCCESS = 0
+    FAILURE = 1
+    RUNNING = 2
+
+# AI-NOTE : 2026-10-19 시스템 간 게임 이벤트 종류
+# - 이유: 보스 페이즈처럼 체력 변화에만 반응하면 되는 로직이 매 틱 체력을 폴링함
+# - 요구사항: EventBus가 값으로 인덱싱하는 핸들러 리스트를 갖도록 0부터 연속 값 사용
+class GameEvent(IntEnum):
+    HEALTH_CHANGED = 0  # (entity_id, current, maximum)
+
+# AI-NOTE : 2026-10-19 레이캐스트 충돌 레이어 마스크 도입
+# - 이유: 레이저/직선 공격마다 맞힐 대상(장애물, 플레이어, 적)이 다름
+# - 요구사항: 여러 레이어를 비트 OR로 조합해 한 번의 레이캐스트에 전달
+class CollisionLayer(IntFlag):
+    NONE = 0
+    OBSTACLE = 1 << 0
+    PLAYER = 1 << 1
+    ENEMY = 1 << 2
+    PROJECTILE = 1 << 3
+    ALL = OBSTACLE | PLAYER | ENEMY | PROJECTILE
+
+    @property
+    def display_name(self) -> str:
+        return "|".join(name for bit, name in COLLISION_LAYER_NAMES if self.value & bit) or "없음"
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+from core.component import Component
+
+
+@dataclass
+class KnockbackComponent(Component):
+    """
+    Knockback velocity of an entity, kept apart from its steering velocity.
+
+    ``KnockbackSystem`` adds hit impulses divided by ``mass`` to it and
+    integrates and damps it every frame, so AI systems that rewrite
+    ``VelocityComponent`` do not cancel a hit reaction.
+    """
+    mass: float = 1.0
+    # 지수 감쇠율: 초기 속도 v로 밀린 총 거리는 v / damping
+    damping: float = 4.0
+    vx: float = 0.0
+    vy: float = 0.0
@@ -0,0 +1,58 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from core.component import Component
+
+
+@dataclass
+class MotionHistoryComponent(Component):
+    """
+    A fixed-size ring buffer of an entity's recent positions.
+
+    ``MotionHistorySystem`` pushes one sample per frame into a
+    preallocated array, and readers get the smoothed velocity and a lead prediction in
+    O(1) without allocating. ``recent_positions`` (e.g. for trails) returns
+    a view until the buffer first wraps and an ordered copy after that.
+    """
+    capacity: int = 32
+    # 순간 속도에 곱하는 EMA 가중치 (1.0이면 평활화 없음)
+    smoothing: float = 0.3
+    positions: np.ndarray = field(init=False, repr=False)
+    head: int = field(init=False, default=0)
+    count: int = field(init=False, default=0)
+    velocity_x: float = field(init=False, default=0.0)
+    velocity_y: float = field(init=False, default=0.0)
+
+    def __post_init__(self) -> None:
+        self.positions = np.zeros((self.capacity, 2), dtype=np.float64)
+
+    def push(self, x: float, y: float, delta_time: float) -> None:
+        """Records a new position and updates the smoothed velocity."""
+        if self.count and delta_time > 0.0:
+            last_x, last_y = self.positions[self.head - 1]
+            instant_x = (x - last_x) / delta_time
+            instant_y = (y - last_y) / delta_time
+            self.velocity_x += (instant_x - self.velocity_x) * self.smoothing
+            self.velocity_y += (instant_y - self.velocity_y) * self.smoothing
+
+        self.positions[self.head] = (x, y)
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def predict(self, lead_time: float) -> tuple[float, float]:
+        """Returns the position expected after ``lead_time`` at the smoothed velocity."""
+        if not self.count:
+            return (0.0, 0.0)
+        last_x, last_y = self.positions[self.head - 1]
+        return (float(last_x) + self.velocity_x * lead_time, float(last_y) + self.velocity_y * lead_time)
+
+    def recent_positions(self) -> np.ndarray:
+        """Returns the stored positions from oldest to newest.
+
+        This is a view while the buffer has not wrapped yet; after that it
+        allocates an ordered copy.
+        """
+        if self.count < self.capacity:
+            return self.positions[:self.count]
+        return np.roll(self.positions, -self.head, axis=0)
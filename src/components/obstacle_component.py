@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+from core.component import Component
+from .enums import ObstacleType
+
+
+@dataclass
+class ObstacleComponent(Component):
+    """A component for static obstacle colliders."""
+    obstacle_type: ObstacleType
+    width: float
+    height: float
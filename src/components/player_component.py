@@ -14,6 +14,9 @@ class PlayerComponent(Component):
     movement_speed: float = 5.0
     base_attack_speed: float = 1.0  # attacks per second
     attack_speed: float = 1.0
+    # 경험치 구슬을 끌어당기기 시작하는 거리 (자석 아이템으로 증가)
+    base_pickup_radius: float = 80.0
+    pickup_radius: float = 80.0
 
     # AI-NOTE : 2025-01-05 무적 시스템 통합 관리
     # - 이유: 충돌 무적과 농구화 무적을 하나의 플래그로 관리하되 duration으로 구분
@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional, Set
+
 from core.component import Component
 
 @dataclass
@@ -7,3 +9,19 @@ class ProjectileComponent(Component):
     bounces: int = 0
     pierce: int = 0
     owner_id: int = -1 # The entity that fired the projectile
+    # AI-NOTE : 2026-10-19 투사체 수명/사거리 제한
+    # - 이유: 바운스가 많은 투사체가 화면 안에서 계속 튕기며 오래 살아남음
+    # - 요구사항: 0이면 제한 없음, 수명은 delta_time 누적 단위, 사거리는 픽셀
+    max_lifetime: float = 0.0
+    max_distance: float = 0.0
+    lifetime: float = 0.0
+    distance_traveled: float = 0.0
+    # AI-NOTE : 2026-10-19 공격원별 적중 기록
+    # - 이유: 적 전역 무적(0.3초)은 다른 무기의 타격까지 막고 매 프레임 타이머 갱신 필요
+    # - 요구사항: 같은 투사체는 같은 적을 한 번만 때림 (관통/반사 포함)
+    hit_enemies: Set[int] = field(default_factory=set)
+    # AI-NOTE : 2026-10-19 스윕 판정용 이동 전 위치
+    # - 이유: 현재 위치와 속도로 시작점을 역산하면 반사 직후 반대편을 스윕함
+    # - 요구사항: MovementSystem.integrate가 위치를 옮기기 직전에 기록, 이동 전에는 None
+    prev_x: Optional[float] = None
+    prev_y: Optional[float] = None
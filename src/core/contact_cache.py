@@ -0,0 +1,105 @@
+from collections.abc import Callable
+
+ContactCallback = Callable[[int, int], None]
+
+# AI-DEV : 접촉 쌍을 튜플 대신 단일 정수 키로 저장
+# - 문제: 매 프레임 (a, b) 튜플 생성과 해싱 비용이 접촉 수에 비례해 증가
+# - 해결책: 두 엔티티 ID를 64비트 정수 하나로 패킹하여 set/dict 키로 사용
+# - 주의사항: 엔티티 ID는 32비트 범위 안에 있어야 함
+_ID_BITS = 32
+_ID_MASK = (1 << _ID_BITS) - 1
+
+
+def _pack(a: int, b: int) -> int:
+    return (a << _ID_BITS) | b
+
+
+def _unpack(key: int) -> tuple[int, int]:
+    return key >> _ID_BITS, key & _ID_MASK
+
+
+class ContactCache:
+    """Keeps the set of touching (a, b) pairs alive between frames.
+
+    A collision pass calls ``begin_frame``, reports every pair that is
+    touching via ``add_contact`` and finishes with ``end_frame``, which
+    emits ``on_enter`` for new pairs, ``on_stay`` for persisting pairs and
+    ``on_exit`` for pairs that stopped touching (including destroyed
+    entities).
+    """
+
+    def __init__(self) -> None:
+        self._previous: dict[int, None] = {}
+        self._current: dict[int, None] = {}
+        self._enter_callbacks: list[ContactCallback] = []
+        self._stay_callbacks: list[ContactCallback] = []
+        self._exit_callbacks: list[ContactCallback] = []
+
+    def on_enter(self, callback: ContactCallback) -> None:
+        """Registers a callback for pairs that started touching."""
+        self._enter_callbacks.append(callback)
+
+    def on_stay(self, callback: ContactCallback) -> None:
+        """Registers a callback for pairs that kept touching."""
+        self._stay_callbacks.append(callback)
+
+    def on_exit(self, callback: ContactCallback) -> None:
+        """Registers a callback for pairs that stopped touching."""
+        self._exit_callbacks.append(callback)
+
+    def begin_frame(self) -> None:
+        """Starts collecting the contacts of a new frame."""
+        self._current = {}
+
+    def add_contact(self, a: int, b: int) -> bool:
+        """Records that ``a`` and ``b`` touch in the current frame.
+
+        Returns:
+            True if the pair was not touching in the previous frame.
+        """
+        key = _pack(a, b)
+        self._current[key] = None
+        return key not in self._previous
+
+    def was_touching(self, a: int, b: int) -> bool:
+        """Checks whether the pair was touching in the previous frame.
+
+        Callers can use this to skip narrowphase work for stay-contacts.
+        """
+        return _pack(a, b) in self._previous
+
+    def is_touching(self, a: int, b: int) -> bool:
+        """Checks whether the pair was reported in the current frame."""
+        return _pack(a, b) in self._current
+
+    def end_frame(self) -> None:
+        """Emits enter/stay/exit events and promotes the current frame."""
+        previous = self._previous
+        current = self._current
+
+        # 삽입 순서를 유지하여 같은 프레임 내 처리 순서를 결정적으로 유지
+        for key in current:
+            a, b = _unpack(key)
+            if key in previous:
+                for callback in self._stay_callbacks:
+                    callback(a, b)
+            else:
+                for callback in self._enter_callbacks:
+                    callback(a, b)
+
+        if self._exit_callbacks:
+            for key in previous:
+                if key not in current:
+                    a, b = _unpack(key)
+                    for callback in self._exit_callbacks:
+                        callback(a, b)
+
+        self._previous = current
+
+    def clear(self) -> None:
+        """Forgets every contact without emitting exit events."""
+        self._previous = {}
+        self._current = {}
+
+    def __len__(self) -> int:
+        return len(self._previous)
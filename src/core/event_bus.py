@@ -0,0 +1,33 @@
+from collections.abc import Callable
+
+from components.enums import GameEvent
+
+EventHandler = Callable[..., None]
+
+
+class EventBus:
+    """Synchronous publish/subscribe hub between systems.
+
+    Handlers are kept in one list per ``GameEvent`` value, so publishing
+    is an index and a loop over the subscribers of that event only. Events
+    are delivered immediately, in subscription order, with the positional
+    arguments documented on each ``GameEvent`` member.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: tuple[list[EventHandler], ...] = tuple([] for _ in GameEvent)
+
+    def subscribe(self, event: GameEvent, handler: EventHandler) -> None:
+        """Registers ``handler`` to be called on every ``event``."""
+        self._handlers[event].append(handler)
+
+    def unsubscribe(self, event: GameEvent, handler: EventHandler) -> None:
+        """Removes a handler registered with ``subscribe``; unknown handlers are ignored."""
+        handlers = self._handlers[event]
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def publish(self, event: GameEvent, *args) -> None:
+        """Calls every handler of ``event`` with ``args``."""
+        for handler in self._handlers[event]:
+            handler(*args)
@@ -66,4 +66,20 @@ class Milk(AbilityItem):
 
     def apply_effect(self, target) -> None:
         # This will be handled by the ItemSystem as a one-time effect
-        pass
\ No newline at end of file
+        pass
+
+@dataclass
+class Magnet(AbilityItem):
+    item_id: ItemID = field(default=ItemID.MAGNET, init=False)
+    name: str = field(default="자석", init=False)
+    max_level: int = field(default=5, init=False)
+    description: str = field(default="경험치 구슬을 끌어당기는 범위가 넓어집니다.", init=False)
+    level: int = 1
+
+    def get_effect(self) -> dict:
+        # Lv.1: 50%, Lv.2-5: 25% each
+        increase_percentage = 0.50 + (0.25 * (self.level - 1))
+        return {"pickup_radius_increase": increase_percentage}
+
+    def apply_effect(self, target) -> None:
+        pass
@@ -1,11 +1,13 @@
-from abc import ABC, abstractmethod
+from abc import ABC
 import random
 import math
 from typing import TYPE_CHECKING, Union, Optional
 
 from core.entity import Entity
 from components.enemy_component import EnemyComponent
+from components.enemy_params import ENEMY_PARAMS, EnemyParams
 from components.health_component import HealthComponent
+from components.knockback_component import KnockbackComponent
 from components.position_component import PositionComponent
 from components.velocity_component import VelocityComponent
 from components.enums import EnemyType, EnemyState, EntityStatus
@@ -39,21 +41,16 @@ class Enemy(ABC):
         """연결된 엔티티 반환"""
         return self._entity
     
+    @property
+    def params(self) -> EnemyParams:
+        """적 타입의 AI 행동 및 공격 패턴 매개변수"""
+        return ENEMY_PARAMS[self.enemy_type]
+    
     @property 
     def entity_manager(self) -> Optional["EntityManager"]:
         """연결된 엔티티 매니저 반환"""
         return self._entity_manager
     
-    @abstractmethod
-    def get_specific_ai_behavior(self) -> dict[str, float]:
-        """각 적 타입별 고유 AI 행동 파라미터 반환"""
-        pass
-    
-    @abstractmethod 
-    def get_attack_pattern_data(self) -> dict[str, float]:
-        """각 적 타입별 고유 공격 패턴 데이터 반환"""
-        pass
-    
     def create_entity(self, entity_manager: "EntityManager", spawn_x: Optional[float] = None, spawn_y: Optional[float] = None) -> Entity:
         """
         적 엔티티를 생성하고 필요한 컴포넌트들을 추가합니다.
@@ -68,8 +65,7 @@ class Enemy(ABC):
         """
         # 엔티티 생성
         entity = entity_manager.create_entity()
-        self._entity = entity
-        self._entity_manager = entity_manager
+        self.bind_entity(entity_manager, entity)
         
         # 스폰 위치 계산 (화면 가장자리)
         if spawn_x is None or spawn_y is None:
@@ -80,9 +76,20 @@ class Enemy(ABC):
         self._add_velocity_component(entity_manager, entity.id)
         self._add_health_component(entity_manager, entity.id)
         self._add_enemy_component(entity_manager, entity.id)
+        self._add_knockback_component(entity_manager, entity.id)
         
         return entity
     
+    def bind_entity(self, entity_manager: "EntityManager", entity: Entity) -> None:
+        """
+        이미 생성된 적 엔티티에 이 객체를 연결합니다.
+        
+        다른 경로로 생성된 엔티티(예: 스포너 시스템)에도 타입별 행동 메서드를
+        사용할 수 있도록 합니다.
+        """
+        self._entity = entity
+        self._entity_manager = entity_manager
+    
     def _calculate_spawn_position(self) -> tuple[float, float]:
         """화면 가장자리에서 랜덤한 스폰 위치 계산"""
         
@@ -138,18 +145,15 @@ class Enemy(ABC):
         entity_manager.add_component(entity_id, health_component)
     
     def _add_enemy_component(self, entity_manager: "EntityManager", entity_id: int) -> None:
-        """적 컴포넌트 추가"""
+        """적 컴포넌트 추가 (타입별 매개변수는 ENEMY_PARAMS 테이블을 참조)"""
         enemy_component = EnemyComponent(enemy_type=self.enemy_type)
-        
-        # 각 적 타입별 고유 데이터 추가
-        ai_behavior = self.get_specific_ai_behavior()
-        attack_pattern = self.get_attack_pattern_data()
-        
-        enemy_component.type_specific_data.update(ai_behavior)
-        enemy_component.type_specific_data.update(attack_pattern)
-        
         entity_manager.add_component(entity_id, enemy_component)
     
+    def _add_knockback_component(self, entity_manager: "EntityManager", entity_id: int) -> None:
+        """넉백 컴포넌트 추가 (타입별 질량)"""
+        knockback_component = KnockbackComponent(mass=self.enemy_type.knockback_mass)
+        entity_manager.add_component(entity_id, knockback_component)
+    
     def take_damage(self, damage: int) -> bool:
         """
         적이 피해를 받습니다.
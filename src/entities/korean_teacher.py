@@ -27,52 +27,6 @@ class KoreanTeacher(Enemy):
     def __init__(self):
         super().__init__(EnemyType.KOREAN_TEACHER)
     
-    def get_specific_ai_behavior(self) -> dict[str, float]:
-        """국어선생님 전용 AI 행동 파라미터"""
-        
-        # AI-DEV : 국어선생님 AI 튜닝을 위한 매개변수화
-        # - 문제: 하드코딩된 값들은 게임 밸런스 조정 시 코드 수정 필요
-        # - 해결책: 설정 가능한 매개변수로 분리하여 런타임 조정 가능
-        # - 주의사항: 매개변수명은 다른 적 타입과 충돌하지 않도록 접두사 사용
-        
-        return {
-            # 이동 관련 매개변수  
-            "kt_approach_speed": 100.0,           # 접근 속도 (픽셀/프레임)
-            "kt_min_attack_distance": 600.0,     # 최소 공격 거리 (픽셀)
-            "kt_max_attack_distance": 1000.0,    # 최대 공격 거리 (픽셀)  
-            "kt_optimal_distance": 800.0,        # 최적 공격 거리 (픽셀)
-            
-            # 상태 전환 관련
-            "kt_attack_preparation_time": 1.5,  # 공격 준비 시간 (초)
-            "kt_post_attack_cooldown": 2.0,     # 공격 후 쿨다운 (초)
-            "kt_chase_timeout": 5.0,            # 추적 포기 시간 (초)
-            
-            # AI 판단 관련
-            "kt_player_proximity_threshold": 1200.0,  # 플레이어 감지 거리 (픽셀)
-            "kt_retreat_threshold": 400.0,            # 후퇴 판단 거리 (픽셀)
-        }
-    
-    def get_attack_pattern_data(self) -> dict[str, float]:
-        """국어선생님 전용 공격 패턴 데이터"""
-        return {
-            # 공격 범위 및 형태
-            "kt_attack_angle": 90.0,            # 공격 각도 (도) - 부채꼴
-            "kt_attack_range": 80.0,            # 공격 범위 (픽셀)
-            "kt_attack_damage": 15,             # 공격 데미지
-            
-            # 부채꼴 공격 세부 설정
-            "kt_fan_segments": 5,               # 부채꼴 분할 수 (더 정밀한 공격)
-            "kt_attack_duration": 0.5,          # 공격 지속 시간 (초)
-            
-            # 시각적 효과 관련
-            "kt_charge_visual_scale": 1.2,      # 공격 준비 시 크기 배율
-            "kt_attack_visual_flash": 0.3,      # 공격 시 번쩍임 효과 (초)
-            
-            # 공격 빈도 제한
-            "kt_attack_cooldown_time": 3.0,     # 공격 간 최소 간격 (초)
-            "kt_consecutive_attack_limit": 2,   # 연속 공격 최대 횟수
-        }
-    
     def calculate_optimal_position(self, player_x: float, player_y: float) -> tuple[float, float]:
         """
         플레이어 위치를 기반으로 최적 공격 위치 계산
@@ -102,7 +56,7 @@ class KoreanTeacher(Enemy):
         if not enemy_comp:
             optimal_distance = 80.0  # 기본값
         else:
-            optimal_distance = enemy_comp.type_specific_data.get("kt_optimal_distance", 80.0)
+            optimal_distance = enemy_comp.params.optimal_distance
         
         # 최적 거리만큼 떨어진 위치 계산
         import math
@@ -123,8 +77,8 @@ class KoreanTeacher(Enemy):
         if not enemy_comp:
             return False
         
-        min_distance = enemy_comp.type_specific_data.get("kt_min_attack_distance", 60.0)
-        max_distance = enemy_comp.type_specific_data.get("kt_max_attack_distance", 100.0)
+        min_distance = enemy_comp.params.min_attack_distance
+        max_distance = enemy_comp.params.max_attack_distance
         
         return min_distance <= distance <= max_distance
     
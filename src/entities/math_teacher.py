@@ -1,6 +1,8 @@
 import math as math_module
 from components.enums import EnemyType, EnemyState
 from components.enemy_component import EnemyComponent
+from components.motion_history_component import MotionHistoryComponent
+from components.player_component import PlayerComponent
 from .enemy import Enemy
 
 # AI-NOTE : 2025-01-13 수학선생님 캐릭터 구현
@@ -29,58 +31,6 @@ class MathTeacher(Enemy):
     def __init__(self):
         super().__init__(EnemyType.MATH_TEACHER)
     
-    def get_specific_ai_behavior(self) -> dict[str, float]:
-        """수학선생님 전용 AI 행동 파라미터"""
-        
-        # AI-DEV : 수학선생님 돌진 AI 튜닝을 위한 매개변수화
-        # - 문제: 돌진 공격의 속도와 거리 조절이 게임 밸런스에 크게 영향
-        # - 해결책: 세밀한 튜닝이 가능한 매개변수 분리로 런타임 조정 가능
-        # - 주의사항: 돌진 속도가 너무 빠르면 플레이어가 회피 불가능
-        
-        return {
-            # 기본 이동 관련
-            "mt_normal_speed": 4.0,             # 일반 이동 속도 (픽셀/프레임)
-            "mt_approach_distance": 150.0,       # 돌진 준비 거리 (픽셀)
-            "mt_optimal_dash_distance": 120.0,   # 최적 돌진 시작 거리 (픽셀)
-            
-            # 돌진 공격 관련
-            "mt_dash_speed_multiplier": 3.0,     # 돌진 시 속도 배수
-            "mt_dash_preparation_time": 0.5,     # 돌진 준비 시간 (초)
-            "mt_dash_duration": 1.0,             # 돌진 지속 시간 (초)
-            "mt_dash_cooldown": 3.0,             # 돌진 후 쿨다운 (초)
-            
-            # 상태 전환 관련
-            "mt_stunned_duration": 0.3,          # 돌진 종료 후 기절 시간 (초)
-            "mt_retreat_speed_multiplier": 0.7,  # 쿨다운 중 이동 속도 배수
-            
-            # AI 판단 관련
-            "mt_player_detection_range": 200.0,  # 플레이어 감지 거리 (픽셀)
-            "mt_dash_min_distance": 80.0,        # 돌진 최소 거리 (픽셀)
-            "mt_dash_max_distance": 180.0,       # 돌진 최대 거리 (픽셀)
-        }
-    
-    def get_attack_pattern_data(self) -> dict[str, float]:
-        """수학선생님 전용 공격 패턴 데이터"""
-        return {
-            # 돌진 공격 데미지 및 효과
-            "mt_dash_damage": 10,               # 돌진 공격 데미지
-            "mt_collision_width": 25.0,         # 돌진 충돌 판정 폭 (픽셀)
-            "mt_collision_height": 25.0,        # 돌진 충돌 판정 높이 (픽셀)
-            
-            # 돌진 궤적 및 정확도
-            "mt_dash_accuracy": 0.95,           # 돌진 정확도 (1.0 = 100% 정확)
-            "mt_trajectory_deviation": 5.0,     # 궤적 편차 (도)
-            
-            # 시각적 효과
-            "mt_dash_trail_duration": 0.8,      # 돌진 궤적 표시 시간 (초)
-            "mt_preparation_scale": 1.1,        # 돌진 준비 시 크기 배율
-            "mt_dash_scale": 1.3,               # 돌진 중 크기 배율
-            
-            # 연속 공격 제한
-            "mt_max_consecutive_dashes": 3,     # 최대 연속 돌진 횟수
-            "mt_forced_cooldown_after": 3,     # N회 돌진 후 강제 쿨다운
-        }
-    
     def calculate_dash_target(self, player_x: float, player_y: float) -> tuple[float, float]:
         """
         플레이어 위치를 예측하여 돌진 타겟 좌표 계산
@@ -105,8 +55,8 @@ class MathTeacher(Enemy):
             return (player_x, player_y)
         
         # 돌진 정확도 가져오기 (플레이어 예측 강도)
-        accuracy = enemy_comp.type_specific_data.get("mt_dash_accuracy", 0.95)
-        deviation = enemy_comp.type_specific_data.get("mt_trajectory_deviation", 5.0)
+        accuracy = enemy_comp.params.dash_accuracy
+        deviation = enemy_comp.params.trajectory_deviation
         
         # 기본적으로는 현재 플레이어 위치를 타겟으로 설정
         target_x, target_y = player_x, player_y
@@ -116,31 +66,33 @@ class MathTeacher(Enemy):
         # - 해결책: 플레이어의 이동 패턴을 간단히 예측하여 선행 타격
         # - 주의사항: 예측이 너무 정확하면 플레이어 불만, 너무 부정확하면 AI가 바보같음
         
-        if accuracy > 0.5:  # 예측 수행 최소 임계값
-            # 플레이어와의 거리 계산
+        history = self._get_player_motion_history()
+        if accuracy > 0.5 and history is not None:  # 예측 수행 최소 임계값
+            # 돌진이 플레이어에게 닿기까지의 시간만큼 앞을 겨냥 (돌진 지속 시간 이내)
             distance = self.get_distance_to_target(player_x, player_y)
-            dash_time = enemy_comp.type_specific_data.get("mt_dash_duration", 1.0)
-            
-            # 돌진에 걸리는 시간 동안 플레이어가 이동할 거리 추정
-            # (간단한 추정: 플레이어가 계속 같은 방향으로 이동한다고 가정)
-            estimated_player_speed = 5.0  # 플레이어 평균 속도 추정
-            predicted_distance = estimated_player_speed * dash_time * accuracy
-            
-            # 현재 플레이어가 이동하고 있는 방향 추정 (단순화)
-            # 실제로는 이전 프레임들의 위치를 저장해서 속도 벡터를 계산해야 함
-            angle = self.get_angle_to_target(player_x, player_y)
-            
-            # 약간의 랜덤 편차 추가 (AI가 너무 완벽하지 않게)
+            dash_time = enemy_comp.params.dash_duration
+            dash_speed = self.enemy_type.base_speed * enemy_comp.params.dash_speed_multiplier
+            lead_time = min(distance / dash_speed, dash_time) * accuracy
+
+            # 기록된 플레이어 속도로 선행 위치를 계산하고 약간의 편차를 줌 (AI가 너무 완벽하지 않게)
             import random
             angle_deviation = math_module.radians(random.uniform(-deviation, deviation))
-            adjusted_angle = angle + angle_deviation
-            
-            # 예측 위치 계산
-            target_x = player_x + math_module.cos(adjusted_angle) * predicted_distance
-            target_y = player_y + math_module.sin(adjusted_angle) * predicted_distance
+            lead_x = history.velocity_x * lead_time
+            lead_y = history.velocity_y * lead_time
+            cos_a = math_module.cos(angle_deviation)
+            sin_a = math_module.sin(angle_deviation)
+            target_x = player_x + lead_x * cos_a - lead_y * sin_a
+            target_y = player_y + lead_x * sin_a + lead_y * cos_a
         
         return (target_x, target_y)
     
+    def _get_player_motion_history(self) -> MotionHistoryComponent | None:
+        """플레이어의 이동 기록 컴포넌트 반환 (없으면 None)"""
+        players = self._entity_manager.get_entities_with_components(PlayerComponent, MotionHistoryComponent)
+        if not players:
+            return None
+        return self._entity_manager.get_component(players[0].id, MotionHistoryComponent)
+    
     def is_in_dash_range(self, player_x: float, player_y: float) -> bool:
         """플레이어가 돌진 공격 범위 내에 있는지 확인"""
         distance = self.get_distance_to_target(player_x, player_y)
@@ -152,8 +104,8 @@ class MathTeacher(Enemy):
         if not enemy_comp:
             return False
         
-        min_distance = enemy_comp.type_specific_data.get("mt_dash_min_distance", 80.0)
-        max_distance = enemy_comp.type_specific_data.get("mt_dash_max_distance", 180.0)
+        min_distance = enemy_comp.params.dash_min_distance
+        max_distance = enemy_comp.params.dash_max_distance
         
         return min_distance <= distance <= max_distance
     
@@ -204,7 +156,7 @@ class MathTeacher(Enemy):
         
         # 돌진 속도 적용
         base_speed = self.enemy_type.base_speed
-        dash_multiplier = enemy_comp.type_specific_data.get("mt_dash_speed_multiplier", 3.0)
+        dash_multiplier = enemy_comp.params.dash_speed_multiplier
         dash_speed = base_speed * dash_multiplier
         
         return (norm_dx * dash_speed, norm_dy * dash_speed)
@@ -0,0 +1,74 @@
+from typing import TYPE_CHECKING
+
+import pygame
+
+from core.entity import Entity
+from components.obstacle_component import ObstacleComponent
+from components.position_component import PositionComponent
+from components.sprite_component import SpriteComponent
+from components.enums import ObstacleType
+
+if TYPE_CHECKING:
+    from core.entity_manager import EntityManager
+
+# AI-NOTE : 2026-10-19 교실 장애물 배치 팩토리
+# - 이유: 레벨 로드 시 정적 충돌체를 한 번에 배치하고 BVH를 구성해야 함
+# - 요구사항: 플레이어 시작 위치(화면 중앙)와 적 스폰 경로를 막지 않는 배치
+# - 히스토리: 빈 800x600 맵 -> 책상/사물함/기둥 배치
+
+# 화면 크기 대비 비율 좌표 (타입, x 비율, y 비율)
+CLASSROOM_LAYOUT: list[tuple[ObstacleType, float, float]] = [
+    (ObstacleType.LOCKER, 0.35, 0.07),
+    (ObstacleType.LOCKER, 0.45, 0.07),
+    (ObstacleType.LOCKER, 0.55, 0.07),
+    (ObstacleType.LOCKER, 0.65, 0.07),
+    (ObstacleType.DESK, 0.25, 0.30),
+    (ObstacleType.DESK, 0.75, 0.30),
+    (ObstacleType.DESK, 0.25, 0.70),
+    (ObstacleType.DESK, 0.75, 0.70),
+    (ObstacleType.PILLAR, 0.15, 0.50),
+    (ObstacleType.PILLAR, 0.85, 0.50),
+]
+
+
+def create_obstacle(entity_manager: "EntityManager", obstacle_type: ObstacleType, x: float, y: float) -> Entity:
+    """
+    정적 장애물 엔티티를 생성합니다.
+
+    Args:
+        entity_manager: 엔티티를 관리할 EntityManager 인스턴스
+        obstacle_type: 장애물 종류
+        x: 장애물 중심 X 좌표
+        y: 장애물 중심 Y 좌표
+
+    Returns:
+        생성된 Entity 인스턴스
+    """
+    width, height = obstacle_type.size
+    entity = entity_manager.create_entity()
+    entity_manager.add_component(entity.id, PositionComponent(x=x, y=y))
+    entity_manager.add_component(entity.id, ObstacleComponent(obstacle_type=obstacle_type, width=width, height=height))
+
+    surface = pygame.Surface((width, height))
+    surface.fill(obstacle_type.color)
+    rect = surface.get_rect(center=(x, y))
+    entity_manager.add_component(entity.id, SpriteComponent(surface=surface, rect=rect))
+    return entity
+
+
+def create_classroom_layout(entity_manager: "EntityManager", screen_width: int, screen_height: int) -> list[Entity]:
+    """
+    교실 기본 장애물 배치를 생성합니다.
+
+    Args:
+        entity_manager: 엔티티를 관리할 EntityManager 인스턴스
+        screen_width: 화면 너비
+        screen_height: 화면 높이
+
+    Returns:
+        생성된 장애물 Entity 목록
+    """
+    return [
+        create_obstacle(entity_manager, obstacle_type, screen_width * x_ratio, screen_height * y_ratio)
+        for obstacle_type, x_ratio, y_ratio in CLASSROOM_LAYOUT
+    ]
@@ -32,6 +32,23 @@ class BossAttackPattern(IntEnum):
     def display_name(self) -> str:
         return ["원형탄막", "추적미사일", "순간이동공격", "레이저빔", "졸병소환"][self.value]
 
+# 페이즈 경계 체력 비율: 초과하면 이전 페이즈 유지
+_PHASE_2_THRESHOLD = 0.7
+_PHASE_3_THRESHOLD = 0.3
+
+# BossPhase 값으로 인덱싱 (0번은 사용하지 않음)
+_PHASE_PATTERNS: tuple[tuple[BossAttackPattern, ...], ...] = (
+    (),
+    (BossAttackPattern.CIRCULAR_BULLETS, BossAttackPattern.HOMING_MISSILES),
+    (BossAttackPattern.CIRCULAR_BULLETS, BossAttackPattern.HOMING_MISSILES,
+     BossAttackPattern.TELEPORT_STRIKE, BossAttackPattern.LASER_BEAM),
+    (BossAttackPattern.CIRCULAR_BULLETS, BossAttackPattern.HOMING_MISSILES,
+     BossAttackPattern.TELEPORT_STRIKE, BossAttackPattern.LASER_BEAM,
+     BossAttackPattern.SUMMON_MINIONS),
+)
+# 페이즈 2는 20%, 페이즈 3은 40% 빨라짐
+_PHASE_COOLDOWN_MULTIPLIERS = (1.0, 1.0, 0.8, 0.6)
+
 class PrincipalBoss(Enemy):
     """
     교장선생님 보스 캐릭터 클래스
@@ -63,107 +80,63 @@ class PrincipalBoss(Enemy):
         super().__init__(EnemyType.PRINCIPAL)
         self._current_phase = BossPhase.PHASE_1
         self._last_pattern_times: dict[BossAttackPattern, float] = {}
-        self._pattern_queue: list[BossAttackPattern] = []
+        self._pattern_queue: list[BossAttackPattern] = list(_PHASE_PATTERNS[BossPhase.PHASE_1])
+        self._pattern_cooldowns = self._build_pattern_cooldowns(BossPhase.PHASE_1)
+        self._last_health_regen = 0.0
     
-    def get_specific_ai_behavior(self) -> dict[str, float]:
-        """교장선생님 전용 AI 행동 파라미터"""
-        
-        # AI-DEV : 보스 AI 복잡도 관리를 위한 상태머신 기반 매개변수화
-        # - 문제: 여러 공격 패턴과 페이즈가 복합적으로 작용하여 코드 복잡도 증가
-        # - 해결책: 페이즈별, 패턴별로 독립적인 매개변수 관리로 튜닝 용이성 확보
-        # - 주의사항: 매개변수가 많아질수록 밸런싱 난이도 상승, 체계적 관리 필요
-        
-        return {
-            # 기본 행동 매개변수
-            "pb_base_speed": 3.0,               # 기본 이동 속도
-            "pb_phase_transition_delay": 2.0,   # 페이즈 전환 시 지연 시간 (초)
-            "pb_invulnerable_during_special": 1.0,  # 특수 공격 중 무적 시간 (초)
-            
-            # 페이즈별 속도 배율
-            "pb_phase1_speed_mult": 1.0,        # 페이즈 1 속도 배율
-            "pb_phase2_speed_mult": 1.2,        # 페이즈 2 속도 배율  
-            "pb_phase3_speed_mult": 1.5,        # 페이즈 3 속도 배율
-            
-            # 이동 패턴 관련
-            "pb_orbit_radius": 200.0,           # 플레이어 주위 궤도 반지름
-            "pb_orbit_speed": 0.5,              # 궤도 회전 속도 (rad/sec)
-            "pb_random_movement_range": 100.0,  # 랜덤 이동 범위
-            
-            # 공격 준비 관련
-            "pb_attack_telegraph_time": 1.0,    # 공격 예고 시간 (초)
-            "pb_attack_recovery_time": 0.8,     # 공격 후 회복 시간 (초)
-            
-            # 페이즈 3 특수 능력
-            "pb_health_regen_interval": 10.0,   # 체력 회복 간격 (초)
-            "pb_health_regen_percent": 0.05,    # 체력 회복 비율 (5%)
-        }
-    
-    def get_attack_pattern_data(self) -> dict[str, float]:
-        """교장선생님 전용 공격 패턴 데이터"""
-        return {
-            # 원형 탄막 패턴
-            "pb_circular_cooldown": 3.0,        # 원형 탄막 쿨다운 (초)
-            "pb_circular_bullet_count": 12,     # 원형 탄막 총알 수
-            "pb_circular_bullet_speed": 8.0,    # 원형 탄막 속도
-            "pb_circular_damage": 15,           # 원형 탄막 데미지
-            
-            # 추적 미사일 패턴  
-            "pb_homing_cooldown": 5.0,          # 추적 미사일 쿨다운 (초)
-            "pb_homing_missile_count": 3,       # 추적 미사일 수
-            "pb_homing_speed": 6.0,             # 추적 미사일 속도
-            "pb_homing_turn_rate": 2.0,         # 추적 미사일 회전율 (rad/sec)
-            "pb_homing_damage": 20,             # 추적 미사일 데미지
-            
-            # 순간이동 공격 패턴
-            "pb_teleport_cooldown": 4.0,        # 순간이동 쿨다운 (초)
-            "pb_teleport_range": 300.0,         # 순간이동 범위 (픽셀)
-            "pb_teleport_attack_radius": 50.0,  # 순간이동 공격 범위 (픽셀)
-            "pb_teleport_damage": 30,           # 순간이동 공격 데미지
-            
-            # 레이저 빔 패턴
-            "pb_laser_cooldown": 6.0,           # 레이저 빔 쿨다운 (초)
-            "pb_laser_charge_time": 2.0,        # 레이저 충전 시간 (초)
-            "pb_laser_duration": 1.5,           # 레이저 지속 시간 (초)
-            "pb_laser_width": 20.0,             # 레이저 폭 (픽셀)
-            "pb_laser_damage_per_sec": 40,      # 레이저 초당 데미지
-            
-            # 졸병 소환 패턴
-            "pb_summon_cooldown": 8.0,          # 졸병 소환 쿨다운 (초)  
-            "pb_summon_count": 2,               # 한 번에 소환할 졸병 수
-            "pb_summon_range": 150.0,           # 소환 범위 (픽셀)
-            "pb_minion_health": 20,             # 소환된 졸병 체력
-        }
+    # AI-NOTE : 2026-10-19 체력 변화 이벤트 기반 페이즈 전환
+    # - 이유: 페이즈/쿨다운을 물을 때마다 HealthComponent 조회, 나눗셈, 딕셔너리 생성 발생
+    # - 요구사항: 체력이 바뀔 때만 70%/30% 경계 통과 여부를 판단하고 페이즈별 쿨다운은 캐시
+    # - 히스토리: get_current_phase 폴링 -> on_health_changed(GameEvent.HEALTH_CHANGED 구독)
+    @staticmethod
+    def phase_for_health(current: float, maximum: float) -> BossPhase:
+        """체력 비율에 해당하는 페이즈 반환"""
+        if maximum <= 0:
+            return BossPhase.PHASE_1
+        health_percentage = current / maximum
+        if health_percentage > _PHASE_2_THRESHOLD:
+            return BossPhase.PHASE_1
+        elif health_percentage > _PHASE_3_THRESHOLD:
+            return BossPhase.PHASE_2
+        else:
+            return BossPhase.PHASE_3
     
     def get_current_phase(self) -> BossPhase:
-        """현재 보스 페이즈 반환"""
+        """현재 보스 페이즈 반환 (체력 변화 시 갱신된 캐시 값)"""
+        return self._current_phase
+    
+    def on_health_changed(self, current: float, maximum: float) -> bool:
+        """체력 변화 이벤트 처리, 페이즈가 바뀌었으면 True 반환"""
+        new_phase = self.phase_for_health(current, maximum)
+        if new_phase == self._current_phase:
+            return False
+        self._current_phase = new_phase
+        self._on_phase_change(new_phase)
+        return True
+    
+    def update_phase(self) -> bool:
+        """HealthComponent에서 페이즈를 다시 계산 (등록 시 초기 동기화용) 및 변경 여부 반환"""
         if not self._entity_manager or not self._entity:
-            return BossPhase.PHASE_1
+            return False
         
         from components.health_component import HealthComponent
         health_comp = self._entity_manager.get_component(self._entity.id, HealthComponent)
         if not health_comp:
-            return BossPhase.PHASE_1
-        
-        health_percentage = health_comp.current / health_comp.maximum
-        
-        if health_percentage > 0.7:
-            return BossPhase.PHASE_1
-        elif health_percentage > 0.3:
-            return BossPhase.PHASE_2
-        else:
-            return BossPhase.PHASE_3
+            return False
+        return self.on_health_changed(health_comp.current, health_comp.maximum)
     
-    def update_phase(self) -> bool:
-        """페이즈 업데이트 및 변경 여부 반환"""
-        new_phase = self.get_current_phase()
-        if new_phase != self._current_phase:
-            self._current_phase = new_phase
-            self._on_phase_change(new_phase)
-            return True
-        return False
+    def take_damage(self, damage: int) -> bool:
+        """피해 후 페이즈 경계 통과 여부도 반영"""
+        died = super().take_damage(damage)
+        self.update_phase()
+        return died
     
     def _on_phase_change(self, new_phase: BossPhase) -> None:
         """페이즈 변경 시 호출되는 이벤트 처리"""
+        # 패턴 목록과 쿨다운은 페이즈가 바뀔 때만 다시 계산
+        self._update_available_patterns(new_phase)
+        self._pattern_cooldowns = self._build_pattern_cooldowns(new_phase)
+        
         if not self._entity_manager or not self._entity:
             return
         
@@ -171,40 +144,12 @@ class PrincipalBoss(Enemy):
         if not enemy_comp:
             return
         
-        # 페이즈 데이터 업데이트
-        enemy_comp.type_specific_data["phase"] = new_phase.value
-        
         # 페이즈 전환 시 일시적 무적 상태
-        enemy_comp.state_timer = enemy_comp.type_specific_data.get("pb_phase_transition_delay", 2.0)
-        
-        # 패턴 큐 초기화
-        self._pattern_queue.clear()
-        self._update_available_patterns(new_phase)
+        enemy_comp.state_timer = enemy_comp.params.phase_transition_delay
         
     def _update_available_patterns(self, phase: BossPhase) -> None:
         """페이즈에 따른 사용 가능한 공격 패턴 업데이트"""
-        self._pattern_queue.clear()
-        
-        if phase == BossPhase.PHASE_1:
-            self._pattern_queue.extend([
-                BossAttackPattern.CIRCULAR_BULLETS,
-                BossAttackPattern.HOMING_MISSILES
-            ])
-        elif phase == BossPhase.PHASE_2:
-            self._pattern_queue.extend([
-                BossAttackPattern.CIRCULAR_BULLETS,
-                BossAttackPattern.HOMING_MISSILES,
-                BossAttackPattern.TELEPORT_STRIKE,
-                BossAttackPattern.LASER_BEAM
-            ])
-        else:  # PHASE_3
-            self._pattern_queue.extend([
-                BossAttackPattern.CIRCULAR_BULLETS,
-                BossAttackPattern.HOMING_MISSILES,
-                BossAttackPattern.TELEPORT_STRIKE,
-                BossAttackPattern.LASER_BEAM,
-                BossAttackPattern.SUMMON_MINIONS
-            ])
+        self._pattern_queue[:] = _PHASE_PATTERNS[phase]
     
     def get_next_attack_pattern(self, current_time: float) -> BossAttackPattern | None:
         """다음 공격 패턴 결정"""
@@ -245,35 +190,26 @@ class PrincipalBoss(Enemy):
         
         return selected_pattern
     
+    def reset_pattern_timers(self, current_time: float) -> None:
+        """모든 패턴의 마지막 사용 시각을 현재로 설정 (등장 직후 모든 패턴이 연달아 나가지 않도록)"""
+        for pattern in BossAttackPattern:
+            self._last_pattern_times[pattern] = current_time
+    
     def _get_pattern_cooldown(self, pattern: BossAttackPattern) -> float:
-        """패턴별 쿨다운 시간 반환"""
-        if not self._entity_manager or not self._entity:
-            return 1.0
-        
-        enemy_comp = self._entity_manager.get_component(self._entity.id, EnemyComponent)
-        if not enemy_comp:
-            return 1.0
-        
-        cooldown_map = {
-            BossAttackPattern.CIRCULAR_BULLETS: "pb_circular_cooldown",
-            BossAttackPattern.HOMING_MISSILES: "pb_homing_cooldown", 
-            BossAttackPattern.TELEPORT_STRIKE: "pb_teleport_cooldown",
-            BossAttackPattern.LASER_BEAM: "pb_laser_cooldown",
-            BossAttackPattern.SUMMON_MINIONS: "pb_summon_cooldown"
-        }
-        
-        key = cooldown_map.get(pattern, "pb_circular_cooldown")
-        base_cooldown = enemy_comp.type_specific_data.get(key, 3.0)
-        
-        # 페이즈에 따른 쿨다운 배율 적용
-        phase_multipliers = {
-            BossPhase.PHASE_1: 1.0,
-            BossPhase.PHASE_2: 0.8,  # 20% 빨라짐
-            BossPhase.PHASE_3: 0.6   # 40% 빨라짐
-        }
-        
-        multiplier = phase_multipliers.get(self._current_phase, 1.0)
-        return base_cooldown * multiplier
+        """패턴별 쿨다운 시간 반환 (현재 페이즈 배율이 적용된 캐시 값)"""
+        return self._pattern_cooldowns[pattern]
+    
+    def _build_pattern_cooldowns(self, phase: BossPhase) -> tuple[float, ...]:
+        """BossAttackPattern 값으로 인덱싱되는 페이즈별 쿨다운 튜플 생성"""
+        params = self.params
+        multiplier = _PHASE_COOLDOWN_MULTIPLIERS[phase]
+        return (
+            params.circular_cooldown * multiplier,
+            params.homing_cooldown * multiplier,
+            params.teleport_cooldown * multiplier,
+            params.laser_cooldown * multiplier,
+            params.summon_cooldown * multiplier,
+        )
     
     def calculate_orbital_position(self, player_x: float, player_y: float, time: float) -> tuple[float, float]:
         """플레이어 주위 궤도 운동 위치 계산"""
@@ -284,8 +220,8 @@ class PrincipalBoss(Enemy):
         if not enemy_comp:
             return (player_x, player_y)
         
-        radius = enemy_comp.type_specific_data.get("pb_orbit_radius", 200.0)
-        orbit_speed = enemy_comp.type_specific_data.get("pb_orbit_speed", 0.5)
+        radius = enemy_comp.params.orbit_radius
+        orbit_speed = enemy_comp.params.orbit_speed
         
         # 궤도 각도 계산 (시간 기반)
         angle = time * orbit_speed
@@ -308,8 +244,8 @@ class PrincipalBoss(Enemy):
         if not enemy_comp:
             return False
         
-        last_regen_time = enemy_comp.type_specific_data.get("last_health_regen", 0.0)
-        regen_interval = enemy_comp.type_specific_data.get("pb_health_regen_interval", 10.0)
+        last_regen_time = self._last_health_regen
+        regen_interval = enemy_comp.params.health_regen_interval
         
         return current_time - last_regen_time >= regen_interval
     
@@ -325,11 +261,12 @@ class PrincipalBoss(Enemy):
         if not health_comp or not enemy_comp:
             return
         
-        regen_percent = enemy_comp.type_specific_data.get("pb_health_regen_percent", 0.05)
+        regen_percent = enemy_comp.params.health_regen_percent
         regen_amount = int(health_comp.maximum * regen_percent)
         
         health_comp.current = min(health_comp.current + regen_amount, health_comp.maximum)
-        enemy_comp.type_specific_data["last_health_regen"] = current_time
+        self._last_health_regen = current_time
+        self.on_health_changed(health_comp.current, health_comp.maximum)
     
     def __repr__(self) -> str:
         return f"PrincipalBoss(phase={self._current_phase.display_name}, entity_id={self._entity.id if self._entity else 'None'})"
\ No newline at end of file
@@ -1,6 +1,7 @@
 import pygame
 
 from core.entity_manager import EntityManager
+from core.event_bus import EventBus
 from components.player_component import PlayerComponent
 from components.position_component import PositionComponent
 from components.velocity_component import VelocityComponent
@@ -8,19 +9,33 @@ from components.health_component import HealthComponent
 from components.sprite_component import SpriteComponent
 from components.attack_component import AttackComponent
 from components.inventory_component import InventoryComponent
-from components.enums import EntityStatus, ItemID
+from components.motion_history_component import MotionHistoryComponent
+from components.enums import EnemyType, EntityStatus, ItemID
 from systems.input_system import InputSystem
 from systems.movement_system import MovementSystem
+from systems.physics_system import PymunkPhysicsSystem
 from systems.render_system import RenderSystem
 from systems.collision_system import CollisionSystem
 from systems.enemy_movement_system import EnemyMovementSystem
+from systems.enemy_ai_system import EnemyAISystem
 from systems.enemy_spawner_system import EnemySpawnerSystem
 from systems.player_attack_system import PlayerAttackSystem
 from systems.player_level_system import PlayerLevelSystem
 from systems.item_system import ItemSystem
 from systems.trap_system import TrapSystem
+from systems.obstacle_system import ObstacleSystem
+from systems.motion_history_system import MotionHistorySystem
+from systems.boss_pattern_system import BossPatternSystem
+from systems.homing_missile_system import HomingMissileSystem
+from systems.cone_attack_system import ConeAttackSystem
+from systems.knockback_system import KnockbackSystem
 from entities.weapons import SoccerBall, Basketball, BaseballBat
-from entities.abilities import SoccerShoes, BasketballShoes, RedGinseng, Milk
+from entities.abilities import SoccerShoes, BasketballShoes, RedGinseng, Milk, Magnet
+from entities.obstacles import create_classroom_layout
+from utils.occupancy_grid import OccupancyGrid
+from utils.flow_field import FlowField
+from utils.lod import LODSchedule
+from utils.bullet_pool import BulletPool
 
 def main():
     pygame.init()
@@ -32,21 +47,44 @@ def main():
 
     clock = pygame.time.Clock()
     FPS = 60
+    USE_PYMUNK_PHYSICS = False  # pymunk 브로드페이즈/충돌 콜백 백엔드 사용 여부
 
     # ECS setup
     entity_manager = EntityManager()
 
     # Create systems
     input_system = InputSystem()
-    movement_system = MovementSystem()
-    render_system = RenderSystem(screen)
-    collision_system = CollisionSystem(SCREEN_WIDTH, SCREEN_HEIGHT)
-    enemy_movement_system = EnemyMovementSystem()
+    physics_system = None
+    if USE_PYMUNK_PHYSICS and PymunkPhysicsSystem.is_available():
+        physics_system = PymunkPhysicsSystem()
+        movement_system = physics_system
+    else:
+        movement_system = MovementSystem()
+    occupancy_grid = OccupancyGrid()
+    bullet_pool = BulletPool()
+    event_bus = EventBus()
+    boss_pattern_system = BossPatternSystem(bullet_pool, SCREEN_WIDTH, SCREEN_HEIGHT, occupancy=occupancy_grid, event_bus=event_bus)
+    homing_missile_system = HomingMissileSystem(bullet_pool)
+    cone_attack_system = ConeAttackSystem(event_bus=event_bus)
+    render_system = RenderSystem(screen, bullet_pool=bullet_pool, boss_patterns=boss_pattern_system)
+    knockback_system = KnockbackSystem()
+    collision_system = CollisionSystem(SCREEN_WIDTH, SCREEN_HEIGHT, physics=physics_system, event_bus=event_bus, knockback=knockback_system)
+    flow_field = FlowField()
+    screen_rect = (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+    enemy_ai_system = EnemyAISystem(lod=LODSchedule(screen_rect=screen_rect))
+    enemy_movement_system = EnemyMovementSystem(flow_field=flow_field, lod=LODSchedule(screen_rect=screen_rect))
     enemy_spawner_system = EnemySpawnerSystem(SCREEN_WIDTH, SCREEN_HEIGHT)
     player_attack_system = PlayerAttackSystem()
     player_level_system = PlayerLevelSystem()
     item_system = ItemSystem(entity_manager)
     trap_system = TrapSystem(entity_manager, SCREEN_WIDTH, SCREEN_HEIGHT)
+    obstacle_system = ObstacleSystem()
+    motion_history_system = MotionHistorySystem()
+
+    # Load level geometry once; obstacles never move, so the BVH is built here
+    create_classroom_layout(entity_manager, SCREEN_WIDTH, SCREEN_HEIGHT)
+    obstacle_system.build(entity_manager, occupancy_grid)
+    flow_field.set_obstacles(obstacle_system.bvh.boxes, margin=15.0)
 
     # Create player entity
     player_entity = entity_manager.create_entity()
@@ -56,6 +94,7 @@ def main():
     entity_manager.add_component(player_entity.id, PlayerComponent())
     entity_manager.add_component(player_entity.id, InventoryComponent())
     entity_manager.add_component(player_entity.id, AttackComponent())
+    entity_manager.add_component(player_entity.id, MotionHistoryComponent())
     try:
         player_surface = pygame.image.load("assets/player.svg").convert_alpha()
         player_surface = pygame.transform.scale(player_surface, (50, 50))
@@ -103,6 +142,12 @@ def main():
                 elif event.key == pygame.K_7:
                     inventory.add_item(Milk())
                     print("Added Milk")
+                elif event.key == pygame.K_8:
+                    inventory.add_item(Magnet())
+                    print("Added Magnet")
+                elif event.key == pygame.K_9:
+                    boss_pattern_system.spawn_enemy(entity_manager, EnemyType.PRINCIPAL, SCREEN_WIDTH / 2, -40)
+                    print("Spawned Principal")
 
 
         # Update systems
@@ -112,9 +157,16 @@ def main():
         if i%20==1:
             game_time += delta_time
             enemy_spawner_system.update(entity_manager, delta_time, game_time)
+        enemy_ai_system.update(entity_manager, delta_time)
         enemy_movement_system.update(entity_manager, delta_time)
+        cone_attack_system.update(entity_manager, delta_time)
+        homing_missile_system.update(entity_manager, delta_time)
+        boss_pattern_system.update(entity_manager, delta_time)
         player_attack_system.update(entity_manager, delta_time)
         movement_system.update(entity_manager, delta_time)
+        knockback_system.update(entity_manager, delta_time)
+        obstacle_system.update(entity_manager, delta_time)
+        motion_history_system.update(entity_manager, delta_time)
         collision_system.update(entity_manager, delta_time)
         player_level_system.update(entity_manager, delta_time)
 
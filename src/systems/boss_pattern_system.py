@@ -0,0 +1,442 @@
+from __future__ import annotations
+import math
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pygame
+
+from core.event_bus import EventBus
+from core.system import ISystem
+from components.enemy_component import EnemyComponent
+from components.enemy_params import PrincipalBossParams
+from components.health_component import HealthComponent
+from components.player_component import PlayerComponent
+from components.position_component import PositionComponent
+from components.sprite_component import SpriteComponent
+from components.enums import BTStatus, CollisionLayer, EnemyState, EnemyType, EntityStatus, GameEvent
+from entities.enemy import Enemy
+from entities.principal_boss import BossAttackPattern, PrincipalBoss
+from utils.behavior_tree import BehaviorTree, action, compile_tree, condition, cooldown, selector, sequence
+from utils.bullet_pool import BulletPool
+from utils.occupancy_grid import OccupancyGrid
+
+if TYPE_CHECKING:
+    from core.entity_manager import EntityManager
+
+# 탄환 수명(delta_time 누적 단위)과 판정 반지름(픽셀)
+BULLET_LIFETIME = 90.0
+# 유도 미사일은 계속 따라오므로 직진탄보다 짧게 유지
+HOMING_MISSILE_LIFETIME = 40.0
+CIRCULAR_BULLET_RADIUS = 6.0
+HOMING_MISSILE_RADIUS = 8.0
+# 추적 미사일 발사 시 부채꼴 전체 각도 (도)
+HOMING_SPREAD_DEGREES = 30.0
+# 화면 밖으로 이 여백 이상 나간 탄환은 회수
+BULLET_BOUNDS_MARGIN = 50.0
+# 플레이어 스프라이트가 없을 때 사용하는 판정 반지름
+DEFAULT_PLAYER_RADIUS = 25.0
+
+_INACTIVE_STATES = (EnemyState.SPAWNING, EnemyState.DYING)
+
+
+@lru_cache(maxsize=None)
+def ring_directions(count: int) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the unit vectors of a ``count``-bullet ring, computed once per count."""
+    angles = np.arange(count) * (2.0 * math.pi / count)
+    cos_table = np.cos(angles)
+    sin_table = np.sin(angles)
+    cos_table.setflags(write=False)
+    sin_table.setflags(write=False)
+    return cos_table, sin_table
+
+
+@dataclass
+class LaserBeam:
+    """A laser that charges while locked on a direction, then fires for a duration."""
+    boss_id: int
+    dir_x: float
+    dir_y: float
+    width: float
+    damage_per_sec: float
+    charge_left: float
+    time_left: float
+    start: tuple[float, float] = (0.0, 0.0)
+    end: tuple[float, float] = (0.0, 0.0)
+    # 정수 체력에 반영하지 못한 누적 데미지
+    damage_carry: float = 0.0
+
+    @property
+    def is_charging(self) -> bool:
+        return self.charge_left > 0.0
+
+
+@dataclass
+class BossContext:
+    """The agent a boss behavior tree tick reads; reused for every boss."""
+    entity_manager: EntityManager | None = None
+    boss_id: int = 0
+    boss: PrincipalBoss | None = None
+    enemy_comp: EnemyComponent | None = None
+    player_pos: PositionComponent | None = None
+    now: float = 0.0
+
+
+@dataclass
+class PendingStrike:
+    """An area strike that lands after its telegraph time."""
+    x: float
+    y: float
+    radius: float
+    damage: int
+    time_left: float
+
+
+class BossPatternSystem(ISystem):
+    """
+    Fires the PrincipalBoss attack patterns.
+
+    Bullets live in a shared BulletPool rather than as entities: ring
+    volleys read precomputed direction tables, and the whole pool is
+    integrated and tested against the player in one vectorized pass per
+    frame. Lasers are clipped against obstacles with an OccupancyGrid
+    raycast, teleport strikes land after a telegraph, and minions are
+    spawned as regular enemies.
+
+    Each boss decides what to do with one shared, compiled behavior tree;
+    only its small per-boss memory list is stored here. Boss phases are
+    updated from HEALTH_CHANGED events on the optional EventBus rather
+    than by polling health every tick.
+    """
+
+    def __init__(
+        self,
+        bullet_pool: BulletPool,
+        screen_width: int,
+        screen_height: int,
+        occupancy: OccupancyGrid | None = None,
+        event_bus: EventBus | None = None,
+    ):
+        self.bullet_pool = bullet_pool
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.occupancy = occupancy
+        self.bounds = (
+            -BULLET_BOUNDS_MARGIN,
+            -BULLET_BOUNDS_MARGIN,
+            screen_width + BULLET_BOUNDS_MARGIN,
+            screen_height + BULLET_BOUNDS_MARGIN,
+        )
+        self.laser_length = math.hypot(screen_width, screen_height)
+        self.elapsed = 0.0
+        self.bosses: dict[int, PrincipalBoss] = {}
+        self.brains: dict[int, list] = {}
+        self.tree = self._build_tree()
+        self._context = BossContext()
+        if event_bus is not None:
+            event_bus.subscribe(GameEvent.HEALTH_CHANGED, self._on_health_changed)
+        self.lasers: list[LaserBeam] = []
+        self.strikes: list[PendingStrike] = []
+
+    def update(self, entity_manager: EntityManager, delta_time: float) -> None:
+        """Fires due patterns, advances lasers, strikes and bullets, and damages the player.
+
+        Args:
+            entity_manager: The manager for all entities and components.
+            delta_time: The time elapsed since the last frame.
+        """
+        self.elapsed += delta_time
+        self._sync_bosses(entity_manager)
+
+        player_entities = entity_manager.get_entities_with_components(PlayerComponent, PositionComponent, HealthComponent)
+        player_id = player_entities[0].id if player_entities else None
+
+        if player_id is not None:
+            player_pos = entity_manager.get_component(player_id, PositionComponent)
+            for boss_id, boss in self.bosses.items():
+                self._update_boss(entity_manager, boss_id, boss, player_pos)
+
+        self.bullet_pool.update(delta_time, self.bounds)
+        if player_id is None:
+            self.lasers.clear()
+            self.strikes.clear()
+            return
+
+        player_radius = self._player_radius(entity_manager, player_id)
+        self._update_strikes(entity_manager, player_id, player_radius, delta_time)
+        self._update_lasers(entity_manager, player_id, player_radius, delta_time)
+        self._hit_player_with_bullets(entity_manager, player_id, player_radius)
+
+    def spawn_enemy(self, entity_manager: EntityManager, enemy_type: EnemyType, x: float, y: float, health: int | None = None) -> int:
+        """Creates a typed enemy with a placeholder sprite and returns its id."""
+        enemy = Enemy.create_enemy_by_type(enemy_type)
+        entity = enemy.create_entity(entity_manager, x, y)
+        if health is not None:
+            health_comp = entity_manager.get_component(entity.id, HealthComponent)
+            health_comp.base_maximum = health_comp.current = health_comp.maximum = health
+        enemy_comp = entity_manager.get_component(entity.id, EnemyComponent)
+        enemy_comp.speed = enemy_type.base_speed
+
+        size = 60 if enemy_type == EnemyType.PRINCIPAL else 30
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        color = (160, 0, 200) if enemy_type == EnemyType.PRINCIPAL else (255, 0, 0)
+        pygame.draw.circle(surface, color, (size // 2, size // 2), size // 2)
+        entity_manager.add_component(entity.id, SpriteComponent(surface=surface, rect=surface.get_rect(center=(x, y))))
+
+        if enemy_type == EnemyType.PRINCIPAL:
+            self._register_boss(entity.id, enemy)
+        return entity.id
+
+    def _register_boss(self, boss_id: int, boss: PrincipalBoss) -> None:
+        boss.reset_pattern_timers(self.elapsed)
+        # 이후 페이즈는 체력 변화 이벤트로만 갱신
+        boss.update_phase()
+        self.bosses[boss_id] = boss
+        self.brains[boss_id] = self.tree.new_memory()
+
+    def _on_health_changed(self, entity_id: int, current: float, maximum: float) -> None:
+        boss = self.bosses.get(entity_id)
+        if boss is not None:
+            boss.on_health_changed(current, maximum)
+
+    def _sync_bosses(self, entity_manager: EntityManager) -> None:
+        # 다른 경로로 생성된 교장선생님도 패턴 객체에 연결하고, 사라진 보스는 정리
+        for boss_id in [boss_id for boss_id in self.bosses if boss_id not in entity_manager.entities]:
+            del self.bosses[boss_id]
+            del self.brains[boss_id]
+        for entity in entity_manager.get_entities_with_components(EnemyComponent, PositionComponent, HealthComponent):
+            if entity.id in self.bosses:
+                continue
+            if entity_manager.get_component(entity.id, EnemyComponent).enemy_type != EnemyType.PRINCIPAL:
+                continue
+            boss = PrincipalBoss()
+            boss.bind_entity(entity_manager, entity)
+            self._register_boss(entity.id, boss)
+
+    def _build_tree(self) -> BehaviorTree:
+        # AI-NOTE : 2026-10-19 교장선생님 행동 결정을 행동 트리로 구성
+        # - 이유: 페이즈/회복 시간/패턴 선택/체력 회복이 _update_boss 안의 분기로 흩어져 있었음
+        # - 요구사항: 트리는 한 번만 컴파일해 모든 보스가 공유, 보스별로는 메모리 리스트만 보관
+        # - 히스토리: recovery 딕셔너리 감소 로직 -> 공격 액션을 감싼 cooldown 노드
+        # - 2026-10-19 페이즈 갱신은 트리에서 빼고 HEALTH_CHANGED 이벤트로 처리
+        return compile_tree(sequence(
+            condition(self._is_active),
+            selector(
+                # 패턴 사이에는 회복 시간을 두어 쿨다운이 끝난 패턴들이 연속 프레임에 몰리지 않게 함
+                cooldown(self._recovery_time, action(self._attack)),
+                # 페이즈 3: 공격하지 않은 틱에 주기적으로 체력 회복
+                sequence(condition(self._should_regenerate), action(self._regenerate)),
+            ),
+        ))
+
+    def _update_boss(self, entity_manager: EntityManager, boss_id: int, boss: PrincipalBoss, player_pos: PositionComponent) -> None:
+        context = self._context
+        context.entity_manager = entity_manager
+        context.boss_id = boss_id
+        context.boss = boss
+        context.enemy_comp = entity_manager.get_component(boss_id, EnemyComponent)
+        context.player_pos = player_pos
+        context.now = self.elapsed
+        self.tree.tick(context, self.brains[boss_id], self.elapsed)
+
+    @staticmethod
+    def _is_active(context: BossContext) -> bool:
+        return context.enemy_comp.current_state not in _INACTIVE_STATES
+
+    @staticmethod
+    def _recovery_time(context: BossContext) -> float:
+        return context.enemy_comp.params.attack_recovery_time
+
+    @staticmethod
+    def _should_regenerate(context: BossContext) -> bool:
+        return context.boss.should_regenerate_health(context.now)
+
+    @staticmethod
+    def _regenerate(context: BossContext) -> BTStatus:
+        context.boss.regenerate_health(context.now)
+        return BTStatus.SUCCESS
+
+    def _attack(self, context: BossContext) -> BTStatus:
+        pattern = context.boss.get_next_attack_pattern(context.now)
+        if pattern is None:
+            return BTStatus.FAILURE
+
+        params = context.enemy_comp.params
+        boss_pos = context.entity_manager.get_component(context.boss_id, PositionComponent)
+        player_pos = context.player_pos
+        if pattern == BossAttackPattern.CIRCULAR_BULLETS:
+            self._fire_ring(boss_pos, params)
+        elif pattern == BossAttackPattern.HOMING_MISSILES:
+            self._fire_missiles(boss_pos, player_pos, params)
+        elif pattern == BossAttackPattern.TELEPORT_STRIKE:
+            self._teleport_strike(boss_pos, player_pos, params)
+        elif pattern == BossAttackPattern.LASER_BEAM:
+            self._charge_laser(context.boss_id, boss_pos, player_pos, params)
+        elif pattern == BossAttackPattern.SUMMON_MINIONS:
+            self._summon_minions(context.entity_manager, boss_pos, params)
+        return BTStatus.SUCCESS
+
+    def _fire_ring(self, boss_pos: PositionComponent, params: PrincipalBossParams) -> None:
+        count = params.circular_bullet_count
+        speed = params.circular_bullet_speed
+        cos_table, sin_table = ring_directions(count)
+        # 매 발사마다 고리를 무작위로 회전시켜 같은 자리에 안전지대가 생기지 않게 함
+        offset = random.uniform(0.0, 2.0 * math.pi / count)
+        cos_offset = math.cos(offset)
+        sin_offset = math.sin(offset)
+        vx = (cos_table * cos_offset - sin_table * sin_offset) * speed
+        vy = (sin_table * cos_offset + cos_table * sin_offset) * speed
+        self.bullet_pool.spawn(boss_pos.x, boss_pos.y, vx, vy, BULLET_LIFETIME, params.circular_damage, CIRCULAR_BULLET_RADIUS)
+
+    def _fire_missiles(self, boss_pos: PositionComponent, player_pos: PositionComponent, params: PrincipalBossParams) -> None:
+        count = params.homing_missile_count
+        speed = params.homing_speed
+        aim = math.atan2(player_pos.y - boss_pos.y, player_pos.x - boss_pos.x)
+        half_spread = math.radians(HOMING_SPREAD_DEGREES) / 2 if count > 1 else 0.0
+        angles = aim + np.linspace(-half_spread, half_spread, count)
+        self.bullet_pool.spawn(
+            boss_pos.x, boss_pos.y, np.cos(angles) * speed, np.sin(angles) * speed,
+            HOMING_MISSILE_LIFETIME, params.homing_damage, HOMING_MISSILE_RADIUS,
+            turn_rate=params.homing_turn_rate,
+        )
+
+    def _teleport_strike(self, boss_pos: PositionComponent, player_pos: PositionComponent, params: PrincipalBossParams) -> None:
+        # 플레이어 근처 무작위 지점으로 이동하되 순간이동 범위를 넘지 않음, 예고 후 범위 공격
+        attack_radius = params.teleport_attack_radius
+        angle = random.uniform(0.0, 2.0 * math.pi)
+        landing_x = player_pos.x + math.cos(angle) * attack_radius * 0.5
+        landing_y = player_pos.y + math.sin(angle) * attack_radius * 0.5
+        dx = landing_x - boss_pos.x
+        dy = landing_y - boss_pos.y
+        distance = math.hypot(dx, dy)
+        teleport_range = params.teleport_range
+        if distance > teleport_range:
+            landing_x = boss_pos.x + dx / distance * teleport_range
+            landing_y = boss_pos.y + dy / distance * teleport_range
+        boss_pos.x = landing_x
+        boss_pos.y = landing_y
+        self.strikes.append(PendingStrike(
+            x=landing_x,
+            y=landing_y,
+            radius=attack_radius,
+            damage=params.teleport_damage,
+            time_left=params.attack_telegraph_time,
+        ))
+
+    def _charge_laser(self, boss_id: int, boss_pos: PositionComponent, player_pos: PositionComponent, params: PrincipalBossParams) -> None:
+        # 충전 시작 시 방향을 고정해 플레이어가 예고를 보고 피할 수 있게 함
+        dx = player_pos.x - boss_pos.x
+        dy = player_pos.y - boss_pos.y
+        distance = math.hypot(dx, dy)
+        if distance == 0.0:
+            dx, dy, distance = 1.0, 0.0, 1.0
+        self.lasers.append(LaserBeam(
+            boss_id=boss_id,
+            dir_x=dx / distance,
+            dir_y=dy / distance,
+            width=params.laser_width,
+            damage_per_sec=params.laser_damage_per_sec,
+            charge_left=params.laser_charge_time,
+            time_left=params.laser_duration,
+        ))
+
+    def _summon_minions(self, entity_manager: EntityManager, boss_pos: PositionComponent, params: PrincipalBossParams) -> None:
+        summon_range = params.summon_range
+        for _ in range(params.summon_count):
+            angle = random.uniform(0.0, 2.0 * math.pi)
+            distance = random.uniform(0.5, 1.0) * summon_range
+            self.spawn_enemy(
+                entity_manager,
+                EnemyType.KOREAN_TEACHER,
+                boss_pos.x + math.cos(angle) * distance,
+                boss_pos.y + math.sin(angle) * distance,
+                health=params.minion_health,
+            )
+
+    def _update_strikes(self, entity_manager: EntityManager, player_id: int, player_radius: float, delta_time: float) -> None:
+        player_pos = entity_manager.get_component(player_id, PositionComponent)
+        remaining = []
+        for strike in self.strikes:
+            strike.time_left -= delta_time
+            if strike.time_left > 0.0:
+                remaining.append(strike)
+                continue
+            if math.hypot(player_pos.x - strike.x, player_pos.y - strike.y) <= strike.radius + player_radius:
+                self._damage_player(entity_manager, player_id, strike.damage)
+        self.strikes = remaining
+
+    def _update_lasers(self, entity_manager: EntityManager, player_id: int, player_radius: float, delta_time: float) -> None:
+        player_pos = entity_manager.get_component(player_id, PositionComponent)
+        remaining = []
+        for laser in self.lasers:
+            boss_pos = entity_manager.get_component(laser.boss_id, PositionComponent)
+            if boss_pos is None:
+                continue
+
+            length = self.laser_length
+            if self.occupancy is not None:
+                hit = self.occupancy.raycast((boss_pos.x, boss_pos.y), (laser.dir_x, laser.dir_y), length, CollisionLayer.OBSTACLE)
+                if hit is not None:
+                    length = hit.distance
+            laser.start = (boss_pos.x, boss_pos.y)
+            laser.end = (boss_pos.x + laser.dir_x * length, boss_pos.y + laser.dir_y * length)
+
+            if laser.is_charging:
+                laser.charge_left -= delta_time
+                remaining.append(laser)
+                continue
+
+            # 플레이어 중심에서 빔 선분까지의 거리로 판정
+            rel_x = player_pos.x - boss_pos.x
+            rel_y = player_pos.y - boss_pos.y
+            along = min(max(rel_x * laser.dir_x + rel_y * laser.dir_y, 0.0), length)
+            off_x = rel_x - laser.dir_x * along
+            off_y = rel_y - laser.dir_y * along
+            if math.hypot(off_x, off_y) <= laser.width / 2 + player_radius:
+                laser.damage_carry += laser.damage_per_sec * delta_time
+                damage = int(laser.damage_carry)
+                if damage:
+                    laser.damage_carry -= damage
+                    self._damage_player(entity_manager, player_id, damage, grant_invulnerability=False)
+
+            laser.time_left -= delta_time
+            if laser.time_left > 0.0:
+                remaining.append(laser)
+        self.lasers = remaining
+
+    def _hit_player_with_bullets(self, entity_manager: EntityManager, player_id: int, player_radius: float) -> None:
+        player_comp = entity_manager.get_component(player_id, PlayerComponent)
+        if player_comp.is_invulnerable:
+            return
+        player_pos = entity_manager.get_component(player_id, PositionComponent)
+        hits = self.bullet_pool.overlapping_circle(player_pos.x, player_pos.y, player_radius)
+        if not len(hits):
+            return
+        # 같은 프레임에 닿은 탄환은 모두 소모하되 충돌 무적 때문에 가장 큰 피해 한 번만 적용
+        damage = int(self.bullet_pool.damage[hits].max())
+        self.bullet_pool.release(hits)
+        self._damage_player(entity_manager, player_id, damage)
+
+    @staticmethod
+    def _player_radius(entity_manager: EntityManager, player_id: int) -> float:
+        sprite = entity_manager.get_component(player_id, SpriteComponent)
+        if sprite is None:
+            return DEFAULT_PLAYER_RADIUS
+        return min(sprite.rect.width, sprite.rect.height) / 2
+
+    @staticmethod
+    def _damage_player(entity_manager: EntityManager, player_id: int, damage: int, grant_invulnerability: bool = True) -> None:
+        # 적 접촉 피해와 같은 규칙: 무적 중에는 무시, 피해 후 충돌 무적 부여
+        player_comp = entity_manager.get_component(player_id, PlayerComponent)
+        if player_comp.is_invulnerable:
+            return
+        health = entity_manager.get_component(player_id, HealthComponent)
+        health.current -= damage
+        if health.current <= 0:
+            health.status = EntityStatus.DEAD
+        if grant_invulnerability:
+            player_comp.is_invulnerable = True
+            player_comp.invulnerability_timer = 0.0
+            player_comp.invulnerability_duration = player_comp.collision_invuln_duration
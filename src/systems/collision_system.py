@@ -1,8 +1,11 @@
 import pygame
-import math
+import numpy as np
+from typing import TYPE_CHECKING
 
 from core.system import ISystem
 from core.entity_manager import EntityManager
+from core.contact_cache import ContactCache
+from core.event_bus import EventBus
 from components.position_component import PositionComponent
 from components.health_component import HealthComponent
 from components.player_component import PlayerComponent
@@ -14,28 +17,76 @@ from components.sprite_component import SpriteComponent
 from components.projectile_component import ProjectileComponent
 from components.hitbox_component import HitboxComponent
 from components.velocity_component import VelocityComponent
-from components.enums import EntityStatus, ItemID
+from components.enums import EntityStatus, GameEvent, ItemID, PhysicsBodyType
+from utils.spatial_grid import CellHash, SpatialGrid
+
+if TYPE_CHECKING:
+    from systems.knockback_system import KnockbackSystem
+    from systems.physics_system import PymunkPhysicsSystem
 
 class CollisionSystem(ISystem):
-    def __init__(self, screen_width: int, screen_height: int):
+    # 끌려오는 경험치 구슬의 이동 속도 (플레이어 기본 속도 5.0보다 빠르게)
+    ORB_PULL_SPEED = 12.0
+    # 무기 적중 1회당 적에게 주는 충격량 (질량 1, 감쇠 4 기준 약 15px 밀림)
+    KNOCKBACK_IMPULSE = 60.0
+
+    def __init__(
+        self,
+        screen_width: int,
+        screen_height: int,
+        physics: "PymunkPhysicsSystem | None" = None,
+        event_bus: EventBus | None = None,
+        knockback: "KnockbackSystem | None" = None,
+    ):
         self.screen_width = screen_width
         self.screen_height = screen_height
+        # pymunk 백엔드가 주어지면 브로드페이즈를 pymunk 충돌 콜백 결과로 대체
+        self.physics = physics
+        # 적 체력이 바뀌면 HEALTH_CHANGED 발행 (보스 페이즈 전환 등)
+        self.event_bus = event_bus
+        # 넉백 시스템이 주어지면 무기 적중 시 충격량을 쌓아 두고 이동은 그 시스템이 일괄 처리
+        self.knockback = knockback
+
+        # AI-NOTE : 2026-10-19 프레임 간 접촉 캐시 기반 무기 충돌 처리
+        # - 이유: 0.3초 적 무적 타이머로 중복 데미지를 막는 방식은 모든 적에
+        #   매 프레임 타이머 갱신 비용이 들고, 다른 무기의 타격까지 막음
+        # - 요구사항: 투사체/히트박스가 접촉 1회당 정확히 1번만 데미지
+        # - 히스토리: enemy_comp.is_invulnerable 판정 -> on_enter 이벤트 처리
+        # - 2026-10-19 접촉 이벤트와 별개로 공격원(투사체/히트박스)마다 적중한 적
+        #   ID 집합을 유지하여 반사/재진입 시에도 같은 공격이 같은 적을 두 번 때리지 않음
+        self.projectile_contacts = ContactCache()
+        self.projectile_contacts.on_enter(self._on_projectile_enter)
+        self.hitbox_contacts = ContactCache()
+        self.hitbox_contacts.on_enter(self._on_hitbox_enter)
+
+        self.enemy_grid = SpatialGrid()
+
+        # AI-NOTE : 2026-10-19 경험치 구슬 자석 수집 도입
+        # - 이유: 매 프레임 모든 구슬을 순회하고 정확히 겹쳐야만 수집되어
+        #   화면에 구슬이 수백 개씩 쌓임
+        # - 요구사항: 획득 반경 안의 구슬만 공간 인덱스로 찾아 끌어당긴 뒤 접촉 시 수집
+        # - 히스토리: 전체 구슬 colliderect 순회 -> CellHash 반경 쿼리 + 끌려오는 구슬 집합
+        self.orb_index = CellHash()
+        self.attracted_orbs: dict[int, None] = {}
+
+        self._entity_manager: EntityManager | None = None
+        self._enemies_to_destroy: set[int] = set()
 
     def update(self, entity_manager: EntityManager, delta_time: float) -> None:
         # AI-NOTE : 2025-01-05 충돌 무적 타이머를 가장 먼저 업데이트
         # - 이유: 충돌 처리 전에 무적 상태를 먼저 업데이트하여 정확한 무적 판정
         # - 요구사항: 매 프레임 무적 타이머 업데이트로 정확한 무적 시간 관리
         self.update_invulnerability_timers(entity_manager, delta_time)
+        self._rebuild_enemy_grid(entity_manager)
         self.handle_player_enemy_collisions(entity_manager)
         self.handle_weapon_enemy_collisions(entity_manager)
         self.handle_player_item_collisions(entity_manager)
         self.handle_hitbox_enemy_collisions(entity_manager)
         self.update_hitboxes(entity_manager, delta_time)
-        self.handle_projectile_wall_collisions(entity_manager)
+        self.handle_projectile_wall_collisions(entity_manager, delta_time)
 
     def handle_player_enemy_collisions(self, entity_manager: EntityManager):
         player_entities = entity_manager.get_entities_with_components(PlayerComponent, SpriteComponent, HealthComponent)
-        enemy_entities = entity_manager.get_entities_with_components(EnemyComponent, SpriteComponent, HealthComponent)
 
         if not player_entities: return
         player_entity = player_entities[0]
@@ -45,132 +96,166 @@ class CollisionSystem(ISystem):
 
         if player_comp.is_invulnerable: return
 
-        for enemy_entity in enemy_entities:
-            enemy_sprite = entity_manager.get_component(enemy_entity.id, SpriteComponent)
-            enemy_comp = entity_manager.get_component(enemy_entity.id, EnemyComponent)
-
-            # AI-NOTE : 2025-01-05 충돌 시 양측 무적 판정 추가
-            # - 이유: 적도 무적 상태일 때는 플레이어에게 데미지를 주지 않음
-            # - 요구사항: 연속 충돌로 인한 즉사 방지
-            if player_sprite.rect.colliderect(enemy_sprite.rect):
-                if not enemy_comp.is_invulnerable:  # 적도 무적이 아닐 때만 데미지 발생
-                    player_health.current -= 10 # Simple damage for now
-                    if player_health.current <= 0:
-                        player_health.status = EntityStatus.DEAD
-
-                    # AI-NOTE : 2025-01-05 충돌 후 무적 시간 부여
-                    # - 이유: 플레이어와 적 모두 짧은 무적 시간을 부여하여
-                    #   연속 데미지 방지
-                    # - 요구사항: 플레이어 충돌 무적 0.5초, 적 0.3초 무적
-                    # AI-DEV : 기존 무적 시간을 보존하면서 충돌 무적 적용
-                    # - 문제: timer를 0.0으로 리셋하면 농구화 같은
-                    #   다른 무적 시스템 진행 상태 파괴
-                    # - 해결책: 이미 무적 중이면 더 긴 무적을 유지,
-                    #   무적이 아닐 때만 충돌 무적 적용
-                    if not player_comp.is_invulnerable:
-                        player_comp.is_invulnerable = True
-                        player_comp.invulnerability_timer = 0.0
-                        player_comp.invulnerability_duration = (
-                            player_comp.collision_invuln_duration
-                        )
-
-                    enemy_comp.is_invulnerable = True
-                    enemy_comp.invulnerability_timer = 0.0
+        if self.physics is not None:
+            touching_enemy_ids = [enemy_id for player_id, enemy_id in self.physics.touching_pairs(PhysicsBodyType.PLAYER, PhysicsBodyType.ENEMY) if player_id == player_entity.id]
+        else:
+            enemy_entities = entity_manager.get_entities_with_components(EnemyComponent, SpriteComponent, HealthComponent)
+            touching_enemy_ids = [
+                enemy_entity.id for enemy_entity in enemy_entities
+                if player_sprite.rect.colliderect(entity_manager.get_component(enemy_entity.id, SpriteComponent).rect)
+            ]
+
+        for enemy_id in touching_enemy_ids:
+            if not entity_manager.has_component(enemy_id, EnemyComponent): continue
+
+            player_health.current -= 10 # Simple damage for now
+            if player_health.current <= 0:
+                player_health.status = EntityStatus.DEAD
+
+            # AI-NOTE : 2025-01-05 충돌 후 무적 시간 부여
+            # - 이유: 플레이어에게 짧은 무적 시간을 부여하여 연속 데미지 방지
+            # - 요구사항: 플레이어 충돌 무적
+            # - 히스토리: 2026-10-19 적 측 무적 판정 제거, 같은 프레임에 닿은 적은 각각 데미지
+            # AI-DEV : 기존 무적 시간을 보존하면서 충돌 무적 적용
+            # - 문제: timer를 0.0으로 리셋하면 농구화 같은
+            #   다른 무적 시스템 진행 상태 파괴
+            # - 해결책: 이미 무적 중이면 더 긴 무적을 유지,
+            #   무적이 아닐 때만 충돌 무적 적용
+            if not player_comp.is_invulnerable:
+                player_comp.is_invulnerable = True
+                player_comp.invulnerability_timer = 0.0
+                player_comp.invulnerability_duration = (
+                    player_comp.collision_invuln_duration
+                )
 
     def handle_weapon_enemy_collisions(self, entity_manager: EntityManager):
-        projectile_entities = entity_manager.get_entities_with_components(ProjectileComponent, SpriteComponent, AttackComponent)
-        enemy_entities = entity_manager.get_entities_with_components(EnemyComponent, SpriteComponent, HealthComponent)
-        enemies_to_destroy = set()
-
-        for proj_entity in projectile_entities:
-            proj_sprite = entity_manager.get_component(proj_entity.id, SpriteComponent)
+        self._entity_manager = entity_manager
+        self._enemies_to_destroy = set()
+
+        self.projectile_contacts.begin_frame()
+        # AI-NOTE : 2026-10-19 투사체 연속 충돌 판정(CCD) 도입
+        # - 이유: 낮은 시뮬레이션 주기나 프레임 드랍 시 빠른 공이 30px 적을 통과
+        # - 요구사항: 직전 위치~현재 위치 이동 선분에 대한 원 스윕 판정
+        # - 히스토리: 현재 위치 colliderect 이산 판정 -> 스윕 선분 판정
+        # - 2026-10-19 시작점을 pos - vel * dt로 역산하면 벽/장애물 반사로 속도가
+        #   뒤집힌 프레임에 반대편을 스윕하므로, MovementSystem이 기록한 이동 전 위치 사용
+        # - 2026-10-19 pymunk 센서 접촉은 스텝 끝 겹침만 보므로 투사체는 백엔드와 관계없이 스윕
+        for proj_entity in entity_manager.get_entities_with_components(ProjectileComponent, PositionComponent, VelocityComponent, SpriteComponent, AttackComponent):
+            pos = entity_manager.get_component(proj_entity.id, PositionComponent)
             proj_comp = entity_manager.get_component(proj_entity.id, ProjectileComponent)
-            attack_comp = entity_manager.get_component(proj_entity.id, AttackComponent)
-
-            for enemy_entity in enemy_entities:
-                if enemy_entity.id in enemies_to_destroy: continue
-                enemy_sprite = entity_manager.get_component(enemy_entity.id, SpriteComponent)
-                enemy_comp = entity_manager.get_component(enemy_entity.id, EnemyComponent)
-
-                if proj_sprite.rect.colliderect(enemy_sprite.rect):
-                    # AI-NOTE : 2025-01-05 무기 충돌 시 무적 판정 추가
-                    # - 이유: 무적 상태인 적은 데미지를 받지 않아 프레임 단위 중복 데미지 방지
-                    # - 요구사항: 적이 무적이 아닐 때만 데미지 적용
-                    if not enemy_comp.is_invulnerable:
-                        enemy_health = entity_manager.get_component(enemy_entity.id, HealthComponent)
-                        enemy_health.current -= attack_comp.damage
-
-                        # AI-NOTE : 2025-01-05 데미지 후 적 무적 활성화
-                        # - 이유: 투사체가 여러 프레임에 걸쳐 접촉해도 한 번만 데미지
-                        # - 요구사항: 0.3초 무적 시간 부여
-                        enemy_comp.is_invulnerable = True
-                        enemy_comp.invulnerability_timer = 0.0
-
-                        if enemy_health.current <= 0:
-                            enemies_to_destroy.add(enemy_entity.id)
-
-                    if proj_comp.pierce > 0:
-                        proj_comp.pierce -= 1
-                    elif proj_comp.bounces > 0:
-                        proj_comp.bounces -= 1
-                        vel = entity_manager.get_component(proj_entity.id, VelocityComponent)
-                        vel.dx *= -1
-                        vel.dy *= -1
-                    else:
-                        entity_manager.destroy_entity(proj_entity.id)
-                        break # Projectile is destroyed, move to next projectile
-
-        self.destroy_enemies_and_drop_exp(entity_manager, enemies_to_destroy)
+            proj_sprite = entity_manager.get_component(proj_entity.id, SpriteComponent)
+
+            # 아직 한 번도 이동하지 않은 투사체는 현재 위치만 판정
+            start_x = pos.x if proj_comp.prev_x is None else proj_comp.prev_x
+            start_y = pos.y if proj_comp.prev_y is None else proj_comp.prev_y
+            radius = max(proj_sprite.rect.width, proj_sprite.rect.height) / 2
+            # 이동 경로상 먼저 닿는 적부터 접촉을 기록하여 비관통 투사체는 첫 적에서 소멸
+            hit_indices = self.enemy_grid.query_segment_indices(start_x, start_y, pos.x, pos.y, radius)
+            for enemy_id in self.enemy_grid.ids[hit_indices].tolist():
+                self.projectile_contacts.add_contact(proj_entity.id, enemy_id)
+
+        # AI-DEV : 데미지와 관통/반사 처리는 on_enter 이벤트에서만 수행
+        # - 문제: 겹쳐 있는 동안 매 프레임 관통 횟수가 차감되고 데미지가 반복됨
+        # - 해결책: 새로 접촉한 쌍에만 반응하고, 유지 중인 접촉은 무시
+        self.projectile_contacts.end_frame()
+
+        self.destroy_enemies_and_drop_exp(entity_manager, self._enemies_to_destroy)
+
+    def _on_projectile_enter(self, proj_id: int, enemy_id: int) -> None:
+        entity_manager = self._entity_manager
+        if enemy_id in self._enemies_to_destroy: return
+        proj_comp = entity_manager.get_component(proj_id, ProjectileComponent)
+        attack_comp = entity_manager.get_component(proj_id, AttackComponent)
+        if not proj_comp or not attack_comp: return # Projectile was already destroyed this frame
+        if enemy_id in proj_comp.hit_enemies: return
+        proj_comp.hit_enemies.add(enemy_id)
+
+        enemy_health = entity_manager.get_component(enemy_id, HealthComponent)
+        if not enemy_health: return
+        enemy_health.current -= attack_comp.damage
+        self._publish_health_changed(enemy_id, enemy_health)
+        if enemy_health.current <= 0:
+            self._enemies_to_destroy.add(enemy_id)
+        elif self.knockback is not None:
+            # 반사로 방향이 바뀌기 전, 투사체가 날아온 방향으로 밀어냄
+            vel = entity_manager.get_component(proj_id, VelocityComponent)
+            if vel is not None:
+                self.knockback.add_impulse(enemy_id, vel.dx, vel.dy, self.KNOCKBACK_IMPULSE)
+
+        if proj_comp.pierce > 0:
+            proj_comp.pierce -= 1
+        elif proj_comp.bounces > 0:
+            proj_comp.bounces -= 1
+            vel = entity_manager.get_component(proj_id, VelocityComponent)
+            vel.dx *= -1
+            vel.dy *= -1
+        else:
+            entity_manager.destroy_entity(proj_id)
+
+    def _publish_health_changed(self, entity_id: int, health: HealthComponent) -> None:
+        if self.event_bus is not None:
+            self.event_bus.publish(GameEvent.HEALTH_CHANGED, entity_id, health.current, health.maximum)
 
     def handle_hitbox_enemy_collisions(self, entity_manager: EntityManager):
         hitbox_entities = entity_manager.get_entities_with_components(HitboxComponent, AttackComponent)
-        enemy_entities = entity_manager.get_entities_with_components(EnemyComponent, SpriteComponent, HealthComponent)
-        enemies_to_destroy = set()
+        self._entity_manager = entity_manager
+        self._enemies_to_destroy = set()
+
+        self.hitbox_contacts.begin_frame()
 
         for hitbox_entity in hitbox_entities:
             hitbox = entity_manager.get_component(hitbox_entity.id, HitboxComponent)
-            attack = entity_manager.get_component(hitbox_entity.id, AttackComponent)
             pos = entity_manager.get_component(hitbox_entity.id, PositionComponent)
 
-            hitbox_angle_rad = math.radians(hitbox.angle)
-
-            for enemy_entity in enemy_entities:
-                if enemy_entity.id in enemies_to_destroy: continue
-
-                enemy_pos = entity_manager.get_component(enemy_entity.id, PositionComponent)
-                enemy_comp = entity_manager.get_component(enemy_entity.id, EnemyComponent)
-
-                # 1. Distance Check
-                distance_sq = (enemy_pos.x - pos.x)**2 + (enemy_pos.y - pos.y)**2
-                if distance_sq > hitbox.width**2: # hitbox.width is used as radius
-                    continue
-
-                # 2. Angle Check
-                enemy_angle_rad = math.atan2(enemy_pos.y - pos.y, enemy_pos.x - pos.x)
-
-                angle_diff = enemy_angle_rad - hitbox_angle_rad
-                angle_diff = (angle_diff + math.pi) % (2 * math.pi) - math.pi
-
-                arc_angle_rad = math.radians(hitbox.height) # hitbox.height is used as arc angle
-
-                if abs(angle_diff) <= arc_angle_rad / 2:
-                    # AI-NOTE : 2025-01-05 Hitbox 충돌 시 무적 판정 추가
-                    # - 이유: 야구방망이 같은 근접 공격도 프레임 단위 중복 데미지 방지
-                    # - 요구사항: 적이 무적 상태가 아닐 때만 데미지 적용
-                    if not enemy_comp.is_invulnerable:
-                        enemy_health = entity_manager.get_component(enemy_entity.id, HealthComponent)
-                        enemy_health.current -= attack.damage
-
-                        # AI-NOTE : 2025-01-05 Hitbox 데미지 후 적 무적 활성화
-                        # - 이유: 야구방망이 스윙이 여러 프레임 동안 지속되어도 한 번만 데미지
-                        # - 요구사항: 0.3초 무적 시간 부여
-                        enemy_comp.is_invulnerable = True
-                        enemy_comp.invulnerability_timer = 0.0
-
-                        if enemy_health.current <= 0:
-                            enemies_to_destroy.add(enemy_entity.id)
-
-        self.destroy_enemies_and_drop_exp(entity_manager, enemies_to_destroy)
+            # AI-NOTE : 2026-10-19 공간 격자 기반 부채꼴 쿼리로 교체
+            # - 이유: 히트박스가 5초 동안 유지되며 매 프레임 모든 적에 atan2 계산
+            # - 요구사항: 원의 바운딩 박스와 겹치는 셀만 조사 후 내적으로 각도 판정
+            # - 히스토리: 적 전체 순회 + atan2 각도 비교 -> entities_in_sector
+            # hitbox.width is used as radius, hitbox.height as arc angle
+            for enemy_id in self.enemy_grid.entities_in_sector((pos.x, pos.y), hitbox.width, hitbox.angle, hitbox.height).tolist():
+                self.hitbox_contacts.add_contact(hitbox_entity.id, enemy_id)
+
+        # AI-NOTE : 2026-10-19 야구방망이 스윙은 접촉 1회당 1번만 데미지
+        # - 이유: 히트박스가 여러 프레임 유지되어도 같은 적을 반복 타격하지 않음
+        # - 요구사항: 부채꼴을 벗어났다가 다시 들어와도 hit_enemies로 재타격 방지
+        self.hitbox_contacts.end_frame()
+
+        self.destroy_enemies_and_drop_exp(entity_manager, self._enemies_to_destroy)
+
+    def _rebuild_enemy_grid(self, entity_manager: EntityManager) -> None:
+        enemy_ids = []
+        xs = []
+        ys = []
+        radii = []
+        for enemy_entity in entity_manager.get_entities_with_components(EnemyComponent, PositionComponent, SpriteComponent, HealthComponent):
+            enemy_pos = entity_manager.get_component(enemy_entity.id, PositionComponent)
+            enemy_sprite = entity_manager.get_component(enemy_entity.id, SpriteComponent)
+            enemy_ids.append(enemy_entity.id)
+            xs.append(enemy_pos.x)
+            ys.append(enemy_pos.y)
+            radii.append(max(enemy_sprite.rect.width, enemy_sprite.rect.height) / 2)
+        self.enemy_grid.rebuild(enemy_ids, xs, ys, radii)
+
+    def _on_hitbox_enter(self, hitbox_id: int, enemy_id: int) -> None:
+        entity_manager = self._entity_manager
+        if enemy_id in self._enemies_to_destroy: return
+        hitbox = entity_manager.get_component(hitbox_id, HitboxComponent)
+        attack = entity_manager.get_component(hitbox_id, AttackComponent)
+        enemy_health = entity_manager.get_component(enemy_id, HealthComponent)
+        if not hitbox or not attack or not enemy_health: return
+        if enemy_id in hitbox.hit_enemies: return
+        hitbox.hit_enemies.add(enemy_id)
+
+        enemy_health.current -= attack.damage
+        self._publish_health_changed(enemy_id, enemy_health)
+        if enemy_health.current <= 0:
+            self._enemies_to_destroy.add(enemy_id)
+        elif self.knockback is not None:
+            # 스윙 중심(히트박스 위치)에서 바깥쪽으로 밀어냄
+            hitbox_pos = entity_manager.get_component(hitbox_id, PositionComponent)
+            enemy_pos = entity_manager.get_component(enemy_id, PositionComponent)
+            if hitbox_pos is not None and enemy_pos is not None:
+                self.knockback.add_impulse(enemy_id, enemy_pos.x - hitbox_pos.x, enemy_pos.y - hitbox_pos.y, self.KNOCKBACK_IMPULSE)
 
     def update_hitboxes(self, entity_manager: EntityManager, delta_time: float):
         for entity in entity_manager.get_entities_with_components(HitboxComponent):
@@ -180,41 +265,115 @@ class CollisionSystem(ISystem):
                 entity_manager.destroy_entity(entity.id)
 
     def handle_player_item_collisions(self, entity_manager: EntityManager):
-        player_entities = entity_manager.get_entities_with_components(PlayerComponent, SpriteComponent)
-        item_entities = entity_manager.get_entities_with_components(ItemComponent, SpriteComponent)
+        player_entities = entity_manager.get_entities_with_components(PlayerComponent, PositionComponent, SpriteComponent)
 
         if not player_entities: return
         player_entity = player_entities[0]
+        player_pos = entity_manager.get_component(player_entity.id, PositionComponent)
         player_sprite = entity_manager.get_component(player_entity.id, SpriteComponent)
         player_comp = entity_manager.get_component(player_entity.id, PlayerComponent)
 
-        for item_entity in item_entities:
-            item_sprite = entity_manager.get_component(item_entity.id, SpriteComponent)
-            if player_sprite.rect.colliderect(item_sprite.rect):
-                if entity_manager.has_component(item_entity.id, ExperienceComponent):
-                    exp_comp = entity_manager.get_component(item_entity.id, ExperienceComponent)
+        # 획득 반경에 들어온 구슬은 정적 인덱스에서 빼고 끌려오는 구슬로 전환
+        for orb_id in self.orb_index.query_radius(player_pos.x, player_pos.y, player_comp.pickup_radius):
+            self.orb_index.remove(orb_id)
+            if orb_id in entity_manager.entities:
+                entity_manager.add_component(orb_id, VelocityComponent(dx=0, dy=0))
+                self.attracted_orbs[orb_id] = None
+
+        if not self.attracted_orbs: return
+
+        orb_ids = [orb_id for orb_id in self.attracted_orbs if orb_id in entity_manager.entities]
+        orb_positions = [entity_manager.get_component(orb_id, PositionComponent) for orb_id in orb_ids]
+        orb_velocities = [entity_manager.get_component(orb_id, VelocityComponent) for orb_id in orb_ids]
+
+        # AI-DEV : 끌려오는 구슬의 방향/거리를 한 번의 배열 연산으로 계산
+        # - 문제: 구슬마다 sqrt와 정규화를 반복하면 대량 드랍 시 비용 증가
+        # - 해결책: 좌표를 배열로 모아 거리와 속도를 일괄 계산 후 컴포넌트에 기록
+        # - 주의사항: 구슬 속도는 MovementSystem이 다음 프레임에 적분함
+        dx = player_pos.x - np.fromiter((pos.x for pos in orb_positions), dtype=np.float64, count=len(orb_ids))
+        dy = player_pos.y - np.fromiter((pos.y for pos in orb_positions), dtype=np.float64, count=len(orb_ids))
+        distance = np.sqrt(dx * dx + dy * dy)
+        contact_distance = max(player_sprite.rect.width, player_sprite.rect.height) / 2
+        collected = distance <= contact_distance
+        if self.physics is not None:
+            touching = {item_id for player_id, item_id in self.physics.touching_pairs(PhysicsBodyType.PLAYER, PhysicsBodyType.ITEM) if player_id == player_entity.id}
+            collected |= np.fromiter((orb_id in touching for orb_id in orb_ids), dtype=bool, count=len(orb_ids))
+        scale = self.ORB_PULL_SPEED / np.maximum(distance, 1e-6)
+        pull_x = (dx * scale).tolist()
+        pull_y = (dy * scale).tolist()
+
+        self.attracted_orbs = {}
+        for index, orb_id in enumerate(orb_ids):
+            if collected[index]:
+                exp_comp = entity_manager.get_component(orb_id, ExperienceComponent)
+                if exp_comp:
                     player_comp.experience += exp_comp.amount
                     player_comp.total_experience += exp_comp.amount
-                    entity_manager.destroy_entity(item_entity.id)
-
-    def handle_projectile_wall_collisions(self, entity_manager: EntityManager):
+                entity_manager.destroy_entity(orb_id)
+            else:
+                orb_velocities[index].dx = pull_x[index]
+                orb_velocities[index].dy = pull_y[index]
+                self.attracted_orbs[orb_id] = None
+
+    def handle_projectile_wall_collisions(self, entity_manager: EntityManager, delta_time: float = 0.0):
+        proj_ids = []
+        positions: list[PositionComponent] = []
+        velocities: list[VelocityComponent] = []
+        projectiles: list[ProjectileComponent] = []
         for entity in entity_manager.get_entities_with_components(ProjectileComponent, PositionComponent, VelocityComponent):
-            pos = entity_manager.get_component(entity.id, PositionComponent)
-            vel = entity_manager.get_component(entity.id, VelocityComponent)
-            proj = entity_manager.get_component(entity.id, ProjectileComponent)
-
-            if pos.x < 0 or pos.x > self.screen_width:
-                if proj.bounces > 0:
-                    proj.bounces -= 1
-                    vel.dx *= -1
-                else:
-                    entity_manager.destroy_entity(entity.id)
-            elif pos.y < 0 or pos.y > self.screen_height:
-                if proj.bounces > 0:
-                    proj.bounces -= 1
-                    vel.dy *= -1
-                else:
-                    entity_manager.destroy_entity(entity.id)
+            proj_ids.append(entity.id)
+            positions.append(entity_manager.get_component(entity.id, PositionComponent))
+            velocities.append(entity_manager.get_component(entity.id, VelocityComponent))
+            projectiles.append(entity_manager.get_component(entity.id, ProjectileComponent))
+        if not proj_ids: return
+
+        # AI-NOTE : 2026-10-19 화면 경계 반사와 수명 만료를 한 번의 배열 연산으로 처리
+        # - 이유: 투사체마다 파이썬 분기를 타고, 화면 안에서 튕기는 투사체는 사라지지 않음
+        # - 요구사항: 경계 반사/소멸 + 최대 수명/사거리 초과 시 소멸
+        # - 히스토리: 엔티티별 if/elif 경계 검사 -> numpy 마스크 연산
+        count = len(proj_ids)
+        x = np.fromiter((pos.x for pos in positions), dtype=np.float64, count=count)
+        y = np.fromiter((pos.y for pos in positions), dtype=np.float64, count=count)
+        dx = np.fromiter((vel.dx for vel in velocities), dtype=np.float64, count=count)
+        dy = np.fromiter((vel.dy for vel in velocities), dtype=np.float64, count=count)
+        bounces = np.fromiter((proj.bounces for proj in projectiles), dtype=np.int64, count=count)
+        lifetime = np.fromiter((proj.lifetime for proj in projectiles), dtype=np.float64, count=count) + delta_time
+        max_lifetime = np.fromiter((proj.max_lifetime for proj in projectiles), dtype=np.float64, count=count)
+        distance = np.fromiter((proj.distance_traveled for proj in projectiles), dtype=np.float64, count=count) + np.hypot(dx, dy) * delta_time
+        max_distance = np.fromiter((proj.max_distance for proj in projectiles), dtype=np.float64, count=count)
+
+        # 기존 규칙과 같이 x축 이탈을 우선 처리하고, y축은 x축이 안쪽일 때만 처리
+        out_x = (x < 0) | (x > self.screen_width)
+        out_y = ~out_x & ((y < 0) | (y > self.screen_height))
+        can_bounce = bounces > 0
+        reflect_x = out_x & can_bounce
+        reflect_y = out_y & can_bounce
+        expired = ((max_lifetime > 0) & (lifetime >= max_lifetime)) | ((max_distance > 0) & (distance >= max_distance))
+        destroy = ((out_x | out_y) & ~can_bounce) | expired
+
+        # 반사된 투사체는 화면 안으로 되돌려 다음 프레임에 다시 반사되지 않게 함
+        new_x = np.where(reflect_x, np.clip(x, 0, self.screen_width), x)
+        new_y = np.where(reflect_y, np.clip(y, 0, self.screen_height), y)
+        new_dx = np.where(reflect_x, -dx, dx)
+        new_dy = np.where(reflect_y, -dy, dy)
+        new_bounces = bounces - (reflect_x | reflect_y)
+
+        lifetime_list = lifetime.tolist()
+        distance_list = distance.tolist()
+        for index in range(count):
+            proj = projectiles[index]
+            proj.lifetime = lifetime_list[index]
+            proj.distance_traveled = distance_list[index]
+
+        for index in np.flatnonzero((reflect_x | reflect_y) & ~destroy).tolist():
+            positions[index].x = float(new_x[index])
+            positions[index].y = float(new_y[index])
+            velocities[index].dx = float(new_dx[index])
+            velocities[index].dy = float(new_dy[index])
+            projectiles[index].bounces = int(new_bounces[index])
+
+        for index in np.flatnonzero(destroy).tolist():
+            entity_manager.destroy_entity(proj_ids[index])
 
     def destroy_enemies_and_drop_exp(self, entity_manager: EntityManager, enemy_ids: set[int]):
         for enemy_id in enemy_ids:
@@ -234,15 +393,17 @@ class CollisionSystem(ISystem):
         pygame.draw.circle(orb_surface, (255, 255, 0), (5, 5), 5)
         orb_rect = orb_surface.get_rect(center=(x, y))
         entity_manager.add_component(orb_entity.id, SpriteComponent(surface=orb_surface, rect=orb_rect))
+        self.orb_index.insert(orb_entity.id, x, y)
 
     # AI-NOTE : 2025-01-05 충돌 무적 타이머 업데이트 시스템
-    # - 이유: 플레이어와 적의 무적 상태를 시간에 따라 자동으로 해제
-    # - 요구사항: 플레이어(충돌/아이템 무적), 적(0.3초 무적) 시간 관리
-    # - 히스토리: 하드코딩된 0.5초/0.6초 -> duration 필드 기반으로 변경
+    # - 이유: 플레이어의 무적 상태를 시간에 따라 자동으로 해제
+    # - 요구사항: 플레이어(충돌/아이템) 무적 시간 관리
+    # - 히스토리: 하드코딩된 0.5초/0.6초 -> duration 필드 기반으로 변경,
+    #   2026-10-19 적 0.3초 무적은 공격원별 적중 기록으로 대체되어 제거
     def update_invulnerability_timers(
         self, entity_manager: EntityManager, delta_time: float
     ) -> None:
-        """플레이어와 적의 무적 타이머를 업데이트하고 시간 경과 시 무적 해제"""
+        """플레이어의 무적 타이머를 업데이트하고 시간 경과 시 무적 해제"""
 
         # AI-DEV : 플레이어 무적 타이머 처리 (충돌 + 아이템 무적 통합)
         # - 문제: 하드코딩된 0.5초/0.6초로 인해 무적시간 변경 불가능
@@ -261,12 +422,3 @@ class CollisionSystem(ISystem):
                         player_comp.invulnerability_duration):
                     player_comp.is_invulnerable = False
                     player_comp.invulnerability_timer = 0.0
-
-        # 적 무적 타이머 처리
-        for entity in entity_manager.get_entities_with_components(EnemyComponent):
-            enemy_comp = entity_manager.get_component(entity.id, EnemyComponent)
-            if enemy_comp.is_invulnerable:
-                enemy_comp.invulnerability_timer += delta_time
-                if enemy_comp.invulnerability_timer >= enemy_comp.invulnerability_duration:
-                    enemy_comp.is_invulnerable = False
-                    enemy_comp.invulnerability_timer = 0.0
\ No newline at end of file
@@ -0,0 +1,133 @@
+from __future__ import annotations
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from core.event_bus import EventBus
+from core.system import ISystem
+from components.enemy_component import EnemyComponent
+from components.enemy_params import ENEMY_PARAMS
+from components.enums import EnemyState, EnemyType, EntityStatus, GameEvent
+from components.health_component import HealthComponent
+from components.player_component import PlayerComponent
+from components.position_component import PositionComponent
+from components.sprite_component import SpriteComponent
+
+if TYPE_CHECKING:
+    from core.entity_manager import EntityManager
+
+# 플레이어 스프라이트가 없을 때 사용하는 판정 반지름
+DEFAULT_PLAYER_RADIUS = 25.0
+
+
+class ConeAttackSystem(ISystem):
+    """
+    Resolves the KoreanTeacher cone attack.
+
+    A teacher fixes its facing vector when it starts charging (set by
+    EnemyAISystem on entering ATTACKING). Once its state timer passes
+    ``attack_preparation_time`` the strike lands: every teacher striking
+    this frame is tested against the player in one vectorized pass, using
+    a range check and a dot product against the precomputed cosine of the
+    half angle. Damage is applied and HEALTH_CHANGED is published only when
+    at least one cone hits.
+    """
+
+    def __init__(self, event_bus: EventBus | None = None):
+        params = ENEMY_PARAMS[EnemyType.KOREAN_TEACHER]
+        self.event_bus = event_bus
+        self.attack_range = params.attack_range
+        self.cos_half_angle = math.cos(math.radians(params.attack_angle) / 2)
+        self.strike_time = params.attack_preparation_time
+        self.damage = params.attack_damage
+
+    def update(self, entity_manager: EntityManager, delta_time: float) -> None:
+        """Lands the strikes of teachers whose charge finished and damages the player on a hit.
+
+        Args:
+            entity_manager: The manager for all entities and components.
+            delta_time: The time elapsed since the last frame.
+        """
+        player_entities = entity_manager.get_entities_with_components(PlayerComponent, PositionComponent, HealthComponent)
+        if not player_entities:
+            return
+        player_id = player_entities[0].id
+
+        striking: list[EnemyComponent] = []
+        xs: list[float] = []
+        ys: list[float] = []
+        for entity in entity_manager.get_entities_with_components(EnemyComponent, PositionComponent):
+            comp = entity_manager.get_component(entity.id, EnemyComponent)
+            if (
+                comp.enemy_type != EnemyType.KOREAN_TEACHER
+                or comp.current_state != EnemyState.ATTACKING
+                or comp.attack_resolved
+                or comp.state_timer < self.strike_time
+            ):
+                continue
+            pos = entity_manager.get_component(entity.id, PositionComponent)
+            striking.append(comp)
+            xs.append(pos.x)
+            ys.append(pos.y)
+        if not striking:
+            return
+
+        # 공격은 맞든 빗나가든 준비 1회당 한 번만 판정
+        for comp in striking:
+            comp.attack_resolved = True
+
+        player_pos = entity_manager.get_component(player_id, PositionComponent)
+        hits = self.cone_hits(
+            np.asarray(xs),
+            np.asarray(ys),
+            np.fromiter((comp.facing_x for comp in striking), dtype=np.float64, count=len(striking)),
+            np.fromiter((comp.facing_y for comp in striking), dtype=np.float64, count=len(striking)),
+            player_pos.x,
+            player_pos.y,
+            self.attack_range + self._player_radius(entity_manager, player_id),
+            self.cos_half_angle,
+        )
+        if hits.any():
+            self._damage_player(entity_manager, player_id)
+
+    @staticmethod
+    def cone_hits(
+        xs: np.ndarray,
+        ys: np.ndarray,
+        facing_x: np.ndarray,
+        facing_y: np.ndarray,
+        target_x: float,
+        target_y: float,
+        attack_range: float,
+        cos_half_angle: float,
+    ) -> np.ndarray:
+        """Returns a mask of the cones (apex, unit facing) that contain the target point."""
+        dx = target_x - xs
+        dy = target_y - ys
+        distance_sq = dx * dx + dy * dy
+        # 각도 비교는 atan2 대신 내적 >= cos(반각) * 거리로 판정 (제곱근 한 번만 계산)
+        in_angle = dx * facing_x + dy * facing_y >= cos_half_angle * np.sqrt(distance_sq)
+        return in_angle & (distance_sq <= attack_range * attack_range)
+
+    @staticmethod
+    def _player_radius(entity_manager: EntityManager, player_id: int) -> float:
+        sprite = entity_manager.get_component(player_id, SpriteComponent)
+        if sprite is None:
+            return DEFAULT_PLAYER_RADIUS
+        return min(sprite.rect.width, sprite.rect.height) / 2
+
+    def _damage_player(self, entity_manager: EntityManager, player_id: int) -> None:
+        # 적 접촉 피해와 같은 규칙: 무적 중에는 무시, 같은 프레임에 여러 명이 맞혀도 한 번만 적용
+        player_comp = entity_manager.get_component(player_id, PlayerComponent)
+        if player_comp.is_invulnerable:
+            return
+        health = entity_manager.get_component(player_id, HealthComponent)
+        health.current -= self.damage
+        if health.current <= 0:
+            health.status = EntityStatus.DEAD
+        player_comp.is_invulnerable = True
+        player_comp.invulnerability_timer = 0.0
+        player_comp.invulnerability_duration = player_comp.collision_invuln_duration
+        if self.event_bus is not None:
+            self.event_bus.publish(GameEvent.HEALTH_CHANGED, player_id, health.current, health.maximum)
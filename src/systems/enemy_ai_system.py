@@ -0,0 +1,274 @@
+from __future__ import annotations
+from collections.abc import Callable
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from core.system import ISystem
+from components.position_component import PositionComponent
+from components.velocity_component import VelocityComponent
+from components.enemy_component import EnemyComponent
+from components.enemy_params import ENEMY_PARAMS, EnemyParams
+from components.motion_history_component import MotionHistoryComponent
+from components.player_component import PlayerComponent
+from components.enums import EnemyType, EnemyState
+from utils.lod import LODSchedule
+
+if TYPE_CHECKING:
+    from core.entity_manager import EntityManager
+
+
+@dataclass
+class StateGroup:
+    """The enemies sharing one (EnemyType, EnemyState) pair, as arrays.
+
+    Attributes:
+        indices: Positions of the members in the frame's enemy arrays.
+        distance: Distance from each member to the player.
+        state_timer: Time each member has spent in the current state.
+        attack_cooldown: Remaining attack cooldown of each member.
+        spawn_delay: Spawn delay of each member.
+        params: Tuning parameters shared by the enemy type.
+    """
+    indices: np.ndarray
+    distance: np.ndarray
+    state_timer: np.ndarray
+    attack_cooldown: np.ndarray
+    spawn_delay: np.ndarray
+    params: EnemyParams
+
+
+@dataclass(frozen=True)
+class StateTransition:
+    """One row of the transition table.
+
+    Attributes:
+        target: The state to switch to.
+        condition: Returns a mask of the group members that take the transition.
+        cooldown_param: If set, the attack cooldown is reset to this parameter.
+    """
+    target: EnemyState
+    condition: Callable[[StateGroup], np.ndarray]
+    cooldown_param: str | None = None
+
+
+def _spawn_finished(group: StateGroup) -> np.ndarray:
+    return group.state_timer >= group.spawn_delay
+
+
+def _timer_at_least(*params: str) -> Callable[[StateGroup], np.ndarray]:
+    durations = [attrgetter(param) for param in params]
+
+    def condition(group: StateGroup) -> np.ndarray:
+        return group.state_timer >= sum(duration(group.params) for duration in durations)
+    return condition
+
+
+def _ready_within(min_param: str | None, max_param: str) -> Callable[[StateGroup], np.ndarray]:
+    min_distance = attrgetter(min_param) if min_param is not None else None
+    max_distance = attrgetter(max_param)
+
+    def condition(group: StateGroup) -> np.ndarray:
+        in_range = group.distance <= max_distance(group.params)
+        if min_distance is not None:
+            in_range &= group.distance >= min_distance(group.params)
+        return in_range & (group.attack_cooldown <= 0.0)
+    return condition
+
+
+# AI-NOTE : 2026-10-19 데이터 기반 적 상태 전이 테이블
+# - 이유: current_state/state_timer/attack_cooldown 필드를 읽는 시스템이 없어
+#   적 타입별 공격 준비 로직이 demo_game.py의 스프라이트별 update_ai에만 존재
+# - 요구사항: (적 타입, 상태)별 전이 조건을 표로 정의하고 그룹 단위로 일괄 평가
+# - 히스토리: KoreanTeacher.should_prepare_attack 등 객체별 메서드 호출 -> 배열 마스크
+#   국어선생님은 min/max_attack_distance(600~1000px)가 800x600 화면과 맞지 않아
+#   공격 범위(attack_range) 안에서 공격 준비를 시작
+TRANSITION_TABLE: dict[tuple[EnemyType, EnemyState], list[StateTransition]] = {
+    (EnemyType.KOREAN_TEACHER, EnemyState.SPAWNING): [StateTransition(EnemyState.CHASING, _spawn_finished)],
+    (EnemyType.KOREAN_TEACHER, EnemyState.CHASING): [
+        StateTransition(EnemyState.ATTACKING, _ready_within(None, "attack_range")),
+    ],
+    (EnemyType.KOREAN_TEACHER, EnemyState.ATTACKING): [
+        StateTransition(
+            EnemyState.CHASING,
+            _timer_at_least("attack_preparation_time", "attack_duration"),
+            cooldown_param="attack_cooldown_time",
+        ),
+    ],
+    (EnemyType.MATH_TEACHER, EnemyState.SPAWNING): [StateTransition(EnemyState.CHASING, _spawn_finished)],
+    (EnemyType.MATH_TEACHER, EnemyState.CHASING): [
+        StateTransition(EnemyState.ATTACKING, _ready_within("dash_min_distance", "dash_max_distance")),
+    ],
+    (EnemyType.MATH_TEACHER, EnemyState.ATTACKING): [
+        StateTransition(EnemyState.STUNNED, _timer_at_least("dash_duration")),
+    ],
+    (EnemyType.MATH_TEACHER, EnemyState.STUNNED): [
+        StateTransition(EnemyState.CHASING, _timer_at_least("stunned_duration"), cooldown_param="dash_cooldown"),
+    ],
+    (EnemyType.PRINCIPAL, EnemyState.SPAWNING): [StateTransition(EnemyState.CHASING, _spawn_finished)],
+}
+
+# 상태별 이동을 이 시스템이 직접 제어하는 상태 (EnemyMovementSystem은 건너뜀)
+AI_CONTROLLED_STATES = frozenset({EnemyState.ATTACKING, EnemyState.STUNNED, EnemyState.DYING})
+
+_STATE_COUNT = len(EnemyState)
+
+
+class EnemyAISystem(ISystem):
+    """
+    Drives EnemyState transitions for every enemy.
+
+    Enemies are grouped by (EnemyType, EnemyState) each frame and every
+    group's rows of TRANSITION_TABLE are evaluated as array masks, so the
+    cost grows with the number of groups rather than with per-enemy
+    method dispatch. The first matching row wins.
+
+    With an LODSchedule, distant and off-screen enemies are only updated on
+    their due frames, with their timers advanced by the skipped time.
+    """
+
+    def __init__(
+        self,
+        transition_table: dict[tuple[EnemyType, EnemyState], list[StateTransition]] | None = None,
+        lod: LODSchedule | None = None,
+    ):
+        self.transition_table = transition_table if transition_table is not None else TRANSITION_TABLE
+        self.lod = lod
+
+    def update(self, entity_manager: EntityManager, delta_time: float) -> None:
+        """Advances state timers and applies state transitions.
+
+        Args:
+            entity_manager: The manager for all entities and components.
+            delta_time: The time elapsed since the last frame.
+        """
+        player_entities = entity_manager.get_entities_with_components(PlayerComponent, PositionComponent)
+        if not player_entities:
+            return
+        player_pos = entity_manager.get_component(player_entities[0].id, PositionComponent)
+        player_history = entity_manager.get_component(player_entities[0].id, MotionHistoryComponent)
+
+        enemy_ids: list[int] = []
+        enemy_comps: list[EnemyComponent] = []
+        positions: list[PositionComponent] = []
+        velocities: list[VelocityComponent] = []
+        for entity in entity_manager.get_entities_with_components(EnemyComponent, PositionComponent, VelocityComponent):
+            enemy_ids.append(entity.id)
+            enemy_comps.append(entity_manager.get_component(entity.id, EnemyComponent))
+            positions.append(entity_manager.get_component(entity.id, PositionComponent))
+            velocities.append(entity_manager.get_component(entity.id, VelocityComponent))
+        if not enemy_comps:
+            return
+
+        count = len(enemy_comps)
+        pos_x = np.fromiter((pos.x for pos in positions), dtype=np.float64, count=count)
+        pos_y = np.fromiter((pos.y for pos in positions), dtype=np.float64, count=count)
+        to_player_x = player_pos.x - pos_x
+        to_player_y = player_pos.y - pos_y
+        distance = np.sqrt(to_player_x * to_player_x + to_player_y * to_player_y)
+        step = np.full(count, delta_time)
+
+        if self.lod is not None:
+            # AI-NOTE : 2026-10-19 원거리/화면 밖 적은 N프레임마다 몰아서 갱신
+            # - 이유: 화면 밖에서 걸어 들어오는 적도 플레이어 옆의 적과 같은 비용을 씀
+            # - 요구사항: 거리 구간으로 단계를 정하고, 건너뛴 시간만큼 큰 dt로 갱신
+            self.lod.advance()
+            due, interval = self.lod.schedule(np.asarray(enemy_ids), distance, pos_x, pos_y)
+            due_indices = np.flatnonzero(due)
+            if not len(due_indices):
+                return
+            enemy_comps = [enemy_comps[index] for index in due_indices.tolist()]
+            velocities = [velocities[index] for index in due_indices.tolist()]
+            to_player_x = to_player_x[due_indices]
+            to_player_y = to_player_y[due_indices]
+            distance = distance[due_indices]
+            step = delta_time * interval[due_indices]
+            count = len(due_indices)
+
+        state_timer = np.fromiter((comp.state_timer for comp in enemy_comps), dtype=np.float64, count=count) + step
+        attack_cooldown = np.maximum(np.fromiter((comp.attack_cooldown for comp in enemy_comps), dtype=np.float64, count=count) - step, 0.0)
+        spawn_delay = np.fromiter((comp.spawn_delay for comp in enemy_comps), dtype=np.float64, count=count)
+        state = np.fromiter((comp.current_state for comp in enemy_comps), dtype=np.int64, count=count)
+        enemy_type = np.fromiter((comp.enemy_type for comp in enemy_comps), dtype=np.int64, count=count)
+
+        # AI-DEV : (타입, 상태) 키 정렬로 그룹을 만들고 그룹마다 전이 조건을 한 번씩 평가
+        # - 문제: 적마다 타입별 메서드를 호출하면 적 수만큼 파이썬 디스패치 발생
+        # - 해결책: 키를 정렬해 연속 구간을 그룹으로 자르고 조건식은 배열 마스크로 계산
+        # - 주의사항: 같은 프레임에 두 번 전이하지 않도록 전이 전 상태 기준으로만 평가
+        new_state = state.copy()
+        cooldown_reset = np.full(count, np.nan)
+        group_key = enemy_type * _STATE_COUNT + state
+        order = np.argsort(group_key, kind='stable')
+        sorted_keys = group_key[order]
+        boundaries = np.flatnonzero(np.diff(sorted_keys)) + 1
+        for indices in np.split(order, boundaries):
+            key = int(group_key[indices[0]])
+            rules = self.transition_table.get((EnemyType(key // _STATE_COUNT), EnemyState(key % _STATE_COUNT)))
+            if not rules:
+                continue
+
+            group = StateGroup(
+                indices=indices,
+                distance=distance[indices],
+                state_timer=state_timer[indices],
+                attack_cooldown=attack_cooldown[indices],
+                spawn_delay=spawn_delay[indices],
+                params=ENEMY_PARAMS[key // _STATE_COUNT],
+            )
+            pending = np.ones(len(indices), dtype=bool)
+            for rule in rules:
+                taken = pending & rule.condition(group)
+                if not taken.any():
+                    continue
+                pending &= ~taken
+                new_state[indices[taken]] = rule.target
+                if rule.cooldown_param is not None:
+                    cooldown_reset[indices[taken]] = getattr(group.params, rule.cooldown_param)
+
+        changed = new_state != state
+        state_timer[changed] = 0.0
+        attack_cooldown = np.where(np.isnan(cooldown_reset), attack_cooldown, cooldown_reset)
+
+        for comp, timer, cooldown in zip(enemy_comps, state_timer.tolist(), attack_cooldown.tolist()):
+            comp.state_timer = timer
+            comp.attack_cooldown = cooldown
+
+        for index in np.flatnonzero(changed).tolist():
+            comp = enemy_comps[index]
+            comp.current_state = EnemyState(int(new_state[index]))
+            self._on_enter_state(comp, velocities[index], float(to_player_x[index]), float(to_player_y[index]), float(distance[index]), player_history)
+
+    def _on_enter_state(
+        self,
+        comp: EnemyComponent,
+        velocity: VelocityComponent,
+        to_player_x: float,
+        to_player_y: float,
+        distance: float,
+        player_history: MotionHistoryComponent | None,
+    ) -> None:
+        if comp.current_state == EnemyState.ATTACKING:
+            # 공격 방향은 준비 시작 시점의 플레이어 방향으로 고정 (준비 동안 피할 수 있음)
+            inverse = 1.0 / max(distance, 1e-9)
+            comp.facing_x = to_player_x * inverse
+            comp.facing_y = to_player_y * inverse
+            comp.attack_resolved = False
+
+        # 공격 준비(국어)와 기절 중에는 제자리, 수학선생님 공격 진입 시 돌진 속도 고정
+        if comp.current_state == EnemyState.ATTACKING and comp.enemy_type == EnemyType.MATH_TEACHER:
+            params = comp.params
+            dash_speed = comp.speed * params.dash_speed_multiplier
+            if player_history is not None:
+                # 돌진이 닿는 시간만큼 플레이어의 평활 속도로 앞을 겨냥
+                lead_time = min(distance / dash_speed, params.dash_duration) * params.dash_accuracy
+                to_player_x += player_history.velocity_x * lead_time
+                to_player_y += player_history.velocity_y * lead_time
+                distance = (to_player_x * to_player_x + to_player_y * to_player_y) ** 0.5
+            scale = dash_speed / max(distance, 1e-9)
+            velocity.dx = to_player_x * scale
+            velocity.dy = to_player_y * scale
+        elif comp.current_state in AI_CONTROLLED_STATES:
+            velocity.dx = 0.0
+            velocity.dy = 0.0
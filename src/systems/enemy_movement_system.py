@@ -1,20 +1,46 @@
 from __future__ import annotations
-import math
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from core.system import ISystem
 from components.position_component import PositionComponent
 from components.velocity_component import VelocityComponent
 from components.enemy_component import EnemyComponent
 from components.player_component import PlayerComponent
+from components.enums import MovementMode
+from systems.enemy_ai_system import AI_CONTROLLED_STATES
+from utils.spatial_grid import SpatialGrid
 
 if TYPE_CHECKING:
     from core.entity_manager import EntityManager
+    from utils.flow_field import FlowField
+    from utils.lod import LODSchedule
 
 
 class EnemyMovementSystem(ISystem):
     """Handles the movement of enemies, guiding them towards the player."""
 
+    # 이웃 적을 밀어내기 시작하는 거리 (적 스프라이트 크기 기준)
+    SEPARATION_RADIUS = 32.0
+    # 추적 속도 대비 분리 조향의 최대 비중
+    SEPARATION_WEIGHT = 1.5
+    # 흐름장 재계산 주기 (프레임)
+    FLOW_FIELD_INTERVAL = 10
+    # 군집 이동: 정렬/응집에 반영하는 이웃 반경과 추적 방향 대비 가중치
+    FLOCK_RADIUS = 96.0
+    ALIGNMENT_WEIGHT = 0.6
+    COHESION_WEIGHT = 0.4
+
+    def __init__(self, flow_field: FlowField | None = None, lod: LODSchedule | None = None):
+        self.grid = SpatialGrid(cell_size=self.SEPARATION_RADIUS)
+        self.flock_grid = SpatialGrid(cell_size=self.FLOCK_RADIUS)
+        # 흐름장이 주어지면 장애물을 돌아가는 경로로 추적, 없으면 직선 추적
+        self.flow_field = flow_field
+        # LOD 스케줄이 주어지면 원거리 적은 갱신 차례에만 조향을 다시 계산 (차례가 아닌 적은 계산에서 제외)
+        self.lod = lod
+        self._frames_since_flow_build = self.FLOW_FIELD_INTERVAL
+
     def update(self, entity_manager: EntityManager, delta_time: float) -> None:
         """Updates the velocity of all enemies to move towards the player.
 
@@ -32,29 +58,277 @@ class EnemyMovementSystem(ISystem):
         player_entity = player_entities[0]
         player_pos = entity_manager.get_component(player_entity.id, PositionComponent)
 
+        ids: list[int] = []
+        xs: list[float] = []
+        ys: list[float] = []
+        speeds: list[float] = []
+        flocking: list[bool] = []
+        velocities: list[VelocityComponent] = []
+
         # AI-DEV: This system acts on all entities that have EnemyComponent,
         # PositionComponent, and VelocityComponent.
         for entity in entity_manager.get_entities_with_components(EnemyComponent, PositionComponent, VelocityComponent):
+            enemy_comp = entity_manager.get_component(entity.id, EnemyComponent)
+            # 공격/기절/사망 중인 적의 속도는 EnemyAISystem이 결정
+            if enemy_comp.current_state in AI_CONTROLLED_STATES:
+                continue
             enemy_pos = entity_manager.get_component(entity.id, PositionComponent)
-            enemy_vel = entity_manager.get_component(entity.id, VelocityComponent)
-            enemy_stats = entity_manager.get_component(entity.id, EnemyComponent)
+            ids.append(entity.id)
+            xs.append(enemy_pos.x)
+            ys.append(enemy_pos.y)
+            speeds.append(enemy_comp.speed)
+            flocking.append(enemy_comp.movement_mode == MovementMode.FLOCK)
+            velocities.append(entity_manager.get_component(entity.id, VelocityComponent))
 
-            if not all([enemy_pos, enemy_vel, enemy_stats]):
-                continue
+        if not ids:
+            return
+        all_velocities = velocities
+
+        pos_x = np.asarray(xs, dtype=np.float64)
+        pos_y = np.asarray(ys, dtype=np.float64)
+        speed = np.asarray(speeds, dtype=np.float64)
+        flock_mask = np.asarray(flocking, dtype=bool)
+
+        if self.lod is None:
+            due_indices = np.arange(len(ids))
+        else:
+            # 갱신 차례가 아닌 적은 조향 계산 없이 직전 속도를 유지한 채 MovementSystem이 계속 이동시킴
+            self.lod.advance()
+            to_player_x = player_pos.x - pos_x
+            to_player_y = player_pos.y - pos_y
+            distance = np.sqrt(to_player_x * to_player_x + to_player_y * to_player_y)
+            due, _ = self.lod.schedule(np.asarray(ids), distance, pos_x, pos_y)
+            due_indices = np.flatnonzero(due)
+            if not len(due_indices):
+                return
+            velocities = [velocities[index] for index in due_indices.tolist()]
+
+        due_x = pos_x[due_indices]
+        due_y = pos_y[due_indices]
+        due_speed = speed[due_indices]
+        vel_x, vel_y = self.compute_seek(due_x, due_y, due_speed, player_pos.x, player_pos.y)
+        if self.flow_field is not None:
+            vel_x, vel_y = self.apply_flow_field(due_x, due_y, due_speed, vel_x, vel_y, player_pos.x, player_pos.y)
+        if flock_mask[due_indices].any():
+            # 정렬에는 이웃(차례가 아닌 적 포함)의 직전 속도가 필요하므로 전체 속도를 수집
+            prev_x = np.fromiter((velocity.dx for velocity in all_velocities), dtype=np.float64, count=len(ids))
+            prev_y = np.fromiter((velocity.dy for velocity in all_velocities), dtype=np.float64, count=len(ids))
+            vel_x, vel_y = self.apply_flocking(ids, pos_x, pos_y, prev_x, prev_y, speed, vel_x, vel_y, flock_mask, query=due_indices)
+
+        push_x, push_y = self.compute_separation(ids, pos_x, pos_y, speed, query=due_indices)
+        vel_x += push_x
+        vel_y += push_y
+
+        for velocity, new_dx, new_dy in zip(velocities, vel_x.tolist(), vel_y.tolist()):
+            velocity.dx = new_dx
+            velocity.dy = new_dy
+
+    @staticmethod
+    def compute_seek(
+        pos_x: np.ndarray,
+        pos_y: np.ndarray,
+        speed: np.ndarray,
+        target_x: float,
+        target_y: float,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Computes velocities pointing at a target at each enemy's speed.
+
+        Args:
+            pos_x: The x coordinates of the enemies.
+            pos_y: The y coordinates of the enemies.
+            speed: The movement speed of each enemy.
+            target_x: The x coordinate to seek.
+            target_y: The y coordinate to seek.
+
+        Returns:
+            The x and y velocity arrays.
+        """
+        # AI-NOTE : 2026-10-19 적 추적 조향을 배열 연산으로 일괄 처리
+        # - 이유: 적마다 sqrt/나눗셈/속성 쓰기를 반복하는 루프가 프레임당 가장 큰 비용
+        # - 요구사항: 위치/속도를 배열로 모아 방향 정규화 후 한 번에 기록
+        # - 히스토리: 엔티티별 math.sqrt + if distance > 0 분기 -> numpy 일괄 계산
+        dx = target_x - pos_x
+        dy = target_y - pos_y
+        distance = np.sqrt(dx * dx + dy * dy)
+        # 거리가 0이면 dx, dy도 0이므로 분모에 하한만 두면 분기 없이 속도 0
+        scale = speed / np.maximum(distance, 1e-9)
+        return dx * scale, dy * scale
+
+    def apply_flow_field(
+        self,
+        pos_x: np.ndarray,
+        pos_y: np.ndarray,
+        speed: np.ndarray,
+        seek_x: np.ndarray,
+        seek_y: np.ndarray,
+        target_x: float,
+        target_y: float,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Replaces direct seek velocities with flow field directions.
+
+        Enemies outside the field, in unreachable cells or already in the
+        player's cell keep their direct seek velocity.
+
+        Returns:
+            The x and y velocity arrays.
+        """
+        # AI-NOTE : 2026-10-19 흐름장 기반 장애물 회피 추적
+        # - 이유: 직선 추적은 책상/사물함에 막혀 적이 장애물 뒤에 뭉침
+        # - 요구사항: 격자 BFS는 N프레임마다 한 번, 적은 자기 셀 방향만 조회
+        # - 히스토리: 플레이어 방향 직선 추적 -> 흐름장 샘플링 + 직선 추적 대체
+        self._frames_since_flow_build += 1
+        if self._frames_since_flow_build >= self.FLOW_FIELD_INTERVAL:
+            self.flow_field.build(target_x, target_y)
+            self._frames_since_flow_build = 0
+
+        dir_x, dir_y, valid = self.flow_field.sample(pos_x, pos_y)
+        return np.where(valid, dir_x * speed, seek_x), np.where(valid, dir_y * speed, seek_y)
+
+    def apply_flocking(
+        self,
+        ids: list[int],
+        pos_x: np.ndarray,
+        pos_y: np.ndarray,
+        prev_x: np.ndarray,
+        prev_y: np.ndarray,
+        speed: np.ndarray,
+        seek_x: np.ndarray,
+        seek_y: np.ndarray,
+        flocking: np.ndarray,
+        query: np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Blends alignment and cohesion into the seek velocity of flocking enemies.
+
+        Only enemies in FLOCK mode take part, and they only see each other.
+        Alignment steers towards the mean previous velocity of the neighbours
+        within FLOCK_RADIUS and cohesion towards their centroid; separation
+        is left to ``compute_separation``, which applies to every enemy.
+
+        Args:
+            ids: The enemy entity ids.
+            pos_x: The x coordinates of the enemies.
+            pos_y: The y coordinates of the enemies.
+            prev_x: The x velocities of the enemies from the previous frame.
+            prev_y: The y velocities of the enemies from the previous frame.
+            speed: The movement speed of each enemy.
+            seek_x: The x seek velocities of the steered enemies.
+            seek_y: The y seek velocities of the steered enemies.
+            flocking: Mask of the enemies in FLOCK mode.
+            query: Optional indices of the enemies to steer, matching
+                ``seek_x``/``seek_y``; every flocking enemy is still a neighbour.
+
+        Returns:
+            The x and y velocity arrays of the steered enemies; members
+            without neighbours keep their seek velocity.
+        """
+        # AI-NOTE : 2026-10-19 보이드 방식 군집 이동 도입
+        # - 이유: 수학선생님 대규모 돌격이 각자 직진해 한 줄로 겹쳐 보임
+        # - 요구사항: 이웃 탐색은 균일 격자, 이웃 합산은 bincount로 무리 전체를 O(n) 처리
+        # - 히스토리: 분리 조향만 존재 -> 군집 모드 적에 정렬/응집 추가
+        members = np.flatnonzero(flocking)
+        if len(members) < 2:
+            return seek_x, seek_y
+        if query is None:
+            query = np.arange(len(ids))
+
+        # 조향할 적 중 군집 적의 (query 내 위치, 군집 내 위치)
+        member_slot = np.full(len(ids), -1, dtype=np.int64)
+        member_slot[members] = np.arange(len(members))
+        query_slot = member_slot[query]
+        rows = np.flatnonzero(query_slot >= 0)
+        if not len(rows):
+            return seek_x, seek_y
+        steered = query_slot[rows]
+
+        member_x = pos_x[members]
+        member_y = pos_y[members]
+        self.flock_grid.rebuild(np.asarray(ids)[members], member_x, member_y)
+        first, second = self.flock_grid.neighbor_pairs(self.FLOCK_RADIUS, query=steered)
+        if not len(first):
+            return seek_x, seek_y
+
+        count = len(members)
+        neighbors = np.bincount(first, minlength=count)[steered]
+        inverse = 1.0 / np.maximum(neighbors, 1)
+        align_x, align_y = self._unit(
+            np.bincount(first, weights=prev_x[members][second], minlength=count)[steered] * inverse,
+            np.bincount(first, weights=prev_y[members][second], minlength=count)[steered] * inverse,
+        )
+        cohesion_x, cohesion_y = self._unit(
+            np.bincount(first, weights=member_x[second], minlength=count)[steered] * inverse - member_x[steered],
+            np.bincount(first, weights=member_y[second], minlength=count)[steered] * inverse - member_y[steered],
+        )
+
+        member_speed = speed[members][steered]
+        desired_x = seek_x[rows] + member_speed * (self.ALIGNMENT_WEIGHT * align_x + self.COHESION_WEIGHT * cohesion_x)
+        desired_y = seek_y[rows] + member_speed * (self.ALIGNMENT_WEIGHT * align_y + self.COHESION_WEIGHT * cohesion_y)
+        # 조향을 더해도 무리가 빨라지지 않도록 각자의 속력으로 다시 맞춤
+        unit_x, unit_y = self._unit(desired_x, desired_y)
+        has_neighbors = neighbors > 0
+        seek_x = seek_x.copy()
+        seek_y = seek_y.copy()
+        seek_x[rows] = np.where(has_neighbors, unit_x * member_speed, seek_x[rows])
+        seek_y[rows] = np.where(has_neighbors, unit_y * member_speed, seek_y[rows])
+        return seek_x, seek_y
+
+    @staticmethod
+    def _unit(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # 길이 0인 벡터는 분모 하한으로 0 벡터 유지
+        inverse = 1.0 / np.maximum(np.sqrt(x * x + y * y), 1e-9)
+        return x * inverse, y * inverse
+
+    def compute_separation(
+        self,
+        ids: list[int],
+        pos_x: np.ndarray,
+        pos_y: np.ndarray,
+        speed: np.ndarray,
+        query: np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Computes a separation steering term that pushes crowded enemies apart.
+
+        Args:
+            ids: The enemy entity ids.
+            pos_x: The x coordinates of the enemies.
+            pos_y: The y coordinates of the enemies.
+            speed: The movement speed of each enemy.
+            query: Optional indices of the enemies to compute the push for;
+                every enemy still pushes them as a neighbour.
+
+        Returns:
+            The x and y velocity offsets of the queried enemies (all of them
+            by default), zero for enemies without neighbours.
+        """
+        if query is None:
+            query = np.arange(len(ids))
+        push_x = np.zeros(len(query), dtype=np.float64)
+        push_y = np.zeros(len(query), dtype=np.float64)
+        if len(ids) < 2 or not len(query):
+            return push_x, push_y
+
+        # AI-NOTE : 2026-10-19 적 군집 분리 조향을 공간 그리드 + 벡터 연산으로 처리
+        # - 이유: 모든 적이 플레이어에게 직진하면 한 점에 겹쳐 충돌 판정 비용이 급증
+        # - 요구사항: 반경 내 이웃 쌍만 그리드로 찾아 O(n²) 쌍 비교 없이 밀어냄
+        # - 히스토리: 가까울수록 강해지는 선형 감쇠 반발력, 추적 속도에 비례해 적용
+        self.grid.rebuild(ids, pos_x, pos_y)
+        first, second = self.grid.neighbor_pairs(self.SEPARATION_RADIUS, query=query)
+        if not len(first):
+            return push_x, push_y
+
+        dx = pos_x[first] - pos_x[second]
+        dy = pos_y[first] - pos_y[second]
+        distance = np.sqrt(dx * dx + dy * dy)
+
+        # 완전히 겹친 쌍은 방향이 없으므로 인덱스 순서로 좌우를 정해 결정적으로 분리
+        overlapped = distance == 0.0
+        dx = np.where(overlapped, np.sign(first - second).astype(np.float64), dx)
+        distance = np.where(overlapped, 1.0, distance)
+
+        strength = 1.0 - np.minimum(distance / self.SEPARATION_RADIUS, 1.0)
+        push_x = np.bincount(first, weights=dx / distance * strength, minlength=len(ids))[query]
+        push_y = np.bincount(first, weights=dy / distance * strength, minlength=len(ids))[query]
 
-            # Calculate direction vector from enemy to player
-            dx = player_pos.x - enemy_pos.x
-            dy = player_pos.y - enemy_pos.y
-
-            # Normalize the vector
-            distance = math.sqrt(dx**2 + dy**2)
-            if distance > 0:
-                normalized_dx = dx / distance
-                normalized_dy = dy / distance
-
-                # Update velocity based on speed from EnemyComponent
-                enemy_vel.dx = normalized_dx * enemy_stats.speed
-                enemy_vel.dy = normalized_dy * enemy_stats.speed
-            else:
-                enemy_vel.dx = 0
-                enemy_vel.dy = 0
+        # 이웃이 많아도 분리 속도가 SEPARATION_WEIGHT * speed를 넘지 않도록 제한
+        push_length = np.sqrt(push_x * push_x + push_y * push_y)
+        scale = speed[query] * self.SEPARATION_WEIGHT / np.maximum(push_length, 1.0)
+        return push_x * scale, push_y * scale
@@ -3,8 +3,13 @@ import random
 from typing import TYPE_CHECKING, Optional, List
 from enum import IntEnum
 
+import numpy as np
+
 from components.enums import EnemyType
-from ..entities.enemy import Enemy
+from components.player_component import PlayerComponent
+from components.position_component import PositionComponent
+from entities.enemy import Enemy
+from utils.straggler import StragglerTracker, recycle_enemy, ring_radius
 
 if TYPE_CHECKING:
     from core.entity_manager import EntityManager
@@ -61,6 +66,10 @@ class EnemySpawner:
         # 적 관리
         self.active_enemies: List[Enemy] = []
         self.total_spawned = 0
+        self.total_recycled = 0
+        # 낙오한 적은 플레이어 주변 화면 밖 고리로 재배치 (utils.straggler 공용 정책)
+        self.stragglers = StragglerTracker()
+        self.recycle_radius = ring_radius(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
         
         # 웨이브별 설정 캐시
         self._wave_configs = self._initialize_wave_configs()
@@ -187,6 +196,9 @@ class EnemySpawner:
         # 죽은 적들 제거
         self._cleanup_dead_enemies()
         
+        # 오래 낙오된 적은 새로 만들지 않고 플레이어 주변으로 재배치
+        self._recycle_stragglers(delta_time)
+        
         # 스폰 조건 체크 및 실행
         if self._should_spawn_enemy(current_time):
             enemy = self._spawn_single_enemy(current_time)
@@ -247,6 +259,32 @@ class EnemySpawner:
         if removed_count > 0:
             print(f"죽은 적 {removed_count}개 정리 완료, 현재 활성 적: {len(self.active_enemies)}개")
     
+    def _recycle_stragglers(self, delta_time: float) -> None:
+        """플레이어에게서 오래 멀리 떨어진 적을 플레이어 주변 화면 밖 고리로 재배치"""
+        player_entities = self.entity_manager.get_entities_with_components(PlayerComponent, PositionComponent)
+        if not player_entities:
+            self.stragglers.clear()
+            return
+        player_pos = self.entity_manager.get_component(player_entities[0].id, PositionComponent)
+        
+        entity_ids: List[int] = []
+        positions: List[PositionComponent] = []
+        for enemy in self.active_enemies:
+            if not enemy.entity:
+                continue
+            pos = self.entity_manager.get_component(enemy.entity.id, PositionComponent)
+            if pos is None:
+                continue
+            entity_ids.append(enemy.entity.id)
+            positions.append(pos)
+        
+        count = len(entity_ids)
+        xs = np.fromiter((pos.x for pos in positions), dtype=np.float64, count=count)
+        ys = np.fromiter((pos.y for pos in positions), dtype=np.float64, count=count)
+        for index in self.stragglers.update(entity_ids, xs, ys, player_pos.x, player_pos.y, delta_time).tolist():
+            recycle_enemy(self.entity_manager, entity_ids[index], player_pos.x, player_pos.y, self.recycle_radius)
+            self.total_recycled += 1
+    
     def _should_spawn_enemy(self, current_time: float) -> bool:
         """적을 생성할지 판단"""
         # 시간 간격 체크
@@ -335,6 +373,7 @@ class EnemySpawner:
             "current_wave": self.current_wave.display_name,
             "active_enemies": len(self.active_enemies),
             "total_spawned": self.total_spawned,
+            "total_recycled": self.total_recycled,
             "next_spawn_in": max(0, self.next_spawn_interval - (time.time() - self.last_spawn_time)),
             "enemy_types": [enemy.enemy_type.display_name for enemy in self.active_enemies]
         }
@@ -2,6 +2,7 @@
 from __future__ import annotations
 import random
 from typing import TYPE_CHECKING
+import numpy as np
 import pygame
 
 from core.system import ISystem
@@ -11,7 +12,10 @@ from components.position_component import PositionComponent
 from components.velocity_component import VelocityComponent
 from components.health_component import HealthComponent
 from components.sprite_component import SpriteComponent
-from components.enums import EnemyType, EntityStatus
+from components.knockback_component import KnockbackComponent
+from components.player_component import PlayerComponent
+from components.enums import EnemyState, EnemyType, EntityStatus
+from utils.straggler import StragglerTracker, recycle_enemy, ring_radius
 
 if TYPE_CHECKING:
     from core.entity_manager import EntityManager
@@ -21,22 +25,66 @@ DEFAULT_SPAWN_INTERVAL = 1.0
 
 class EnemySpawnerSystem(ISystem):
     """
-    Spawns enemies at regular intervals.
+    Spawns enemies at regular intervals and recycles stragglers.
+
+    An enemy that stays too far from the player for too long is moved onto
+    a ring just off screen around the player with its movement and AI
+    state reset, keeping its entity and components instead of being
+    destroyed and spawned again (see ``utils.straggler``).
     """
     def __init__(self, screen_width: int, screen_height: int):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.spawn_timer = 0
         self.spawn_interval = DEFAULT_SPAWN_INTERVAL
+        self.total_recycled = 0
+        self.stragglers = StragglerTracker()
+        self.recycle_radius = ring_radius(screen_width, screen_height)
 
     def update(self, entity_manager: EntityManager, delta_time: float, game_time: float) -> None:
         """
-        Spawns a new enemy if the timer is up.
+        Spawns a new enemy if the timer is up and recycles stragglers.
         """
         self.spawn_timer += delta_time
         if self.spawn_timer >= self.spawn_interval:
             self.spawn_timer = 0
             self._spawn_enemy(entity_manager, game_time)
+        self._recycle_stragglers(entity_manager, delta_time)
+
+    def _spawn_position(self) -> tuple[int, int]:
+        """Returns a random point on one of the screen edges."""
+        edge = random.choice(['top', 'bottom', 'left', 'right'])
+        if edge == 'top':
+            return (random.randint(0, self.screen_width), 0)
+        elif edge == 'bottom':
+            return (random.randint(0, self.screen_width), self.screen_height)
+        elif edge == 'left':
+            return (0, random.randint(0, self.screen_height))
+        else: # right
+            return (self.screen_width, random.randint(0, self.screen_height))
+
+    def _recycle_stragglers(self, entity_manager: EntityManager, delta_time: float) -> None:
+        """Moves enemies that stayed far from the player for the recycle delay onto the ring around the player."""
+        player_entities = entity_manager.get_entities_with_components(PlayerComponent, PositionComponent)
+        if not player_entities:
+            self.stragglers.clear()
+            return
+        player_pos = entity_manager.get_component(player_entities[0].id, PositionComponent)
+
+        entity_ids: list[int] = []
+        positions: list[PositionComponent] = []
+        for entity in entity_manager.get_entities_with_components(EnemyComponent, PositionComponent):
+            if entity_manager.get_component(entity.id, EnemyComponent).current_state == EnemyState.DYING:
+                continue
+            entity_ids.append(entity.id)
+            positions.append(entity_manager.get_component(entity.id, PositionComponent))
+
+        count = len(entity_ids)
+        xs = np.fromiter((pos.x for pos in positions), dtype=np.float64, count=count)
+        ys = np.fromiter((pos.y for pos in positions), dtype=np.float64, count=count)
+        for index in self.stragglers.update(entity_ids, xs, ys, player_pos.x, player_pos.y, delta_time).tolist():
+            recycle_enemy(entity_manager, entity_ids[index], player_pos.x, player_pos.y, self.recycle_radius)
+            self.total_recycled += 1
 
     def _spawn_enemy(self, entity_manager: EntityManager, game_time: float):
         """Creates a new enemy entity with difficulty scaling."""
@@ -46,15 +94,7 @@ class EnemySpawnerSystem(ISystem):
         difficulty_factor = 1.0 + (game_time / 30.0) # Increases every 30 seconds
 
         # Position
-        edge = random.choice(['top', 'bottom', 'left', 'right'])
-        if edge == 'top':
-            x, y = (random.randint(0, self.screen_width), 0)
-        elif edge == 'bottom':
-            x, y = (random.randint(0, self.screen_width), self.screen_height)
-        elif edge == 'left':
-            x, y = (0, random.randint(0, self.screen_height))
-        else: # right
-            x, y = (self.screen_width, random.randint(0, self.screen_height))
+        x, y = self._spawn_position()
         entity_manager.add_component(enemy_entity.id, PositionComponent(x=x, y=y))
 
         # Velocity
@@ -69,6 +109,7 @@ class EnemySpawnerSystem(ISystem):
         base_speed = random.uniform(1.0, 3.0)
         scaled_speed = base_speed * (1 + game_time / 60.0) # Speed increases every 60 seconds
         entity_manager.add_component(enemy_entity.id, EnemyComponent(enemy_type=EnemyType.KOREAN_TEACHER, speed=scaled_speed))
+        entity_manager.add_component(enemy_entity.id, KnockbackComponent(mass=EnemyType.KOREAN_TEACHER.knockback_mass))
 
         # Sprite
         enemy_surface = pygame.Surface((30, 30), pygame.SRCALPHA)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from core.system import ISystem
+from components.player_component import PlayerComponent
+from components.position_component import PositionComponent
+from utils.bullet_pool import BulletPool
+
+if TYPE_CHECKING:
+    from core.entity_manager import EntityManager
+
+
+class HomingMissileSystem(ISystem):
+    """
+    Turns every homing bullet in a BulletPool toward the player.
+
+    Each missile's heading is rotated toward the target by at most its
+    turn rate times delta time, keeping its speed. All missiles are
+    steered with one set of array operations, so the cost barely depends
+    on how many are alive. Runs before the pool is integrated.
+    """
+
+    def __init__(self, bullet_pool: BulletPool):
+        self.bullet_pool = bullet_pool
+
+    def update(self, entity_manager: EntityManager, delta_time: float) -> None:
+        """Steers the homing bullets toward the player.
+
+        Args:
+            entity_manager: The manager for all entities and components.
+            delta_time: The time elapsed since the last frame.
+        """
+        player_entities = entity_manager.get_entities_with_components(PlayerComponent, PositionComponent)
+        if not player_entities:
+            return
+        player_pos = entity_manager.get_component(player_entities[0].id, PositionComponent)
+        self.steer(self.bullet_pool, player_pos.x, player_pos.y, delta_time)
+
+    @staticmethod
+    def steer(pool: BulletPool, target_x: float, target_y: float, delta_time: float) -> None:
+        """Rotates each homing bullet's velocity toward a target with a clamped angle."""
+        missiles = pool.homing_indices()
+        if not len(missiles):
+            return
+
+        vx = pool.vx[missiles]
+        vy = pool.vy[missiles]
+        heading = np.arctan2(vy, vx)
+        desired = np.arctan2(target_y - pool.y[missiles], target_x - pool.x[missiles])
+
+        # AI-DEV : 각도 차이를 (-pi, pi]로 감싸고 회전율로 한 번에 제한
+        # - 문제: 미사일마다 파이썬에서 각도를 계산하면 미사일 수만큼 비용 발생
+        # - 해결책: 모든 미사일의 각도 차를 배열로 구해 np.clip 한 번으로 제한
+        # - 주의사항: 감싸지 않으면 -179도 -> 179도 전환 시 반대 방향으로 한 바퀴 돎
+        delta = (desired - heading + np.pi) % (2.0 * np.pi) - np.pi
+        max_turn = pool.turn_rate[missiles] * delta_time
+        new_heading = heading + np.clip(delta, -max_turn, max_turn)
+
+        speed = np.hypot(vx, vy)
+        pool.vx[missiles] = np.cos(new_heading) * speed
+        pool.vy[missiles] = np.sin(new_heading) * speed
@@ -32,6 +32,7 @@ class ItemSystem(ISystem):
             player_comp = self.entity_manager.get_component(entity.id, PlayerComponent)
             player_comp.movement_speed = player_comp.base_movement_speed
             player_comp.attack_speed = player_comp.base_attack_speed
+            player_comp.pickup_radius = player_comp.base_pickup_radius
 
         if self.entity_manager.has_component(entity.id, AttackComponent):
             attack_comp = self.entity_manager.get_component(entity.id, AttackComponent)
@@ -85,6 +86,7 @@ class ItemSystem(ISystem):
                 # Passive stats
                 if player_comp:
                     player_comp.movement_speed += player_comp.base_movement_speed * effects.get('movement_speed_increase', 0)
+                    player_comp.pickup_radius += player_comp.base_pickup_radius * effects.get('pickup_radius_increase', 0)
                 if attack_comp:
                     attack_comp.attack_speed += attack_comp.base_attack_speed * effects.get('attack_speed_increase', 0)
 
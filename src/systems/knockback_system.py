@@ -0,0 +1,124 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from core.system import ISystem
+from components.knockback_component import KnockbackComponent
+from components.position_component import PositionComponent
+
+if TYPE_CHECKING:
+    from core.entity_manager import EntityManager
+
+# 이 속력보다 느려진 넉백은 멈춘 것으로 보고 활성 목록에서 제거
+MIN_KNOCKBACK_SPEED = 0.05
+
+
+class KnockbackSystem(ISystem):
+    """
+    Applies hit impulses and integrates knockback velocity in one batch.
+
+    Collision code only calls ``add_impulse``, which only appends to lists.
+    Each update sums the queued impulses per entity with ``np.bincount``,
+    adds them to the KnockbackComponent velocities, and moves every entity
+    that is still being pushed with exact exponential damping:
+    ``x += v * (1 - e^(-k dt)) / k`` and ``v *= e^(-k dt)``. Only entities
+    with a live knockback are visited, so idle enemies cost nothing.
+    """
+
+    def __init__(self):
+        self._impulse_ids: list[int] = []
+        self._impulse_x: list[float] = []
+        self._impulse_y: list[float] = []
+        self._impulse_strength: list[float] = []
+        # 넉백 속도가 남아 있는 엔티티 (삽입 순서 유지)
+        self.active: dict[int, None] = {}
+
+    def add_impulse(self, entity_id: int, direction_x: float, direction_y: float, strength: float) -> None:
+        """Queues an impulse of ``strength`` along (direction_x, direction_y) for the next update.
+
+        The direction does not need to be normalized; a zero direction adds nothing.
+        """
+        # 방향 정규화와 엔티티별 합산은 update에서 배열로 한 번에 처리
+        self._impulse_ids.append(entity_id)
+        self._impulse_x.append(direction_x)
+        self._impulse_y.append(direction_y)
+        self._impulse_strength.append(strength)
+
+    def update(self, entity_manager: EntityManager, delta_time: float) -> None:
+        """Applies queued impulses, then moves and damps every knocked-back entity.
+
+        Args:
+            entity_manager: The manager for all entities and components.
+            delta_time: The time elapsed since the last frame.
+        """
+        if self._impulse_ids:
+            self._apply_impulses(entity_manager)
+        if not self.active:
+            return
+
+        entity_ids: list[int] = []
+        knockbacks: list[KnockbackComponent] = []
+        positions: list[PositionComponent] = []
+        for entity_id in self.active:
+            knockback = entity_manager.get_component(entity_id, KnockbackComponent)
+            pos = entity_manager.get_component(entity_id, PositionComponent)
+            if knockback is None or pos is None:
+                continue
+            entity_ids.append(entity_id)
+            knockbacks.append(knockback)
+            positions.append(pos)
+        self.active = {}
+        if not entity_ids:
+            return
+
+        count = len(entity_ids)
+        vx = np.fromiter((knockback.vx for knockback in knockbacks), dtype=np.float64, count=count)
+        vy = np.fromiter((knockback.vy for knockback in knockbacks), dtype=np.float64, count=count)
+        damping = np.fromiter((knockback.damping for knockback in knockbacks), dtype=np.float64, count=count)
+        x = np.fromiter((pos.x for pos in positions), dtype=np.float64, count=count)
+        y = np.fromiter((pos.y for pos in positions), dtype=np.float64, count=count)
+
+        decay = np.exp(-damping * delta_time)
+        travel = (1.0 - decay) / np.maximum(damping, 1e-9)
+        x += vx * travel
+        y += vy * travel
+        vx *= decay
+        vy *= decay
+        moving = vx * vx + vy * vy >= MIN_KNOCKBACK_SPEED * MIN_KNOCKBACK_SPEED
+        vx[~moving] = 0.0
+        vy[~moving] = 0.0
+
+        for entity_id, knockback, pos, new_x, new_y, new_vx, new_vy, is_moving in zip(
+            entity_ids, knockbacks, positions, x.tolist(), y.tolist(), vx.tolist(), vy.tolist(), moving.tolist()
+        ):
+            pos.x = new_x
+            pos.y = new_y
+            knockback.vx = new_vx
+            knockback.vy = new_vy
+            if is_moving:
+                self.active[entity_id] = None
+
+    def _apply_impulses(self, entity_manager: EntityManager) -> None:
+        ids = np.asarray(self._impulse_ids, dtype=np.int64)
+        direction_x = np.asarray(self._impulse_x, dtype=np.float64)
+        direction_y = np.asarray(self._impulse_y, dtype=np.float64)
+        scale = np.asarray(self._impulse_strength, dtype=np.float64) / np.maximum(
+            np.sqrt(direction_x * direction_x + direction_y * direction_y), 1e-9
+        )
+        self._impulse_ids.clear()
+        self._impulse_x.clear()
+        self._impulse_y.clear()
+        self._impulse_strength.clear()
+
+        # 같은 프레임에 여러 번 맞은 적은 충격량을 합산해 한 번만 반영
+        unique_ids, inverse = np.unique(ids, return_inverse=True)
+        impulse_x = np.bincount(inverse, weights=direction_x * scale, minlength=len(unique_ids))
+        impulse_y = np.bincount(inverse, weights=direction_y * scale, minlength=len(unique_ids))
+        for entity_id, jx, jy in zip(unique_ids.tolist(), impulse_x.tolist(), impulse_y.tolist()):
+            knockback = entity_manager.get_component(entity_id, KnockbackComponent)
+            if knockback is None:
+                continue
+            knockback.vx += jx / knockback.mass
+            knockback.vy += jy / knockback.mass
+            self.active[entity_id] = None
@@ -0,0 +1,31 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from core.system import ISystem
+from components.motion_history_component import MotionHistoryComponent
+from components.position_component import PositionComponent
+
+if TYPE_CHECKING:
+    from core.entity_manager import EntityManager
+
+
+class MotionHistorySystem(ISystem):
+    """
+    Records the final position of every tracked entity once per frame.
+
+    Runs after movement and obstacle resolution so the history holds the
+    positions that were actually rendered, and before the systems that
+    read it on the next frame.
+    """
+
+    def update(self, entity_manager: EntityManager, delta_time: float) -> None:
+        """Pushes the current position into each motion history.
+
+        Args:
+            entity_manager: The manager for all entities and components.
+            delta_time: The time elapsed since the last frame.
+        """
+        for entity in entity_manager.get_entities_with_components(MotionHistoryComponent, PositionComponent):
+            history = entity_manager.get_component(entity.id, MotionHistoryComponent)
+            pos = entity_manager.get_component(entity.id, PositionComponent)
+            history.push(pos.x, pos.y, delta_time)
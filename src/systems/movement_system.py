@@ -6,6 +6,7 @@ from core.system import ISystem
 from components.position_component import PositionComponent
 from components.velocity_component import VelocityComponent
 from components.player_component import PlayerComponent
+from components.projectile_component import ProjectileComponent
 
 if TYPE_CHECKING:
     from core.entity_manager import EntityManager
@@ -19,7 +20,11 @@ class MovementSystem(ISystem):
         """
         Updates the position of all entities with a velocity.
         """
-        # Handle player debuffs first
+        self.update_player_debuffs(entity_manager, delta_time)
+        self.integrate(entity_manager, delta_time)
+
+    def update_player_debuffs(self, entity_manager: EntityManager, delta_time: float) -> None:
+        """Counts down the player's slow debuff."""
         for player_entity in entity_manager.get_entities_with_components(PlayerComponent, VelocityComponent):
             player_comp = entity_manager.get_component(player_entity.id, PlayerComponent)
             if player_comp.slow_debuff_stacks > 0:
@@ -28,20 +33,30 @@ class MovementSystem(ISystem):
                     player_comp.slow_debuff_stacks = 0
                     player_comp.slow_debuff_timer = 0
 
-        # Generic movement
+    @staticmethod
+    def get_speed_multiplier(entity_manager: EntityManager, entity_id: int) -> float:
+        """Returns the factor applied to an entity's velocity by debuffs."""
+        player_comp = entity_manager.get_component(entity_id, PlayerComponent)
+        if player_comp and player_comp.slow_debuff_stacks > 0:
+            return 1.0 - 0.2 * player_comp.slow_debuff_stacks
+        return 1.0
+
+    @staticmethod
+    def record_projectile_start(entity_manager: EntityManager, entity_id: int, pos: PositionComponent) -> None:
+        """Stores a projectile's position before it moves, where the collision sweep starts."""
+        projectile = entity_manager.get_component(entity_id, ProjectileComponent)
+        if projectile is not None:
+            # 충돌 스윕 판정은 속도가 아닌 실제 이동 전 위치에서 시작
+            projectile.prev_x = pos.x
+            projectile.prev_y = pos.y
+
+    def integrate(self, entity_manager: EntityManager, delta_time: float) -> None:
+        """Applies velocities to positions."""
         for entity in entity_manager.get_entities_with_components(PositionComponent, VelocityComponent):
             pos = entity_manager.get_component(entity.id, PositionComponent)
             vel = entity_manager.get_component(entity.id, VelocityComponent)
-            
-            final_dx = vel.dx
-            final_dy = vel.dy
-
-            if entity_manager.has_component(entity.id, PlayerComponent):
-                player_comp = entity_manager.get_component(entity.id, PlayerComponent)
-                if player_comp.slow_debuff_stacks > 0:
-                    reduction = 0.2 * player_comp.slow_debuff_stacks
-                    final_dx *= (1.0 - reduction)
-                    final_dy *= (1.0 - reduction)
-
-            pos.x += final_dx * delta_time
-            pos.y += final_dy * delta_time
+
+            self.record_projectile_start(entity_manager, entity.id, pos)
+            multiplier = self.get_speed_multiplier(entity_manager, entity.id)
+            pos.x += vel.dx * multiplier * delta_time
+            pos.y += vel.dy * multiplier * delta_time
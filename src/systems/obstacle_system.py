@@ -0,0 +1,138 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from core.system import ISystem
+from components.obstacle_component import ObstacleComponent
+from components.position_component import PositionComponent
+from components.velocity_component import VelocityComponent
+from components.sprite_component import SpriteComponent
+from components.projectile_component import ProjectileComponent
+from components.enums import CollisionLayer
+from utils.bvh import StaticBVH
+from utils.occupancy_grid import OccupancyGrid
+
+if TYPE_CHECKING:
+    from core.entity_manager import EntityManager
+
+
+class ObstacleSystem(ISystem):
+    """
+    Resolves moving entities against static obstacles.
+
+    Obstacles are collected into a StaticBVH once by ``build`` at level
+    load. Every frame, each moving entity queries the tree with its
+    bounding circle: players and enemies are pushed out of the boxes they
+    overlap, projectiles bounce off them or are destroyed.
+    """
+
+    def __init__(self):
+        self.bvh = StaticBVH([])
+
+    def build(self, entity_manager: EntityManager, occupancy: OccupancyGrid | None = None) -> None:
+        """Builds the obstacle BVH from every entity with an ObstacleComponent.
+
+        Must be called again if obstacles are added or removed.
+
+        Args:
+            entity_manager: The manager for all entities and components.
+            occupancy: If given, its static layer is replaced with the obstacle
+                boxes so raycasts are blocked by them.
+        """
+        boxes = []
+        obstacle_ids = []
+        for entity in entity_manager.get_entities_with_components(ObstacleComponent, PositionComponent):
+            obstacle = entity_manager.get_component(entity.id, ObstacleComponent)
+            pos = entity_manager.get_component(entity.id, PositionComponent)
+            half_w = obstacle.width / 2
+            half_h = obstacle.height / 2
+            boxes.append((pos.x - half_w, pos.y - half_h, pos.x + half_w, pos.y + half_h))
+            obstacle_ids.append(entity.id)
+        self.bvh = StaticBVH(boxes)
+
+        if occupancy is not None:
+            occupancy.clear_static()
+            for obstacle_id, box in zip(obstacle_ids, boxes):
+                occupancy.add_static_box(obstacle_id, box, CollisionLayer.OBSTACLE)
+
+    def update(self, entity_manager: EntityManager, delta_time: float) -> None:
+        """Pushes movers out of obstacles and bounces projectiles off them.
+
+        Args:
+            entity_manager: The manager for all entities and components.
+            delta_time: The time elapsed since the last frame.
+        """
+        if not len(self.bvh):
+            return
+
+        # AI-NOTE : 2026-10-19 정적 장애물은 동적 브로드페이즈와 분리하여 처리
+        # - 이유: 움직이지 않는 장애물을 매 프레임 그리드에 다시 넣는 것은 낭비
+        # - 요구사항: 이동 엔티티마다 BVH에 O(log n) 쿼리 한 번으로 판정
+        # - 히스토리: 장애물 없는 빈 맵 -> 레벨 로드 시 BVH 1회 구성
+        for entity in entity_manager.get_entities_with_components(PositionComponent, VelocityComponent, SpriteComponent):
+            pos = entity_manager.get_component(entity.id, PositionComponent)
+            sprite = entity_manager.get_component(entity.id, SpriteComponent)
+            radius = max(sprite.rect.width, sprite.rect.height) / 2
+
+            hits = self.bvh.query_circle(pos.x, pos.y, radius)
+            if not hits:
+                continue
+
+            projectile = entity_manager.get_component(entity.id, ProjectileComponent)
+            if projectile is not None:
+                self._bounce_projectile(entity_manager, entity.id, projectile, pos, radius, hits[0])
+                continue
+
+            for index in hits:
+                push_x, push_y = self._penetration(pos.x, pos.y, radius, self.bvh.boxes[index])
+                pos.x += push_x
+                pos.y += push_y
+
+    def _bounce_projectile(
+        self,
+        entity_manager: EntityManager,
+        entity_id: int,
+        projectile: ProjectileComponent,
+        pos: PositionComponent,
+        radius: float,
+        box_index: int,
+    ) -> None:
+        # 화면 벽과 같은 규칙: 바운스가 남아 있으면 반사, 없으면 소멸
+        if projectile.bounces <= 0:
+            entity_manager.destroy_entity(entity_id)
+            return
+
+        vel = entity_manager.get_component(entity_id, VelocityComponent)
+        push_x, push_y = self._penetration(pos.x, pos.y, radius, self.bvh.boxes[box_index])
+        projectile.bounces -= 1
+        if abs(push_x) >= abs(push_y):
+            vel.dx *= -1
+        else:
+            vel.dy *= -1
+        pos.x += push_x
+        pos.y += push_y
+
+    @staticmethod
+    def _penetration(x: float, y: float, radius: float, box: tuple[float, float, float, float]) -> tuple[float, float]:
+        """Returns the smallest translation that moves a circle out of a box."""
+        min_x, min_y, max_x, max_y = box
+        closest_x = min(max(x, min_x), max_x)
+        closest_y = min(max(y, min_y), max_y)
+        dx = x - closest_x
+        dy = y - closest_y
+        dist_sq = dx * dx + dy * dy
+
+        if dist_sq > 0.0:
+            if dist_sq >= radius * radius:
+                return 0.0, 0.0
+            dist = dist_sq ** 0.5
+            depth = radius - dist
+            return dx / dist * depth, dy / dist * depth
+
+        # 중심이 상자 안에 있으면 가장 가까운 면으로 밀어냄
+        exits = [
+            (min_x - radius - x, 0.0),
+            (max_x + radius - x, 0.0),
+            (0.0, min_y - radius - y),
+            (0.0, max_y + radius - y),
+        ]
+        return min(exits, key=lambda push: abs(push[0]) + abs(push[1]))
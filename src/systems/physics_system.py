@@ -0,0 +1,159 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from systems.movement_system import MovementSystem
+from components.position_component import PositionComponent
+from components.velocity_component import VelocityComponent
+from components.sprite_component import SpriteComponent
+from components.player_component import PlayerComponent
+from components.enemy_component import EnemyComponent
+from components.projectile_component import ProjectileComponent
+from components.item_component import ItemComponent
+from components.enums import PhysicsBodyType
+
+# AI-DEV : pymunk는 선택 의존성으로 취급
+# - 문제: pymunk가 없는 환경에서도 게임은 기본 MovementSystem으로 실행되어야 함
+# - 해결책: 임포트 실패 시 None으로 두고 is_available()로 백엔드 선택
+# - 주의사항: PymunkPhysicsSystem 생성 전 반드시 is_available() 확인
+try:
+    import pymunk
+except ImportError:
+    pymunk = None
+
+if TYPE_CHECKING:
+    from core.entity_manager import EntityManager
+
+# collision_type 0은 pymunk 기본값이므로 바디 분류에 오프셋을 더해 사용
+_COLLISION_TYPE_OFFSET = 1
+
+
+class PymunkPhysicsSystem(MovementSystem):
+    """
+    Optional physics backend that integrates movement in a pymunk space.
+
+    Every entity with a position, velocity and sprite is mirrored into a
+    sensor circle on a dynamic body. pymunk's spatial hash performs the
+    broadphase and reports begin/separate callbacks, which are kept as
+    persistent touching pairs that CollisionSystem reads instead of
+    running its own pairwise rect tests. Projectile hits are the exception:
+    a sensor overlap at the end of a step misses fast projectiles, so
+    CollisionSystem sweeps them on either backend and this system only
+    records where each projectile started the step.
+    """
+
+    def __init__(self):
+        if pymunk is None:
+            raise ImportError("pymunk is required for PymunkPhysicsSystem")
+        self.space = pymunk.Space()
+        self.space.damping = 1.0
+        self._bodies: dict[int, tuple[pymunk.Body, pymunk.Circle]] = {}
+        self._shape_owners: dict[pymunk.Circle, int] = {}
+        self._touching: dict[tuple[int, int], set[tuple[int, int]]] = {}
+
+        for type_a, type_b in [
+            (PhysicsBodyType.PLAYER, PhysicsBodyType.ENEMY),
+            (PhysicsBodyType.PLAYER, PhysicsBodyType.ITEM),
+        ]:
+            self._register_pair(type_a, type_b)
+
+    @staticmethod
+    def is_available() -> bool:
+        """Checks whether pymunk could be imported."""
+        return pymunk is not None
+
+    def _register_pair(self, type_a: PhysicsBodyType, type_b: PhysicsBodyType) -> None:
+        pairs: set[tuple[int, int]] = set()
+        self._touching[(type_a.value, type_b.value)] = pairs
+        owners = self._shape_owners
+
+        def begin(arbiter: pymunk.Arbiter, space: pymunk.Space, data: dict) -> None:
+            shape_a, shape_b = arbiter.shapes
+            pairs.add((owners[shape_a], owners[shape_b]))
+
+        def separate(arbiter: pymunk.Arbiter, space: pymunk.Space, data: dict) -> None:
+            shape_a, shape_b = arbiter.shapes
+            pairs.discard((owners.get(shape_a, -1), owners.get(shape_b, -1)))
+
+        self.space.on_collision(
+            type_a.value + _COLLISION_TYPE_OFFSET,
+            type_b.value + _COLLISION_TYPE_OFFSET,
+            begin=begin,
+            separate=separate,
+        )
+
+    def touching_pairs(self, type_a: PhysicsBodyType, type_b: PhysicsBodyType) -> list[tuple[int, int]]:
+        """Returns the (a_id, b_id) pairs touching after the last step."""
+        return list(self._touching[(type_a.value, type_b.value)])
+
+    def _get_body_type(self, entity_manager: EntityManager, entity_id: int) -> PhysicsBodyType | None:
+        if entity_manager.has_component(entity_id, PlayerComponent):
+            return PhysicsBodyType.PLAYER
+        if entity_manager.has_component(entity_id, EnemyComponent):
+            return PhysicsBodyType.ENEMY
+        if entity_manager.has_component(entity_id, ProjectileComponent):
+            return PhysicsBodyType.PROJECTILE
+        if entity_manager.has_component(entity_id, ItemComponent):
+            return PhysicsBodyType.ITEM
+        return None
+
+    def _add_body(self, entity_manager: EntityManager, entity_id: int, sprite: SpriteComponent) -> tuple[pymunk.Body, pymunk.Circle] | None:
+        body_type = self._get_body_type(entity_manager, entity_id)
+        if body_type is None:
+            return None
+
+        body = pymunk.Body(1.0, float('inf'))
+        shape = pymunk.Circle(body, max(sprite.rect.width, sprite.rect.height) / 2)
+        shape.sensor = True
+        shape.collision_type = body_type.value + _COLLISION_TYPE_OFFSET
+        self.space.add(body, shape)
+        self._bodies[entity_id] = (body, shape)
+        self._shape_owners[shape] = entity_id
+        return body, shape
+
+    def _remove_body(self, entity_id: int) -> None:
+        body, shape = self._bodies.pop(entity_id)
+        self.space.remove(body, shape)
+        del self._shape_owners[shape]
+        for pairs in self._touching.values():
+            stale = [pair for pair in pairs if entity_id in pair]
+            for pair in stale:
+                pairs.discard(pair)
+
+    def integrate(self, entity_manager: EntityManager, delta_time: float) -> None:
+        """Mirrors components into pymunk, steps the space and syncs back."""
+        synced: list[tuple[PositionComponent, pymunk.Body]] = []
+        alive_ids = set()
+
+        # AI-NOTE : 2026-10-19 컴포넌트 -> 바디 미러링은 스텝당 한 번의 순회로 처리
+        # - 이유: 다른 시스템(스폰, 순간이동 등)이 위치를 직접 바꿀 수 있음
+        # - 요구사항: 스텝 전에 위치/속도를 바디에 쓰고, 스텝 후 위치만 되돌려 씀
+        for entity in entity_manager.get_entities_with_components(PositionComponent, VelocityComponent):
+            pos = entity_manager.get_component(entity.id, PositionComponent)
+            vel = entity_manager.get_component(entity.id, VelocityComponent)
+            multiplier = self.get_speed_multiplier(entity_manager, entity.id)
+            self.record_projectile_start(entity_manager, entity.id, pos)
+
+            entry = self._bodies.get(entity.id)
+            if entry is None:
+                sprite = entity_manager.get_component(entity.id, SpriteComponent)
+                entry = self._add_body(entity_manager, entity.id, sprite) if sprite else None
+            if entry is None:
+                # 충돌 분류가 없는 엔티티는 기존 방식으로 이동만 처리
+                pos.x += vel.dx * multiplier * delta_time
+                pos.y += vel.dy * multiplier * delta_time
+                continue
+
+            alive_ids.add(entity.id)
+            body = entry[0]
+            body.position = (pos.x, pos.y)
+            body.velocity = (vel.dx * multiplier, vel.dy * multiplier)
+            synced.append((pos, body))
+
+        for entity_id in [entity_id for entity_id in self._bodies if entity_id not in alive_ids]:
+            self._remove_body(entity_id)
+
+        if delta_time > 0:
+            self.space.step(delta_time)
+
+        for pos, body in synced:
+            pos.x, pos.y = body.position
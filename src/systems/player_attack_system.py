@@ -13,6 +13,12 @@ from components.projectile_component import ProjectileComponent
 from components.hitbox_component import HitboxComponent # Assuming this will be created
 
 class PlayerAttackSystem(ISystem):
+    # 투사체 수명(delta_time 누적 단위)과 최대 이동 거리(픽셀)
+    SOCCER_BALL_MAX_LIFETIME = 120.0
+    SOCCER_BALL_MAX_DISTANCE = 1600.0
+    BASKETBALL_MAX_LIFETIME = 120.0
+    BASKETBALL_MAX_DISTANCE = 1200.0
+
     def __init__(self):
         self.last_attack_time = 0
 
@@ -66,7 +72,12 @@ class PlayerAttackSystem(ISystem):
             entity_manager.add_component(projectile_entity.id, PositionComponent(x=player_pos.x, y=player_pos.y))
             entity_manager.add_component(projectile_entity.id, VelocityComponent(dx=new_dir_x * 10, dy=new_dir_y * 10))
             entity_manager.add_component(projectile_entity.id, AttackComponent(damage=attack_comp.damage))
-            entity_manager.add_component(projectile_entity.id, ProjectileComponent(bounces=attack_comp.bounces, owner_id=owner_id))
+            entity_manager.add_component(projectile_entity.id, ProjectileComponent(
+                bounces=attack_comp.bounces,
+                owner_id=owner_id,
+                max_lifetime=self.SOCCER_BALL_MAX_LIFETIME,
+                max_distance=self.SOCCER_BALL_MAX_DISTANCE,
+            ))
             
             sprite_surface = pygame.Surface((15, 15), pygame.SRCALPHA)
             pygame.draw.circle(sprite_surface, (255, 255, 255), (7, 7), 7)
@@ -80,7 +91,12 @@ class PlayerAttackSystem(ISystem):
         entity_manager.add_component(projectile_entity.id, PositionComponent(x=player_pos.x, y=player_pos.y))
         entity_manager.add_component(projectile_entity.id, VelocityComponent(dx=dir_x * 8, dy=dir_y * 8))
         entity_manager.add_component(projectile_entity.id, AttackComponent(damage=attack_comp.damage))
-        entity_manager.add_component(projectile_entity.id, ProjectileComponent(pierce=attack_comp.pierce, owner_id=owner_id))
+        entity_manager.add_component(projectile_entity.id, ProjectileComponent(
+            pierce=attack_comp.pierce,
+            owner_id=owner_id,
+            max_lifetime=self.BASKETBALL_MAX_LIFETIME,
+            max_distance=self.BASKETBALL_MAX_DISTANCE,
+        ))
         
         sprite_surface = pygame.Surface((20, 20), pygame.SRCALPHA)
         pygame.draw.circle(sprite_surface, (255, 165, 0), (10, 10), 10)
@@ -13,14 +13,36 @@ from components.health_component import HealthComponent
 
 if TYPE_CHECKING:
     from core.entity_manager import EntityManager
+    from systems.boss_pattern_system import BossPatternSystem
+    from utils.bullet_pool import BulletPool
 
 class RenderSystem(ISystem):
     """
     Renders all entities with a sprite and position.
     """
-    def __init__(self, screen: pygame.Surface):
+    def __init__(self, screen: pygame.Surface, bullet_pool: BulletPool | None = None, boss_patterns: BossPatternSystem | None = None):
         self.screen = screen
         self.font = pygame.font.Font(None, 36)
+        # 엔티티가 아닌 적 탄환과 보스 패턴(레이저, 순간이동 예고)은 별도 저장소에서 읽어 그림
+        self.bullet_pool = bullet_pool
+        self.boss_patterns = boss_patterns
+
+    def _draw_boss_patterns(self) -> None:
+        """Draws pooled enemy bullets, laser beams and strike telegraphs."""
+        if self.boss_patterns is not None:
+            for strike in self.boss_patterns.strikes:
+                pygame.draw.circle(self.screen, (255, 120, 0), (strike.x, strike.y), strike.radius, 2)
+            for laser in self.boss_patterns.lasers:
+                if laser.is_charging:
+                    pygame.draw.line(self.screen, (255, 80, 80), laser.start, laser.end, 1)
+                else:
+                    pygame.draw.line(self.screen, (255, 230, 230), laser.start, laser.end, max(int(laser.width), 1))
+
+        if self.bullet_pool is not None:
+            pool = self.bullet_pool
+            for index in pool.active_indices().tolist():
+                color = (255, 90, 0) if pool.turn_rate[index] > 0.0 else (255, 220, 0)
+                pygame.draw.circle(self.screen, color, (pool.x[index], pool.y[index]), pool.radius[index])
 
     def _draw_hp_bar(self, pos: PositionComponent, sprite: SpriteComponent, health: HealthComponent) -> None:
         """Draws the HP bar above the entity's sprite."""
@@ -53,6 +75,8 @@ class RenderSystem(ISystem):
             sprite.rect.center = (pos.x, pos.y)
             self.screen.blit(sprite.surface, sprite.rect)
 
+        self._draw_boss_patterns()
+
         # Draw HP bars
         for entity in entity_manager.get_entities_with_components(PositionComponent, SpriteComponent, HealthComponent):
             pos = entity_manager.get_component(entity.id, PositionComponent)
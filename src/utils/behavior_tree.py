@@ -0,0 +1,162 @@
+"""
+Minimal behavior tree runtime compiled to closures.
+
+A tree is described once with the ``selector``/``sequence``/``cooldown``/
+``condition``/``action`` builders and compiled with ``compile_tree``. Each
+node becomes one closure that calls its children directly, so a tick is a
+chain of plain function calls instead of a walk over node objects.
+
+Per-agent state (the running child of each composite and the ready time of
+each cooldown) is kept in a flat list from ``BehaviorTree.new_memory``, so
+one compiled tree is shared by every boss or elite that uses it. When a
+composite child returns RUNNING, its index is stored and the next tick
+resumes at that child without re-evaluating the children before it.
+
+Leaf callables receive the agent context and must return a ``BTStatus``
+member (conditions return a bool); statuses are compared by identity.
+"""
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from components.enums import BTStatus
+
+_SUCCESS = BTStatus.SUCCESS
+_FAILURE = BTStatus.FAILURE
+_RUNNING = BTStatus.RUNNING
+
+# 컴파일된 노드: (context, memory, now) -> BTStatus
+TickFunction = Callable[[Any, list, float], BTStatus]
+
+
+@dataclass(frozen=True, slots=True)
+class BTNode:
+    """An uncompiled node description produced by the builder functions."""
+    kind: str
+    children: tuple["BTNode", ...] = ()
+    function: Callable[[Any], Any] | None = None
+    duration: float | Callable[[Any], float] = 0.0
+
+
+def selector(*children: BTNode) -> BTNode:
+    """Ticks children in order until one succeeds or is running."""
+    if not children:
+        raise ValueError("selector needs at least one child")
+    return BTNode("selector", children)
+
+
+def sequence(*children: BTNode) -> BTNode:
+    """Ticks children in order until one fails or is running."""
+    if not children:
+        raise ValueError("sequence needs at least one child")
+    return BTNode("sequence", children)
+
+
+def cooldown(duration: float | Callable[[Any], float], child: BTNode) -> BTNode:
+    """Fails for ``duration`` seconds after the child succeeds.
+
+    ``duration`` may be a callable taking the context, for cooldowns that
+    depend on agent state such as a boss phase.
+    """
+    return BTNode("cooldown", (child,), duration=duration)
+
+
+def condition(predicate: Callable[[Any], bool]) -> BTNode:
+    """Succeeds when ``predicate(context)`` is truthy, fails otherwise."""
+    return BTNode("condition", function=predicate)
+
+
+def action(function: Callable[[Any], BTStatus]) -> BTNode:
+    """Runs ``function(context)`` and returns its status."""
+    return BTNode("action", function=function)
+
+
+class BehaviorTree:
+    """A compiled tree; ticks any number of agents with their own memory."""
+
+    def __init__(self, root: TickFunction, slot_count: int):
+        self._root = root
+        self.slot_count = slot_count
+
+    def new_memory(self) -> list:
+        """Returns zeroed per-agent state: composites start at their first child, cooldowns are ready."""
+        return [0] * self.slot_count
+
+    def tick(self, context: Any, memory: list, now: float) -> BTStatus:
+        """Ticks the tree once for one agent.
+
+        Args:
+            context: Passed unchanged to every condition and action.
+            memory: The agent's state from ``new_memory``.
+            now: The current time in seconds, used by cooldown nodes.
+        """
+        return self._root(context, memory, now)
+
+
+def compile_tree(root: BTNode) -> BehaviorTree:
+    """Compiles a node description into a BehaviorTree."""
+    slot_count = [0]
+
+    def allocate_slot() -> int:
+        slot = slot_count[0]
+        slot_count[0] += 1
+        return slot
+
+    tick = _compile_node(root, allocate_slot)
+    return BehaviorTree(tick, slot_count[0])
+
+
+def _compile_node(node: BTNode, allocate_slot: Callable[[], int]) -> TickFunction:
+    if node.kind == "action":
+        function = node.function
+
+        def tick_action(context, memory, now):
+            return function(context)
+        return tick_action
+
+    if node.kind == "condition":
+        predicate = node.function
+
+        def tick_condition(context, memory, now):
+            return _SUCCESS if predicate(context) else _FAILURE
+        return tick_condition
+
+    if node.kind == "cooldown":
+        child = _compile_node(node.children[0], allocate_slot)
+        slot = allocate_slot()
+        duration = node.duration
+
+        def tick_cooldown(context, memory, now):
+            if now < memory[slot]:
+                return _FAILURE
+            status = child(context, memory, now)
+            if status is _SUCCESS:
+                memory[slot] = now + (duration(context) if callable(duration) else duration)
+            return status
+        return tick_cooldown
+
+    if node.kind in ("selector", "sequence"):
+        children = tuple(_compile_node(child, allocate_slot) for child in node.children)
+        count = len(children)
+        slot = allocate_slot()
+        # 선택자는 성공에서, 시퀀스는 실패에서 멈추고 그 결과를 그대로 반환
+        stop_status = _SUCCESS if node.kind == "selector" else _FAILURE
+        exhausted_status = _FAILURE if node.kind == "selector" else _SUCCESS
+
+        def tick_composite(context, memory, now):
+            # RUNNING으로 끝난 자식이 있으면 앞선 자식들을 다시 평가하지 않고 그 자식부터 재개
+            index = memory[slot]
+            while index < count:
+                status = children[index](context, memory, now)
+                if status is _RUNNING:
+                    memory[slot] = index
+                    return _RUNNING
+                if status is stop_status:
+                    memory[slot] = 0
+                    return stop_status
+                index += 1
+            memory[slot] = 0
+            return exhausted_status
+        return tick_composite
+
+    raise ValueError(f"unknown behavior tree node kind: {node.kind}")
@@ -0,0 +1,127 @@
+"""
+Preallocated structure-of-arrays store for enemy bullets.
+
+Bullets are not ECS entities: every field lives in a fixed-size NumPy
+array and a slot is either active or on the free stack. Spawning a volley
+pops slots off the stack, and integration, expiry and player collision are
+each one masked array operation over the whole pool, so hundreds of live
+bullets cost about the same as a handful.
+"""
+import numpy as np
+
+DEFAULT_CAPACITY = 1024
+
+
+class BulletPool:
+    """A fixed-capacity pool of bullets with position, velocity, lifetime and damage."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.vx = np.zeros(capacity, dtype=np.float64)
+        self.vy = np.zeros(capacity, dtype=np.float64)
+        self.lifetime = np.zeros(capacity, dtype=np.float64)
+        self.damage = np.zeros(capacity, dtype=np.int64)
+        self.radius = np.zeros(capacity, dtype=np.float64)
+        # 0이면 직진탄, 양수면 초당 최대 회전각(rad)으로 목표를 추적하는 유도탄
+        self.turn_rate = np.zeros(capacity, dtype=np.float64)
+        self.active = np.zeros(capacity, dtype=bool)
+
+        # 빈 슬롯 스택: _free[:_free_top]가 사용 가능한 인덱스, 낮은 인덱스부터 사용
+        self._free = np.arange(capacity - 1, -1, -1, dtype=np.int64)
+        self._free_top = capacity
+
+    def __len__(self) -> int:
+        return self.capacity - self._free_top
+
+    def spawn(
+        self,
+        x: float | np.ndarray,
+        y: float | np.ndarray,
+        vx: np.ndarray,
+        vy: np.ndarray,
+        lifetime: float,
+        damage: int,
+        radius: float,
+        turn_rate: float = 0.0,
+    ) -> np.ndarray:
+        """Activates one bullet per velocity entry.
+
+        Positions may be scalars (a volley from one point) or arrays. When the
+        pool is full the excess bullets are dropped rather than growing it.
+
+        Returns:
+            The slot indices of the spawned bullets.
+        """
+        vx = np.atleast_1d(np.asarray(vx, dtype=np.float64))
+        vy = np.atleast_1d(np.asarray(vy, dtype=np.float64))
+        count = min(len(vx), self._free_top)
+        if count <= 0:
+            return np.empty(0, dtype=np.int64)
+
+        slots = self._free[self._free_top - count:self._free_top][::-1].copy()
+        self._free_top -= count
+
+        self.x[slots] = np.broadcast_to(x, len(vx))[:count]
+        self.y[slots] = np.broadcast_to(y, len(vx))[:count]
+        self.vx[slots] = vx[:count]
+        self.vy[slots] = vy[:count]
+        self.lifetime[slots] = lifetime
+        self.damage[slots] = damage
+        self.radius[slots] = radius
+        self.turn_rate[slots] = turn_rate
+        self.active[slots] = True
+        return slots
+
+    def release(self, slots: np.ndarray) -> None:
+        """Returns slots to the free stack; inactive slots are ignored."""
+        slots = np.asarray(slots, dtype=np.int64)
+        slots = slots[self.active[slots]]
+        if not len(slots):
+            return
+        self.active[slots] = False
+        self._free[self._free_top:self._free_top + len(slots)] = slots
+        self._free_top += len(slots)
+
+    def clear(self) -> None:
+        """Deactivates every bullet."""
+        self.release(np.flatnonzero(self.active))
+
+    def active_indices(self) -> np.ndarray:
+        """Returns the slot indices of the live bullets."""
+        return np.flatnonzero(self.active)
+
+    def homing_indices(self) -> np.ndarray:
+        """Returns the slot indices of the live bullets that turn toward a target."""
+        return np.flatnonzero(self.active & (self.turn_rate > 0.0))
+
+    def update(self, delta_time: float, bounds: tuple[float, float, float, float] | None = None) -> None:
+        """Moves every live bullet and frees the expired ones.
+
+        Args:
+            delta_time: The time elapsed since the last frame.
+            bounds: Optional (min_x, min_y, max_x, max_y); bullets leaving it are freed.
+        """
+        live = self.active_indices()
+        if not len(live):
+            return
+        self.x[live] += self.vx[live] * delta_time
+        self.y[live] += self.vy[live] * delta_time
+        self.lifetime[live] -= delta_time
+
+        expired = self.lifetime[live] <= 0.0
+        if bounds is not None:
+            min_x, min_y, max_x, max_y = bounds
+            x = self.x[live]
+            y = self.y[live]
+            expired |= (x < min_x) | (x > max_x) | (y < min_y) | (y > max_y)
+        self.release(live[expired])
+
+    def overlapping_circle(self, cx: float, cy: float, radius: float) -> np.ndarray:
+        """Returns the live bullets touching a circle."""
+        live = self.active_indices()
+        dx = self.x[live] - cx
+        dy = self.y[live] - cy
+        reach = self.radius[live] + radius
+        return live[dx * dx + dy * dy <= reach * reach]
@@ -0,0 +1,99 @@
+"""
+Bounding volume hierarchy over static axis-aligned boxes.
+
+The tree is built once from a list of boxes and never updated, which suits
+level geometry such as classroom obstacles. Nodes are stored in flat lists
+so a query walks the tree with an explicit stack instead of recursion.
+"""
+from collections.abc import Sequence
+
+# (min_x, min_y, max_x, max_y)
+AABB = tuple[float, float, float, float]
+
+# 리프 노드가 직접 보관하는 최대 박스 수
+_LEAF_SIZE = 2
+
+
+def _union(boxes: Sequence[AABB]) -> AABB:
+    return (
+        min(box[0] for box in boxes),
+        min(box[1] for box in boxes),
+        max(box[2] for box in boxes),
+        max(box[3] for box in boxes),
+    )
+
+
+class StaticBVH:
+    """A bounding volume hierarchy built once from static boxes.
+
+    Queries return the indices of the boxes in the list passed to the
+    constructor, so callers can keep any payload in a parallel list.
+    """
+
+    def __init__(self, boxes: Sequence[AABB]):
+        self.boxes: list[AABB] = list(boxes)
+        # 노드 i의 경계 상자, 자식 인덱스(내부 노드) 또는 박스 인덱스 목록(리프)
+        self._node_bounds: list[AABB] = []
+        self._node_children: list[tuple[int, int] | None] = []
+        self._node_items: list[list[int]] = []
+        if self.boxes:
+            self._build(list(range(len(self.boxes))))
+
+    def __len__(self) -> int:
+        return len(self.boxes)
+
+    def _build(self, indices: list[int]) -> int:
+        node = len(self._node_bounds)
+        bounds = _union([self.boxes[i] for i in indices])
+        self._node_bounds.append(bounds)
+        self._node_children.append(None)
+        self._node_items.append([])
+
+        if len(indices) <= _LEAF_SIZE:
+            self._node_items[node] = indices
+            return node
+
+        # AI-DEV : 가장 긴 축의 중심 좌표 중앙값으로 분할
+        # - 문제: 장애물 배치가 한쪽에 몰려 있으면 공간 중앙 분할은 트리가 치우침
+        # - 해결책: 박스 중심을 정렬해 절반씩 나누어 깊이를 O(log n)으로 유지
+        # - 주의사항: 레벨 로드 시 한 번만 실행되므로 정렬 비용은 문제되지 않음
+        axis = 0 if bounds[2] - bounds[0] >= bounds[3] - bounds[1] else 1
+        indices.sort(key=lambda i: self.boxes[i][axis] + self.boxes[i][axis + 2])
+        half = len(indices) // 2
+        left = self._build(indices[:half])
+        right = self._build(indices[half:])
+        self._node_children[node] = (left, right)
+        return node
+
+    def query_aabb(self, min_x: float, min_y: float, max_x: float, max_y: float) -> list[int]:
+        """Returns the indices of boxes overlapping the given box."""
+        if not self._node_bounds:
+            return []
+
+        result = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            node_min_x, node_min_y, node_max_x, node_max_y = self._node_bounds[node]
+            if node_max_x < min_x or node_min_x > max_x or node_max_y < min_y or node_min_y > max_y:
+                continue
+            children = self._node_children[node]
+            if children is not None:
+                stack.extend(children)
+                continue
+            for index in self._node_items[node]:
+                box = self.boxes[index]
+                if box[2] >= min_x and box[0] <= max_x and box[3] >= min_y and box[1] <= max_y:
+                    result.append(index)
+        return result
+
+    def query_circle(self, x: float, y: float, radius: float) -> list[int]:
+        """Returns the indices of boxes overlapping a circle."""
+        result = []
+        for index in self.query_aabb(x - radius, y - radius, x + radius, y + radius):
+            min_x, min_y, max_x, max_y = self.boxes[index]
+            closest_x = min(max(x, min_x), max_x)
+            closest_y = min(max(y, min_y), max_y)
+            if (x - closest_x) ** 2 + (y - closest_y) ** 2 <= radius * radius:
+                result.append(index)
+        return result
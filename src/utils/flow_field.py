@@ -0,0 +1,146 @@
+"""
+Flow field over a coarse grid centred on a target.
+
+A breadth-first search from the target cell gives every reachable cell its
+step distance; each cell then points at its lowest-distance neighbour. Any
+number of agents can follow the field by sampling the cell they stand in,
+so obstacle-aware chasing costs one BFS per rebuild plus O(1) per agent.
+"""
+import math
+from collections import deque
+from collections.abc import Iterable
+
+import numpy as np
+
+DEFAULT_CELL_SIZE = 40.0
+# 목표 셀에서 각 방향으로 펼칠 셀 수 (화면 구석의 플레이어도 화면 밖 스폰 위치를 덮도록)
+DEFAULT_RADIUS_CELLS = 24
+
+_UNREACHED = np.iinfo(np.int32).max
+
+# (dx, dy) 8방향 이웃, 앞의 4개가 상하좌우
+_NEIGHBOR_OFFSETS = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+
+class FlowField:
+    """A direction-per-cell field leading to a target around obstacles."""
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE, radius_cells: int = DEFAULT_RADIUS_CELLS):
+        self.cell_size = cell_size
+        self._inv_cell_size = 1.0 / cell_size
+        self.radius_cells = radius_cells
+        self.size = radius_cells * 2 + 1
+        self._blocked_cells: set[tuple[int, int]] = set()
+
+        # 현재 필드의 왼쪽 위 셀 좌표(전역 셀 좌표)
+        self.origin_cell = (0, 0)
+        self.distance = np.full((self.size, self.size), _UNREACHED, dtype=np.int32)
+        self.direction_x = np.zeros((self.size, self.size), dtype=np.float64)
+        self.direction_y = np.zeros((self.size, self.size), dtype=np.float64)
+        self._built = False
+
+    def set_obstacles(self, boxes: Iterable[tuple[float, float, float, float]], margin: float = 0.0) -> None:
+        """Marks the cells covered by static boxes as impassable.
+
+        Args:
+            boxes: (min_x, min_y, max_x, max_y) boxes of static obstacles.
+            margin: Extra clearance added around each box, typically the agent radius.
+        """
+        inv = self._inv_cell_size
+        blocked = set()
+        for min_x, min_y, max_x, max_y in boxes:
+            for cx in range(math.floor((min_x - margin) * inv), math.floor((max_x + margin) * inv) + 1):
+                for cy in range(math.floor((min_y - margin) * inv), math.floor((max_y + margin) * inv) + 1):
+                    blocked.add((cx, cy))
+        self._blocked_cells = blocked
+        self._built = False
+
+    def build(self, target_x: float, target_y: float) -> None:
+        """Recomputes the field for a new target position."""
+        size = self.size
+        target_cx = math.floor(target_x * self._inv_cell_size)
+        target_cy = math.floor(target_y * self._inv_cell_size)
+        origin_cx = target_cx - self.radius_cells
+        origin_cy = target_cy - self.radius_cells
+        self.origin_cell = (origin_cx, origin_cy)
+
+        passable = np.ones((size, size), dtype=bool)
+        for cx, cy in self._blocked_cells:
+            gx = cx - origin_cx
+            gy = cy - origin_cy
+            if 0 <= gx < size and 0 <= gy < size:
+                passable[gx, gy] = False
+
+        # AI-DEV : 목표 셀에서 시작하는 4방향 BFS로 거리 필드 계산
+        # - 문제: 적마다 경로 탐색을 하면 비용이 적 수 x 격자 크기
+        # - 해결책: 격자 전체를 한 번만 탐색하고 적은 자기 셀의 방향만 읽음
+        # - 주의사항: 목표 셀이 장애물 여백 안이어도 목표 셀 자체는 통과 가능으로 취급
+        distance = np.full((size, size), _UNREACHED, dtype=np.int32)
+        start = self.radius_cells
+        passable[start, start] = True
+        distance[start, start] = 0
+        queue = deque([(start, start)])
+        distance_list = distance.tolist()
+        passable_list = passable.tolist()
+        while queue:
+            gx, gy = queue.popleft()
+            next_distance = distance_list[gx][gy] + 1
+            for offset_x, offset_y in _NEIGHBOR_OFFSETS[:4]:
+                nx = gx + offset_x
+                ny = gy + offset_y
+                if 0 <= nx < size and 0 <= ny < size and passable_list[nx][ny] and distance_list[nx][ny] == _UNREACHED:
+                    distance_list[nx][ny] = next_distance
+                    queue.append((nx, ny))
+        distance = np.asarray(distance_list, dtype=np.int32)
+        self.distance = distance
+
+        # 각 셀은 8방향 이웃 중 거리가 가장 작은 셀을 가리킴 (대각선은 양옆이 모두 열려 있을 때만)
+        padded = np.full((size + 2, size + 2), _UNREACHED, dtype=np.int32)
+        padded[1:-1, 1:-1] = distance
+        open_padded = np.zeros((size + 2, size + 2), dtype=bool)
+        open_padded[1:-1, 1:-1] = distance != _UNREACHED
+
+        best = distance.copy()
+        best_x = np.zeros((size, size), dtype=np.float64)
+        best_y = np.zeros((size, size), dtype=np.float64)
+        for offset_x, offset_y in _NEIGHBOR_OFFSETS:
+            neighbor = padded[1 + offset_x:size + 1 + offset_x, 1 + offset_y:size + 1 + offset_y]
+            if offset_x and offset_y:
+                corner_open = (
+                    open_padded[1 + offset_x:size + 1 + offset_x, 1:size + 1]
+                    & open_padded[1:size + 1, 1 + offset_y:size + 1 + offset_y]
+                )
+                neighbor = np.where(corner_open, neighbor, _UNREACHED)
+            better = neighbor < best
+            best = np.where(better, neighbor, best)
+            norm = math.hypot(offset_x, offset_y)
+            best_x = np.where(better, offset_x / norm, best_x)
+            best_y = np.where(better, offset_y / norm, best_y)
+
+        self.direction_x = best_x
+        self.direction_y = best_y
+        self._built = True
+
+    def sample(self, xs: np.ndarray, ys: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Looks up the flow direction at many positions at once.
+
+        Returns:
+            ``(dir_x, dir_y, valid)`` arrays. ``valid`` is False for positions
+            outside the field, in unreachable cells and in the target cell,
+            where callers should fall back to seeking the target directly.
+        """
+        count = len(xs)
+        if not self._built or not count:
+            zeros = np.zeros(count, dtype=np.float64)
+            return zeros, zeros.copy(), np.zeros(count, dtype=bool)
+
+        gx = np.floor(np.asarray(xs) * self._inv_cell_size).astype(np.int64) - self.origin_cell[0]
+        gy = np.floor(np.asarray(ys) * self._inv_cell_size).astype(np.int64) - self.origin_cell[1]
+        inside = (gx >= 0) & (gx < self.size) & (gy >= 0) & (gy < self.size)
+        gx = np.where(inside, gx, 0)
+        gy = np.where(inside, gy, 0)
+
+        dir_x = np.where(inside, self.direction_x[gx, gy], 0.0)
+        dir_y = np.where(inside, self.direction_y[gx, gy], 0.0)
+        valid = inside & ((dir_x != 0.0) | (dir_y != 0.0))
+        return dir_x, dir_y, valid
@@ -0,0 +1,66 @@
+"""
+Distance-banded level-of-detail scheduling for per-entity updates.
+
+Entities are assigned a tier from their distance to a focus point (the
+player), and each tier updates every Nth frame. The schedule is stateless
+per entity: an entity is due when ``(frame + entity_id) % interval == 0``,
+which spreads the entities of a slow tier evenly over the frames instead of
+updating all of them on the same frame.
+"""
+from collections.abc import Sequence
+
+import numpy as np
+
+# 플레이어와의 거리 경계(픽셀)와 단계별 갱신 주기(프레임)
+DEFAULT_DISTANCE_BANDS = (350.0, 650.0)
+DEFAULT_INTERVALS = (1, 2, 4)
+
+
+class LODSchedule:
+    """Decides which entities are updated this frame and by how much time."""
+
+    def __init__(
+        self,
+        distance_bands: Sequence[float] = DEFAULT_DISTANCE_BANDS,
+        intervals: Sequence[int] = DEFAULT_INTERVALS,
+        screen_rect: tuple[float, float, float, float] | None = None,
+    ):
+        """
+        Args:
+            distance_bands: Ascending distances separating the tiers.
+            intervals: Update interval of each tier, one more than the bands.
+            screen_rect: Optional (min_x, min_y, max_x, max_y); entities outside
+                it are never put in the every-frame tier.
+        """
+        if len(intervals) != len(distance_bands) + 1:
+            raise ValueError("intervals must have one more entry than distance_bands")
+        self.distance_bands = np.asarray(distance_bands, dtype=np.float64)
+        self.intervals = np.asarray(intervals, dtype=np.int64)
+        self.screen_rect = screen_rect
+        self.frame = 0
+
+    def advance(self) -> None:
+        """Moves the schedule to the next frame."""
+        self.frame += 1
+
+    def schedule(self, entity_ids: np.ndarray, distance: np.ndarray, xs: np.ndarray | None = None, ys: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """Returns which entities are due this frame and their interval.
+
+        Args:
+            entity_ids: The entity ids, used to stagger slow tiers.
+            distance: Each entity's distance to the focus point.
+            xs: Optional x coordinates, required for the off-screen rule.
+            ys: Optional y coordinates, required for the off-screen rule.
+
+        Returns:
+            ``(due, interval)``: a boolean mask and the number of frames each
+            entity's update covers, to scale its delta time by.
+        """
+        tier = np.searchsorted(self.distance_bands, distance, side='right')
+        if self.screen_rect is not None and xs is not None and ys is not None and len(self.intervals) > 1:
+            min_x, min_y, max_x, max_y = self.screen_rect
+            offscreen = (xs < min_x) | (xs > max_x) | (ys < min_y) | (ys > max_y)
+            tier = np.where(offscreen, np.maximum(tier, 1), tier)
+        interval = self.intervals[tier]
+        due = (self.frame + np.asarray(entity_ids, dtype=np.int64)) % interval == 0
+        return due, interval
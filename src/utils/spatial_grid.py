@@ -0,0 +1,285 @@
+"""
+Uniform spatial grids for broadphase queries.
+
+``SpatialGrid`` is rebuilt from position arrays once per frame: every point
+is assigned a cell key and the keys are sorted, so the points of one grid
+column form a contiguous run that a query can slice with ``searchsorted``.
+
+``CellHash`` is updated incrementally instead and suits entities that stay
+put for many frames, such as dropped experience orbs.
+"""
+import math
+from collections.abc import Sequence
+
+import numpy as np
+
+# AI-DEV : 셀 좌표 (cx, cy)를 단일 정수 키로 인코딩
+# - 문제: 화면 밖(음수 좌표) 스폰 위치도 같은 키 공간에 들어가야 함
+# - 해결책: 오프셋을 더해 양수로 만든 뒤 cx * STRIDE + cy로 패킹
+# - 주의사항: 같은 cx에서 cy 범위는 연속된 키 범위가 되므로 열 단위 슬라이스 가능
+_CELL_OFFSET = 1 << 20
+_CELL_STRIDE = 1 << 21
+
+DEFAULT_CELL_SIZE = 64.0
+
+
+class SpatialGrid:
+    """A uniform grid over points, rebuilt from arrays every frame."""
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self._inv_cell_size = 1.0 / cell_size
+        self.ids = np.empty(0, dtype=np.int64)
+        self.xs = np.empty(0, dtype=np.float64)
+        self.ys = np.empty(0, dtype=np.float64)
+        self.radii = np.empty(0, dtype=np.float64)
+        self.max_radius = 0.0
+        self._keys = np.empty(0, dtype=np.int64)
+        self._order = np.empty(0, dtype=np.int64)
+        self._sorted_keys = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _cell_of(self, value: float) -> int:
+        return math.floor(value * self._inv_cell_size)
+
+    def rebuild(self, entity_ids: Sequence[int], xs: Sequence[float], ys: Sequence[float], radii: Sequence[float] | None = None) -> None:
+        """Replaces the grid contents with the given points.
+
+        Args:
+            entity_ids: The ids returned by queries, one per point.
+            xs: The x coordinates of the points.
+            ys: The y coordinates of the points.
+            radii: Optional collision radii, used by swept queries.
+        """
+        self.ids = np.asarray(entity_ids, dtype=np.int64)
+        self.xs = np.asarray(xs, dtype=np.float64)
+        self.ys = np.asarray(ys, dtype=np.float64)
+        if radii is None:
+            self.radii = np.zeros(len(self.ids), dtype=np.float64)
+        else:
+            self.radii = np.asarray(radii, dtype=np.float64)
+        self.max_radius = float(self.radii.max()) if len(self.radii) else 0.0
+
+        cell_x = np.floor(self.xs * self._inv_cell_size).astype(np.int64) + _CELL_OFFSET
+        cell_y = np.floor(self.ys * self._inv_cell_size).astype(np.int64) + _CELL_OFFSET
+        keys = cell_x * _CELL_STRIDE + cell_y
+
+        self._keys = keys
+        self._order = np.argsort(keys, kind='stable')
+        self._sorted_keys = keys[self._order]
+
+    def query_rect_indices(self, min_x: float, min_y: float, max_x: float, max_y: float) -> np.ndarray:
+        """Returns the indices of points in the cells overlapping a rectangle.
+
+        The result is a broadphase candidate set: points near the border of
+        the rectangle may lie outside of it.
+        """
+        if not len(self._sorted_keys):
+            return self._order[:0]
+
+        cy0 = self._cell_of(min_y) + _CELL_OFFSET
+        cy1 = self._cell_of(max_y) + _CELL_OFFSET
+        column_keys = (np.arange(self._cell_of(min_x), self._cell_of(max_x) + 1, dtype=np.int64) + _CELL_OFFSET) * _CELL_STRIDE
+        starts = np.searchsorted(self._sorted_keys, column_keys + cy0, side='left')
+        ends = np.searchsorted(self._sorted_keys, column_keys + cy1, side='right')
+
+        slices = [self._order[start:end] for start, end in zip(starts.tolist(), ends.tolist()) if end > start]
+        if not slices:
+            return self._order[:0]
+        if len(slices) == 1:
+            return slices[0]
+        return np.concatenate(slices)
+
+    def query_radius_indices(self, x: float, y: float, radius: float) -> np.ndarray:
+        """Returns the indices of points within ``radius`` of (x, y)."""
+        candidates = self.query_rect_indices(x - radius, y - radius, x + radius, y + radius)
+        dx = self.xs[candidates] - x
+        dy = self.ys[candidates] - y
+        return candidates[dx * dx + dy * dy <= radius * radius]
+
+    def query_radius(self, x: float, y: float, radius: float) -> np.ndarray:
+        """Returns the ids of points within ``radius`` of (x, y)."""
+        return self.ids[self.query_radius_indices(x, y, radius)]
+
+    def sector_indices(self, center: tuple[float, float], radius: float, angle: float, arc: float) -> np.ndarray:
+        """Returns the indices of points inside a circular sector.
+
+        Args:
+            center: The apex of the sector.
+            radius: The radius of the sector.
+            angle: The direction the sector faces, in degrees.
+            arc: The full opening angle of the sector, in degrees.
+        """
+        x, y = center
+        candidates = self.query_radius_indices(x, y, radius)
+        if arc >= 360.0 or not len(candidates):
+            return candidates
+
+        # AI-DEV : 적마다 atan2를 호출하지 않는 내적 기반 부채꼴 판정
+        # - 문제: 적마다 atan2와 각도 정규화를 수행하면 스윙이 지속되는 동안 비용 누적
+        # - 해결책: 방향 벡터와 cos(arc/2)는 쿼리당 한 번만 계산하고
+        #   dot(d, dir) >= |d| * cos(arc/2) 를 배열 연산으로 판정
+        # - 주의사항: 중심과 겹친 점(|d| = 0)은 부채꼴 안으로 취급
+        angle_rad = math.radians(angle)
+        dir_x = math.cos(angle_rad)
+        dir_y = math.sin(angle_rad)
+        cos_half_arc = math.cos(math.radians(arc) / 2)
+
+        dx = self.xs[candidates] - x
+        dy = self.ys[candidates] - y
+        dot = dx * dir_x + dy * dir_y
+        inside = dot >= np.sqrt(dx * dx + dy * dy) * cos_half_arc
+        return candidates[inside]
+
+    def entities_in_sector(self, center: tuple[float, float], radius: float, angle: float, arc: float) -> np.ndarray:
+        """Returns the ids of points inside a circular sector.
+
+        See ``sector_indices`` for the meaning of the arguments.
+        """
+        return self.ids[self.sector_indices(center, radius, angle, arc)]
+
+    def query_segment_indices(self, x0: float, y0: float, x1: float, y1: float, radius: float) -> np.ndarray:
+        """Returns the indices of points hit by a circle swept along a segment.
+
+        A point is hit when its own radius plus ``radius`` reaches the
+        segment from (x0, y0) to (x1, y1). The result is ordered by the
+        fraction of the segment at which each point is closest, so the first
+        index is the first point the swept circle reaches.
+        """
+        reach = radius + self.max_radius
+        candidates = self.query_rect_indices(min(x0, x1) - reach, min(y0, y1) - reach, max(x0, x1) + reach, max(y0, y1) + reach)
+        if not len(candidates):
+            return candidates
+
+        # AI-DEV : 선분-원 최근접점 판정으로 터널링 방지
+        # - 문제: 프레임당 이동 거리가 적 크기보다 크면 이산 판정은 적을 건너뜀
+        # - 해결책: 이동 선분 위 최근접점 t를 구해 (반지름 합)^2 과 거리 비교
+        # - 주의사항: 정지한 투사체(선분 길이 0)는 시작점 기준 원-원 판정과 동일
+        seg_x = x1 - x0
+        seg_y = y1 - y0
+        seg_len_sq = seg_x * seg_x + seg_y * seg_y
+        to_x = self.xs[candidates] - x0
+        to_y = self.ys[candidates] - y0
+        if seg_len_sq > 0.0:
+            t = np.clip((to_x * seg_x + to_y * seg_y) / seg_len_sq, 0.0, 1.0)
+        else:
+            t = np.zeros(len(candidates), dtype=np.float64)
+        dx = to_x - t * seg_x
+        dy = to_y - t * seg_y
+        reach_sq = (self.radii[candidates] + radius) ** 2
+        hit = dx * dx + dy * dy <= reach_sq
+        hit_indices = candidates[hit]
+        return hit_indices[np.argsort(t[hit], kind='stable')]
+
+    def neighbor_pairs(self, radius: float, query: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """Returns every ordered pair of distinct points within ``radius``.
+
+        Both (i, j) and (j, i) are reported, which lets callers accumulate a
+        per-point sum with a single ``np.bincount`` over the first array.
+
+        Args:
+            radius: The neighbour distance.
+            query: Optional indices of the points to find neighbours for.
+                Every point still counts as a neighbour, but only pairs
+                whose first point is in ``query`` are searched and returned.
+
+        Returns:
+            Two index arrays ``(i, j)`` into the rebuilt point arrays.
+        """
+        n = len(self._keys)
+        if n < 2 or (query is not None and not len(query)):
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+
+        # AI-DEV : 이웃 셀 탐색을 점 단위 루프 없이 배열 연산으로 전개
+        # - 문제: 점마다 이웃 셀을 조회하면 파이썬 루프 비용이 점 수에 비례
+        # - 해결책: 셀 오프셋마다 모든 점의 이웃 키를 한 번에 searchsorted 하고
+        #   repeat/arange로 (점, 후보) 쌍을 펼친 뒤 거리로 걸러냄
+        # - 주의사항: 반경이 셀 크기보다 크면 확인하는 셀 범위가 넓어짐
+        reach = math.ceil(radius * self._inv_cell_size)
+        point_indices = np.arange(n, dtype=np.int64) if query is None else np.asarray(query, dtype=np.int64)
+        point_keys = self._keys[point_indices]
+        firsts: list[np.ndarray] = []
+        seconds: list[np.ndarray] = []
+        for offset_x in range(-reach, reach + 1):
+            for offset_y in range(-reach, reach + 1):
+                neighbor_keys = point_keys + (offset_x * _CELL_STRIDE + offset_y)
+                starts = np.searchsorted(self._sorted_keys, neighbor_keys, side='left')
+                counts = np.searchsorted(self._sorted_keys, neighbor_keys, side='right') - starts
+                total = int(counts.sum())
+                if not total:
+                    continue
+                first = np.repeat(point_indices, counts)
+                run_begin = np.repeat(np.cumsum(counts) - counts, counts)
+                positions = np.repeat(starts, counts) + (np.arange(total, dtype=np.int64) - run_begin)
+                firsts.append(first)
+                seconds.append(self._order[positions])
+
+        first = np.concatenate(firsts)
+        second = np.concatenate(seconds)
+        dx = self.xs[first] - self.xs[second]
+        dy = self.ys[first] - self.ys[second]
+        keep = (first != second) & (dx * dx + dy * dy <= radius * radius)
+        return first[keep], second[keep]
+
+
+class CellHash:
+    """A grid of cells mapping to entity ids, updated on insert/remove."""
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self._inv_cell_size = 1.0 / cell_size
+        self._cells: dict[tuple[int, int], dict[int, None]] = {}
+        self._positions: dict[int, tuple[float, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, entity_id: int) -> bool:
+        return entity_id in self._positions
+
+    def _cell_of(self, x: float, y: float) -> tuple[int, int]:
+        return math.floor(x * self._inv_cell_size), math.floor(y * self._inv_cell_size)
+
+    def insert(self, entity_id: int, x: float, y: float) -> None:
+        """Adds a point, replacing any previous entry for the same id."""
+        if entity_id in self._positions:
+            self.remove(entity_id)
+        self._positions[entity_id] = (x, y)
+        self._cells.setdefault(self._cell_of(x, y), {})[entity_id] = None
+
+    def remove(self, entity_id: int) -> None:
+        """Removes a point. Unknown ids are ignored."""
+        position = self._positions.pop(entity_id, None)
+        if position is None:
+            return
+        cell_key = self._cell_of(*position)
+        cell = self._cells[cell_key]
+        del cell[entity_id]
+        if not cell:
+            del self._cells[cell_key]
+
+    def query_radius(self, x: float, y: float, radius: float) -> list[int]:
+        """Returns the ids of points within ``radius`` of (x, y)."""
+        min_cx, min_cy = self._cell_of(x - radius, y - radius)
+        max_cx, max_cy = self._cell_of(x + radius, y + radius)
+        radius_sq = radius * radius
+        positions = self._positions
+        result = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                cell = self._cells.get((cx, cy))
+                if not cell:
+                    continue
+                for entity_id in cell:
+                    px, py = positions[entity_id]
+                    if (px - x) ** 2 + (py - y) ** 2 <= radius_sq:
+                        result.append(entity_id)
+        return result
+
+    def clear(self) -> None:
+        """Removes every point."""
+        self._cells = {}
+        self._positions = {}
@@ -0,0 +1,118 @@
+"""
+Straggler recycling shared by the enemy spawners.
+
+An enemy that loses the player keeps costing AI, movement and collision
+work while adding nothing to the fight. ``StragglerTracker`` accumulates
+how long each enemy has stayed beyond a distance threshold in one array
+pass, and ``recycle_enemy`` moves a straggler back into play on a ring
+around the player, resetting its movement and AI state while keeping the
+entity, its components and its health.
+"""
+from __future__ import annotations
+import math
+import random
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from components.enemy_component import EnemyComponent
+from components.enums import EnemyState
+from components.knockback_component import KnockbackComponent
+from components.position_component import PositionComponent
+from components.velocity_component import VelocityComponent
+
+if TYPE_CHECKING:
+    from core.entity_manager import EntityManager
+
+# 플레이어와 이 거리(픽셀) 이상 떨어진 상태가 이 시간(초) 이어지면 재배치
+DEFAULT_RECYCLE_DISTANCE = 900.0
+DEFAULT_RECYCLE_DELAY = 3.0
+# 재배치 고리가 화면 가장자리 바로 바깥에 오도록 화면 반대각선에 더하는 여유
+RING_MARGIN = 64.0
+
+
+class StragglerTracker:
+    """Tracks how long each enemy has been too far from the player."""
+
+    def __init__(self, distance: float = DEFAULT_RECYCLE_DISTANCE, delay: float = DEFAULT_RECYCLE_DELAY):
+        self.distance = distance
+        self.delay = delay
+        # 엔티티 ID -> 멀리 떨어져 있던 누적 시간 (낙오 중인 적만 보관)
+        self.timers: dict[int, float] = {}
+
+    def update(
+        self,
+        entity_ids: Sequence[int],
+        xs: np.ndarray,
+        ys: np.ndarray,
+        focus_x: float,
+        focus_y: float,
+        delta_time: float,
+    ) -> np.ndarray:
+        """Advances the straggler timers and returns the indices of enemies due for recycling.
+
+        Enemies back within ``distance`` have their timer reset; enemies not
+        passed in are forgotten. The timers of returned enemies restart at zero.
+
+        Args:
+            entity_ids: The enemy entity ids.
+            xs: The x coordinates of the enemies.
+            ys: The y coordinates of the enemies.
+            focus_x: The x coordinate of the player.
+            focus_y: The y coordinate of the player.
+            delta_time: The time elapsed since the last update.
+        """
+        # AI-NOTE : 2026-10-19 낙오한 적 재활용 정책
+        # - 이유: 플레이어를 놓친 적이 사라지지 않고 자리와 갱신 비용만 차지
+        # - 요구사항: 거리 임계값 밖에 N초 머문 적은 엔티티를 그대로 두고 플레이어 근처로 되돌림
+        # - 히스토리: 스포너마다 복사된 판정 + 화면 가장자리 고정 위치로 재배치
+        #   -> 공용 추적기 + 플레이어 기준 화면 밖 고리로 재배치 (플레이어가 멀리 가도 다시 낙오하지 않음)
+        dx = np.asarray(xs, dtype=np.float64) - focus_x
+        dy = np.asarray(ys, dtype=np.float64) - focus_y
+        far = dx * dx + dy * dy > self.distance * self.distance
+        timers = np.fromiter((self.timers.get(entity_id, 0.0) for entity_id in entity_ids), dtype=np.float64, count=len(entity_ids))
+        timers = np.where(far, timers + delta_time, 0.0)
+        due = timers >= self.delay
+        timers[due] = 0.0
+
+        self.timers = {
+            entity_id: timer for entity_id, timer, is_far in zip(entity_ids, timers.tolist(), far.tolist())
+            if is_far and timer > 0.0
+        }
+        return np.flatnonzero(due)
+
+    def clear(self) -> None:
+        """Forgets every straggler timer."""
+        self.timers.clear()
+
+
+def ring_radius(screen_width: float, screen_height: float) -> float:
+    """Returns the recycle ring radius: just past the screen half-diagonal, so enemies reappear off screen."""
+    return math.hypot(screen_width, screen_height) / 2 + RING_MARGIN
+
+
+def recycle_enemy(entity_manager: EntityManager, entity_id: int, center_x: float, center_y: float, radius: float) -> None:
+    """Moves an enemy to a random point on the ring around (center_x, center_y) and resets it to just spawned.
+
+    Velocity and knockback are zeroed and the AI state restarts at SPAWNING;
+    health is kept.
+    """
+    angle = random.uniform(0.0, math.tau)
+    pos = entity_manager.get_component(entity_id, PositionComponent)
+    pos.x = center_x + radius * math.cos(angle)
+    pos.y = center_y + radius * math.sin(angle)
+
+    velocity = entity_manager.get_component(entity_id, VelocityComponent)
+    if velocity:
+        velocity.dx = 0.0
+        velocity.dy = 0.0
+    knockback = entity_manager.get_component(entity_id, KnockbackComponent)
+    if knockback:
+        knockback.vx = 0.0
+        knockback.vy = 0.0
+    enemy_comp = entity_manager.get_component(entity_id, EnemyComponent)
+    if enemy_comp:
+        enemy_comp.current_state = EnemyState.SPAWNING
+        enemy_comp.state_timer = 0.0
+        enemy_comp.attack_resolved = False
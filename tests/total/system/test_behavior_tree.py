@@ -0,0 +1,77 @@
+import os
+import sys
+
+# Add the src directory to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..', 'src')))
+
+from components.enums import BTStatus
+from utils.behavior_tree import action, compile_tree, condition, cooldown, selector, sequence
+
+
+class TestBehaviorTree:
+    def test_실행중_자식부터_재개하고_앞선_자식은_재평가하지_않음_성공_시나리오(self) -> None:
+        """1. 시퀀스가 RUNNING 자식에서 멈췄다가 다음 틱에 그 자식부터 재개 (성공 시나리오)
+
+        목적: 컴파일된 복합 노드의 RUNNING 조기 종료와 재개 검증
+        테스트할 범위: compile_tree, sequence, condition, action
+        커버하는 함수 및 데이터: BehaviorTree.tick, 에이전트별 memory 슬롯
+        기대되는 안정성: 오래 걸리는 행동 중에는 앞선 조건을 매 틱 다시 호출하지 않음
+        """
+        # Given - 조건 -> 2틱 동안 RUNNING인 행동 -> 마지막 행동
+        calls = {"check": 0, "finish": 0}
+
+        def check(context: dict) -> bool:
+            calls["check"] += 1
+            return True
+
+        def charge(context: dict) -> BTStatus:
+            context["ticks"] += 1
+            return BTStatus.SUCCESS if context["ticks"] >= 3 else BTStatus.RUNNING
+
+        def finish(context: dict) -> BTStatus:
+            calls["finish"] += 1
+            return BTStatus.SUCCESS
+
+        tree = compile_tree(sequence(condition(check), action(charge), action(finish)))
+        context = {"ticks": 0}
+        memory = tree.new_memory()
+
+        # When - 3틱 실행
+        results = [tree.tick(context, memory, 0.0) for _ in range(3)]
+
+        # Then - RUNNING, RUNNING, SUCCESS, 조건은 첫 틱에만 평가
+        assert results == [BTStatus.RUNNING, BTStatus.RUNNING, BTStatus.SUCCESS], "실행중 자식 완료 후 성공해야 함"
+        assert calls["check"] == 1, "RUNNING 재개 중에는 앞선 조건을 다시 평가하지 않아야 함"
+        assert calls["finish"] == 1, "마지막 행동은 한 번만 실행되어야 함"
+
+        # Then - 완료 후에는 처음부터 다시 평가
+        context["ticks"] = 0
+        tree.tick(context, memory, 0.0)
+        assert calls["check"] == 2, "완료된 시퀀스는 다음 틱에 처음부터 시작해야 함"
+
+    def test_선택자_대체_행동과_쿨다운_에이전트별_메모리_성공_시나리오(self) -> None:
+        """2. 쿨다운 중에는 선택자가 대체 행동을 고르고, 에이전트마다 쿨다운이 분리됨 (성공 시나리오)
+
+        목적: 하나의 컴파일된 트리를 여러 에이전트가 각자 메모리로 공유하는지 검증
+        테스트할 범위: selector, cooldown, BehaviorTree.new_memory
+        커버하는 함수 및 데이터: cooldown 준비 시각 슬롯
+        기대되는 안정성: 한 보스의 쿨다운이 다른 보스에게 영향을 주지 않음
+        """
+        # Given - 2초 쿨다운 공격, 실패 시 대기
+        tree = compile_tree(selector(
+            cooldown(2.0, action(lambda log: log.append("attack") or BTStatus.SUCCESS)),
+            action(lambda log: log.append("idle") or BTStatus.SUCCESS),
+        ))
+        first_log: list[str] = []
+        second_log: list[str] = []
+        first_memory = tree.new_memory()
+        second_memory = tree.new_memory()
+
+        # When - 첫 번째 에이전트는 0, 1, 2초에 틱, 두 번째는 1초에 처음 틱
+        for now in (0.0, 1.0, 2.0):
+            tree.tick(first_log, first_memory, now)
+        tree.tick(second_log, second_memory, 1.0)
+
+        # Then
+        assert first_log == ["attack", "idle", "attack"], "쿨다운 동안은 대체 행동, 끝나면 다시 공격해야 함"
+        assert second_log == ["attack"], "다른 에이전트의 쿨다운은 공유되지 않아야 함"
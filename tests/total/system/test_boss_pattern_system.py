@@ -0,0 +1,135 @@
+import os
+import sys
+
+import numpy as np
+
+# Add the src directory to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..', 'src')))
+
+from components.enemy_component import EnemyComponent
+from components.enums import EnemyState, EnemyType, GameEvent
+from components.health_component import HealthComponent
+from components.player_component import PlayerComponent
+from components.position_component import PositionComponent
+from core.entity_manager import EntityManager
+from core.event_bus import EventBus
+from entities.principal_boss import BossAttackPattern, BossPhase
+from systems.boss_pattern_system import BossPatternSystem
+from utils.bullet_pool import BulletPool
+
+
+class TestBossPatternSystem:
+    def _add_player(self, entity_manager: EntityManager, x: float, y: float) -> int:
+        player = entity_manager.create_entity()
+        entity_manager.add_component(player.id, PlayerComponent())
+        entity_manager.add_component(player.id, PositionComponent(x=x, y=y))
+        entity_manager.add_component(player.id, HealthComponent(base_maximum=150, current=150, maximum=150))
+        return player.id
+
+    def test_탄환_풀_용량_초과와_만료_슬롯_재사용_성공_시나리오(self) -> None:
+        """1. 용량을 넘는 탄환은 버리고 만료된 슬롯은 다시 사용 (성공 시나리오)
+
+        목적: BulletPool이 미리 할당한 배열 안에서만 탄환을 관리하는지 검증
+        테스트할 범위: BulletPool.spawn/update/release
+        커버하는 함수 및 데이터: active, lifetime, 빈 슬롯 스택
+        기대되는 안정성: 가득 찬 풀에 발사해도 예외 없이 남는 탄환만 버려짐
+        """
+        # Given - 용량 8의 풀
+        pool = BulletPool(capacity=8)
+
+        # When - 수명이 다른 탄환 6개 + 6개 발사
+        first = pool.spawn(0.0, 0.0, np.ones(6), np.zeros(6), 1.0, 5, 4.0)
+        second = pool.spawn(0.0, 0.0, np.ones(6), np.zeros(6), 10.0, 5, 4.0)
+
+        # Then - 2개만 추가되고, 짧은 수명 탄환이 만료되면 그 슬롯을 재사용
+        assert len(first) == 6 and len(second) == 2, "남은 슬롯만큼만 발사되어야 함"
+        assert len(pool) == 8, "풀이 가득 차야 함"
+        pool.update(2.0)
+        assert len(pool) == 2, "수명이 다한 탄환은 회수되어야 함"
+        assert pool.x[second].tolist() == [2.0, 2.0], "살아 있는 탄환은 속도 x 시간만큼 이동해야 함"
+        reused = pool.spawn(0.0, 0.0, np.ones(3), np.zeros(3), 1.0, 5, 4.0)
+        assert set(reused.tolist()) <= set(first.tolist()), "회수된 슬롯을 다시 사용해야 함"
+
+    def test_교장선생님_원형_탄막_발사_성공_시나리오(self) -> None:
+        """2. 쿨다운이 끝난 교장선생님이 원형 탄막을 균등 간격으로 발사 (성공 시나리오)
+
+        목적: 패턴 선택 결과가 방향 테이블 기반 원형 탄막으로 풀에 들어가는지 검증
+        테스트할 범위: BossPatternSystem.update, spawn_enemy
+        커버하는 함수 및 데이터: BulletPool.vx/vy, pb_circular_bullet_count/speed
+        기대되는 안정성: 모든 탄환 속력이 같고 인접 탄환 각도 차이가 일정함
+        """
+        # Given - 멀리 있는 플레이어와 추적 상태의 교장선생님
+        entity_manager = EntityManager()
+        self._add_player(entity_manager, 700, 500)
+        pool = BulletPool()
+        system = BossPatternSystem(pool, 800, 600)
+        boss_id = system.spawn_enemy(entity_manager, EnemyType.PRINCIPAL, 100, 100)
+        entity_manager.get_component(boss_id, EnemyComponent).current_state = EnemyState.CHASING
+
+        # When - 원형 탄막 쿨다운(3.0)만 지나고 추적 미사일 쿨다운(5.0)은 남은 시점
+        system.update(entity_manager, 3.5)
+
+        # Then
+        live = pool.active_indices()
+        assert len(live) == 12, "원형 탄막 12발이 발사되어야 함"
+        speeds = np.hypot(pool.vx[live], pool.vy[live])
+        assert np.allclose(speeds, 8.0), "모든 탄환이 같은 속력이어야 함"
+        angles = np.sort(np.arctan2(pool.vy[live], pool.vx[live]))
+        assert np.allclose(np.diff(angles), 2 * np.pi / 12), "탄환 간격이 균등해야 함"
+
+    def test_탄환_플레이어_적중_피해와_무적_성공_시나리오(self) -> None:
+        """3. 플레이어에 닿은 탄환은 피해를 주고 회수됨 (성공 시나리오)
+
+        목적: 풀 전체를 한 번에 플레이어와 판정하고 접촉 피해 규칙을 따르는지 검증
+        테스트할 범위: BossPatternSystem.update
+        커버하는 함수 및 데이터: HealthComponent.current, PlayerComponent.is_invulnerable
+        기대되는 안정성: 같은 프레임에 여러 발이 닿아도 피해는 한 번만 적용
+        """
+        # Given - 플레이어 위에 겹친 탄환 3발과 멀리 있는 탄환 1발
+        entity_manager = EntityManager()
+        player_id = self._add_player(entity_manager, 400, 300)
+        pool = BulletPool()
+        system = BossPatternSystem(pool, 800, 600)
+        pool.spawn(np.array([400.0, 405.0, 395.0]), 300.0, np.zeros(3), np.zeros(3), 10.0, 15, 6.0)
+        pool.spawn(100.0, 100.0, np.zeros(1), np.zeros(1), 10.0, 15, 6.0)
+
+        # When
+        system.update(entity_manager, 0.1)
+
+        # Then
+        health = entity_manager.get_component(player_id, HealthComponent)
+        player_comp = entity_manager.get_component(player_id, PlayerComponent)
+        assert health.current == 135, "가장 큰 피해 한 번만 적용되어야 함"
+        assert player_comp.is_invulnerable, "피해 후 충돌 무적이 적용되어야 함"
+        assert len(pool) == 1, "닿은 탄환만 회수되어야 함"
+
+    def test_체력_변화_이벤트로_페이즈와_쿨다운_갱신_성공_시나리오(self) -> None:
+        """4. HEALTH_CHANGED 이벤트가 70%/30% 경계를 넘을 때만 페이즈 전환 (성공 시나리오)
+
+        목적: 보스가 체력을 폴링하지 않고 이벤트로 페이즈와 쿨다운 캐시를 갱신하는지 검증
+        테스트할 범위: EventBus.publish, BossPatternSystem 구독, PrincipalBoss.on_health_changed
+        커버하는 함수 및 데이터: get_current_phase, _get_pattern_cooldown, 사용 가능한 패턴 목록
+        기대되는 안정성: 이벤트 없이 체력만 바뀌면 캐시된 페이즈가 유지됨
+        """
+        # Given - 이벤트 버스에 연결된 시스템과 체력 100의 교장선생님
+        entity_manager = EntityManager()
+        bus = EventBus()
+        system = BossPatternSystem(BulletPool(), 800, 600, event_bus=bus)
+        boss_id = system.spawn_enemy(entity_manager, EnemyType.PRINCIPAL, 100, 100, health=100)
+        boss = system.bosses[boss_id]
+        health = entity_manager.get_component(boss_id, HealthComponent)
+
+        # When/Then - 경계를 넘지 않는 변화는 페이즈 유지
+        health.current = 80
+        bus.publish(GameEvent.HEALTH_CHANGED, boss_id, health.current, health.maximum)
+        assert boss.get_current_phase() == BossPhase.PHASE_1, "80%는 페이즈 1이어야 함"
+
+        # When/Then - 이벤트 없이 체력만 바뀌면 캐시 유지
+        health.current = 20
+        assert boss.get_current_phase() == BossPhase.PHASE_1, "이벤트 전에는 페이즈를 다시 계산하지 않아야 함"
+
+        # When/Then - 30% 경계를 넘는 이벤트로 페이즈 3, 쿨다운 40% 단축
+        bus.publish(GameEvent.HEALTH_CHANGED, boss_id, health.current, health.maximum)
+        assert boss.get_current_phase() == BossPhase.PHASE_3, "20%는 페이즈 3이어야 함"
+        assert abs(boss._get_pattern_cooldown(BossAttackPattern.CIRCULAR_BULLETS) - 1.8) < 1e-9, "페이즈 3 쿨다운 배율 0.6이 적용되어야 함"
+        assert BossAttackPattern.SUMMON_MINIONS in boss._pattern_queue, "페이즈 3에서 졸병 소환이 추가되어야 함"
@@ -0,0 +1,78 @@
+import os
+import sys
+
+import numpy as np
+
+# Add the src directory to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..', 'src')))
+
+from components.enemy_component import EnemyComponent
+from components.enums import EnemyState, EnemyType, GameEvent
+from components.health_component import HealthComponent
+from components.player_component import PlayerComponent
+from components.position_component import PositionComponent
+from core.entity_manager import EntityManager
+from core.event_bus import EventBus
+from systems.cone_attack_system import ConeAttackSystem
+
+
+class TestConeAttackSystem:
+    def test_부채꼴_일괄_판정_범위와_각도_성공_시나리오(self) -> None:
+        """1. 여러 부채꼴을 한 번의 배열 연산으로 판정 (성공 시나리오)
+
+        목적: 거리와 내적 기반 부채꼴 포함 판정이 정확한지 검증
+        테스트할 범위: ConeAttackSystem.cone_hits
+        커버하는 함수 및 데이터: 공격 방향 단위 벡터, cos(반각)
+        기대되는 안정성: 범위 밖이나 반각(45도) 밖의 대상은 맞지 않음
+        """
+        # Given - 원점의 플레이어를 향한/비껴간/등진/멀리 있는 부채꼴 4개
+        xs = np.array([-50.0, -50.0, -50.0, -200.0])
+        ys = np.array([0.0, -60.0, 0.0, 0.0])
+        facing_x = np.array([1.0, 1.0, -1.0, 1.0])
+        facing_y = np.array([0.0, 0.0, 0.0, 0.0])
+
+        # When
+        hits = ConeAttackSystem.cone_hits(xs, ys, facing_x, facing_y, 0.0, 0.0, 80.0, np.cos(np.radians(45.0)))
+
+        # Then
+        assert hits.tolist() == [True, False, False, False], "정면 범위 안의 부채꼴만 맞혀야 함"
+
+    def test_공격_준비_완료_시_한_번만_피해와_이벤트_발행_성공_시나리오(self) -> None:
+        """2. 준비 시간이 끝난 국어선생님의 공격은 한 번만 판정되고 적중 시 이벤트 발행 (성공 시나리오)
+
+        목적: 공격 준비 1회당 판정 1회, 적중 시에만 피해와 HEALTH_CHANGED 발행 검증
+        테스트할 범위: ConeAttackSystem.update
+        커버하는 함수 및 데이터: EnemyComponent.attack_resolved/facing_x, HealthComponent.current
+        기대되는 안정성: 같은 공격이 여러 프레임에 걸쳐 중복 피해를 주지 않음
+        """
+        # Given - 플레이어와 그 왼쪽 50px에서 플레이어를 향해 준비 중인 국어선생님
+        entity_manager = EntityManager()
+        player = entity_manager.create_entity()
+        entity_manager.add_component(player.id, PlayerComponent())
+        entity_manager.add_component(player.id, PositionComponent(x=400, y=300))
+        entity_manager.add_component(player.id, HealthComponent(base_maximum=100, current=100, maximum=100))
+        teacher = entity_manager.create_entity()
+        enemy_comp = EnemyComponent(enemy_type=EnemyType.KOREAN_TEACHER, current_state=EnemyState.ATTACKING, state_timer=1.0)
+        entity_manager.add_component(teacher.id, enemy_comp)
+        entity_manager.add_component(teacher.id, PositionComponent(x=350, y=300))
+        bus = EventBus()
+        events = []
+        bus.subscribe(GameEvent.HEALTH_CHANGED, lambda *args: events.append(args))
+        system = ConeAttackSystem(event_bus=bus)
+        health = entity_manager.get_component(player.id, HealthComponent)
+        player_comp = entity_manager.get_component(player.id, PlayerComponent)
+
+        # When/Then - 준비 중에는 판정하지 않음
+        system.update(entity_manager, 0.1)
+        assert health.current == 100 and not events, "준비 시간 전에는 피해가 없어야 함"
+
+        # When/Then - 준비 완료 후 한 번 적중
+        enemy_comp.state_timer = 1.6
+        system.update(entity_manager, 0.1)
+        assert health.current == 85, "국어선생님 공격 데미지 15가 적용되어야 함"
+        assert events == [(player.id, 85, 100)], "적중 시 HEALTH_CHANGED가 한 번 발행되어야 함"
+
+        # When/Then - 무적이 풀려도 같은 공격은 다시 판정하지 않음
+        player_comp.is_invulnerable = False
+        system.update(entity_manager, 0.1)
+        assert health.current == 85, "같은 공격은 한 번만 판정되어야 함"
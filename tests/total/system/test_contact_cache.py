@@ -0,0 +1,182 @@
+import os
+import sys
+
+import pygame
+
+# Add the src directory to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..', 'src')))
+
+from components.attack_component import AttackComponent
+from components.enemy_component import EnemyComponent
+from components.enums import EnemyType, EntityStatus, ObstacleType
+from components.health_component import HealthComponent
+from components.hitbox_component import HitboxComponent
+from components.position_component import PositionComponent
+from components.projectile_component import ProjectileComponent
+from components.velocity_component import VelocityComponent
+from components.sprite_component import SpriteComponent
+from core.contact_cache import ContactCache
+from core.entity_manager import EntityManager
+from entities.obstacles import create_obstacle
+from systems.collision_system import CollisionSystem
+from systems.movement_system import MovementSystem
+from systems.obstacle_system import ObstacleSystem
+
+
+class TestContactCache:
+    def test_접촉_enter_stay_exit_이벤트_순서_성공_시나리오(self) -> None:
+        """1. 프레임 간 접촉 상태에 따른 이벤트 발생 검증 (성공 시나리오)
+
+        목적: 같은 쌍이 처음 접촉, 유지, 분리될 때 각 이벤트가 한 번씩 발생
+        테스트할 범위: ContactCache.begin_frame/add_contact/end_frame
+        커버하는 함수 및 데이터: on_enter, on_stay, on_exit 콜백
+        기대되는 안정성: 유지 중인 접촉은 enter 이벤트를 다시 만들지 않음
+        """
+        # Given - 이벤트를 기록하는 캐시
+        cache = ContactCache()
+        events: list[tuple[str, int, int]] = []
+        cache.on_enter(lambda a, b: events.append(('enter', a, b)))
+        cache.on_stay(lambda a, b: events.append(('stay', a, b)))
+        cache.on_exit(lambda a, b: events.append(('exit', a, b)))
+
+        # When - 두 프레임 접촉 후 한 프레임 분리
+        for _ in range(2):
+            cache.begin_frame()
+            cache.add_contact(1, 2)
+            cache.end_frame()
+        cache.begin_frame()
+        cache.end_frame()
+
+        # Then - enter -> stay -> exit 순서로 발생
+        assert events == [('enter', 1, 2), ('stay', 1, 2), ('exit', 1, 2)], "접촉 이벤트 순서가 올바르지 않음"
+        assert len(cache) == 0, "분리 후에는 캐시에 접촉이 남지 않아야 함"
+
+
+class TestHitboxContact:
+    def _create_enemy(self, entity_manager: EntityManager, x: float, y: float) -> int:
+        enemy = entity_manager.create_entity()
+        entity_manager.add_component(enemy.id, PositionComponent(x=x, y=y))
+        entity_manager.add_component(enemy.id, EnemyComponent(enemy_type=EnemyType.KOREAN_TEACHER))
+        entity_manager.add_component(enemy.id, HealthComponent(base_maximum=100, current=100, maximum=100, status=EntityStatus.ALIVE))
+        rect = pygame.Rect(0, 0, 30, 30)
+        rect.center = (x, y)
+        entity_manager.add_component(enemy.id, SpriteComponent(surface=pygame.Surface((30, 30)), rect=rect))
+        return enemy.id
+
+    def test_히트박스_지속중_같은_적_1회만_데미지_성공_시나리오(self) -> None:
+        """2. 히트박스가 여러 프레임 유지되어도 접촉 1회당 데미지 1번 (성공 시나리오)
+
+        목적: 야구방망이 히트박스가 무적 타이머 없이 중복 데미지를 방지하는지 검증
+        테스트할 범위: CollisionSystem.handle_hitbox_enemy_collisions
+        커버하는 함수 및 데이터: hitbox_contacts, HealthComponent.current
+        기대되는 안정성: 0.3초 무적이 끝난 뒤에도 같은 접촉으로 재타격하지 않음
+        """
+        # Given - 적 하나를 덮는 360도 히트박스
+        entity_manager = EntityManager()
+        collision_system = CollisionSystem(800, 600)
+        enemy_id = self._create_enemy(entity_manager, 150, 100)
+        hitbox = entity_manager.create_entity()
+        entity_manager.add_component(hitbox.id, PositionComponent(x=100, y=100))
+        entity_manager.add_component(hitbox.id, AttackComponent(damage=10))
+        entity_manager.add_component(hitbox.id, HitboxComponent(width=120, height=360, angle=0, duration=5.0))
+
+        # When - 무적 시간보다 긴 시간 동안 여러 프레임 처리
+        for _ in range(10):
+            collision_system.update(entity_manager, 0.1)
+
+        # Then - 데미지는 한 번만 적용
+        health = entity_manager.get_component(enemy_id, HealthComponent)
+        assert health.current == 90, "같은 접촉에서는 한 번만 데미지를 받아야 함"
+
+    def test_빠른_투사체_한_틱에_적_통과시_적중_성공_시나리오(self) -> None:
+        """3. 한 틱 이동 거리가 적 크기보다 커도 스윕 판정으로 적중 (성공 시나리오)
+
+        목적: 낮은 시뮬레이션 주기에서 투사체 터널링이 발생하지 않는지 검증
+        테스트할 범위: MovementSystem.integrate, CollisionSystem.handle_weapon_enemy_collisions
+        커버하는 함수 및 데이터: SpatialGrid.query_segment_indices, ProjectileComponent.prev_x/prev_y
+        기대되는 안정성: 비관통 투사체는 이동 경로상 첫 번째 적에게만 데미지
+        """
+        # Given - 이동 경로에 적 두 마리, 이번 틱에 두 적을 모두 지나친 투사체
+        entity_manager = EntityManager()
+        collision_system = CollisionSystem(800, 600)
+        near_enemy_id = self._create_enemy(entity_manager, 200, 100)
+        far_enemy_id = self._create_enemy(entity_manager, 300, 100)
+        projectile = entity_manager.create_entity()
+        entity_manager.add_component(projectile.id, PositionComponent(x=100, y=100))
+        entity_manager.add_component(projectile.id, VelocityComponent(dx=300, dy=0))
+        entity_manager.add_component(projectile.id, AttackComponent(damage=10))
+        entity_manager.add_component(projectile.id, ProjectileComponent())
+        entity_manager.add_component(projectile.id, SpriteComponent(surface=pygame.Surface((15, 15)), rect=pygame.Rect(392, 92, 15, 15)))
+
+        # When - (100, 100)에서 (400, 100)으로 이동한 뒤 이동 경로 스윕 판정
+        MovementSystem().update(entity_manager, 1.0)
+        collision_system.update(entity_manager, 1.0)
+
+        # Then - 첫 번째 적만 맞고 투사체는 소멸
+        assert entity_manager.get_component(near_enemy_id, HealthComponent).current == 90, "경로상 첫 적이 맞아야 함"
+        assert entity_manager.get_component(far_enemy_id, HealthComponent).current == 100, "비관통 투사체는 두 번째 적을 맞히지 않아야 함"
+        assert projectile.id not in entity_manager.entities, "비관통 투사체는 적중 후 소멸해야 함"
+
+    def test_투사체와_히트박스_같은_프레임_각각_데미지_성공_시나리오(self) -> None:
+        """4. 서로 다른 공격원은 같은 적을 같은 프레임에 각각 타격 (성공 시나리오)
+
+        목적: 적 전역 무적 없이 공격원별 적중 기록만으로 중복 데미지를 막는지 검증
+        테스트할 범위: CollisionSystem.update
+        커버하는 함수 및 데이터: ProjectileComponent.hit_enemies, HitboxComponent.hit_enemies
+        기대되는 안정성: 투사체 적중이 야구방망이 타격을 막지 않음
+        """
+        # Given - 적을 관통하는 투사체와 적을 덮는 히트박스
+        entity_manager = EntityManager()
+        collision_system = CollisionSystem(800, 600)
+        enemy_id = self._create_enemy(entity_manager, 150, 100)
+        projectile = entity_manager.create_entity()
+        entity_manager.add_component(projectile.id, PositionComponent(x=150, y=100))
+        entity_manager.add_component(projectile.id, VelocityComponent(dx=0, dy=0))
+        entity_manager.add_component(projectile.id, AttackComponent(damage=10))
+        entity_manager.add_component(projectile.id, ProjectileComponent(pierce=3))
+        entity_manager.add_component(projectile.id, SpriteComponent(surface=pygame.Surface((15, 15)), rect=pygame.Rect(142, 92, 15, 15)))
+        hitbox = entity_manager.create_entity()
+        entity_manager.add_component(hitbox.id, PositionComponent(x=100, y=100))
+        entity_manager.add_component(hitbox.id, AttackComponent(damage=10))
+        entity_manager.add_component(hitbox.id, HitboxComponent(width=120, height=360, angle=0, duration=5.0))
+
+        # When - 여러 프레임 동안 겹친 상태로 처리
+        for _ in range(5):
+            collision_system.update(entity_manager, 0.1)
+
+        # Then - 공격원마다 정확히 한 번씩 데미지
+        assert entity_manager.get_component(enemy_id, HealthComponent).current == 80, "투사체와 히트박스가 각각 한 번씩 데미지를 줘야 함"
+        assert entity_manager.get_component(projectile.id, ProjectileComponent).hit_enemies == {enemy_id}, "투사체 적중 기록에 적이 있어야 함"
+
+    def test_장애물_반사_직후_이동_전_위치부터_스윕_성공_시나리오(self) -> None:
+        """5. 장애물 반사로 속도가 뒤집힌 프레임에도 실제 이동 경로만 스윕 (성공 시나리오)
+
+        목적: 스윕 시작점을 속도로 역산하지 않고 이동 전 위치에서 잡는지 검증
+        테스트할 범위: MovementSystem.integrate, ObstacleSystem.update, CollisionSystem.update
+        커버하는 함수 및 데이터: ProjectileComponent.prev_x/prev_y
+        기대되는 안정성: 반사 후 투사체 앞쪽(지나가지 않은 곳)의 적은 맞지 않음
+        """
+        # Given - 오른쪽으로 날아가다 기둥(500, 100)에 부딪힐 투사체, 지나온 경로와 반대편의 적
+        entity_manager = EntityManager()
+        create_obstacle(entity_manager, ObstacleType.PILLAR, 500, 100)
+        obstacle_system = ObstacleSystem()
+        obstacle_system.build(entity_manager)
+        collision_system = CollisionSystem(800, 600)
+        passed_enemy_id = self._create_enemy(entity_manager, 250, 100)
+        ahead_enemy_id = self._create_enemy(entity_manager, 650, 100)
+        projectile = entity_manager.create_entity()
+        entity_manager.add_component(projectile.id, PositionComponent(x=180, y=100))
+        entity_manager.add_component(projectile.id, VelocityComponent(dx=300, dy=0))
+        entity_manager.add_component(projectile.id, AttackComponent(damage=10))
+        entity_manager.add_component(projectile.id, ProjectileComponent(pierce=1, bounces=1))
+        entity_manager.add_component(projectile.id, SpriteComponent(surface=pygame.Surface((15, 15)), rect=pygame.Rect(0, 0, 15, 15)))
+
+        # When - 이동, 기둥 반사(속도 반전), 충돌 판정 순서로 한 프레임
+        MovementSystem().update(entity_manager, 1.0)
+        obstacle_system.update(entity_manager, 1.0)
+        collision_system.update(entity_manager, 1.0)
+
+        # Then - 지나온 적만 맞고, 뒤집힌 속도로 역산한 반대편 적은 맞지 않음
+        assert entity_manager.get_component(projectile.id, VelocityComponent).dx < 0, "기둥에 부딪힌 투사체는 반사되어야 함"
+        assert entity_manager.get_component(passed_enemy_id, HealthComponent).current == 90, "이동 경로상의 적은 맞아야 함"
+        assert entity_manager.get_component(ahead_enemy_id, HealthComponent).current == 100, "지나가지 않은 반대편 적은 맞지 않아야 함"
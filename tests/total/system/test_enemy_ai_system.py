@@ -0,0 +1,82 @@
+import os
+import sys
+
+# Add the src directory to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..', 'src')))
+
+from components.enemy_component import EnemyComponent
+from components.enums import EnemyState, EnemyType
+from components.player_component import PlayerComponent
+from components.position_component import PositionComponent
+from components.velocity_component import VelocityComponent
+from core.entity_manager import EntityManager
+from systems.enemy_ai_system import EnemyAISystem
+from utils.lod import LODSchedule
+
+
+class TestEnemyAISystem:
+    def _setup(self, enemy_type: EnemyType, enemy_x: float) -> tuple[EntityManager, int]:
+        entity_manager = EntityManager()
+        player = entity_manager.create_entity()
+        entity_manager.add_component(player.id, PlayerComponent())
+        entity_manager.add_component(player.id, PositionComponent(x=400, y=300))
+        enemy = entity_manager.create_entity()
+        entity_manager.add_component(enemy.id, PositionComponent(x=enemy_x, y=300))
+        entity_manager.add_component(enemy.id, VelocityComponent(dx=0, dy=0))
+        entity_manager.add_component(enemy.id, EnemyComponent(enemy_type=enemy_type, speed=4.0))
+        return entity_manager, enemy.id
+
+    def test_수학선생님_돌진_기절_추적_상태_순환_성공_시나리오(self) -> None:
+        """1. 수학선생님이 돌진 범위에서 돌진 -> 기절 -> 추적으로 전이 (성공 시나리오)
+
+        목적: 전이 테이블의 조건과 진입 동작(돌진 속도, 쿨다운)이 적용되는지 검증
+        테스트할 범위: EnemyAISystem.update
+        커버하는 함수 및 데이터: EnemyComponent.current_state/state_timer/attack_cooldown
+        기대되는 안정성: 쿨다운 중에는 돌진 범위 안이어도 다시 돌진하지 않음
+        """
+        # Given - 플레이어에게서 100px 떨어진 수학선생님
+        entity_manager, enemy_id = self._setup(EnemyType.MATH_TEACHER, 300)
+        ai_system = EnemyAISystem()
+        enemy_comp = entity_manager.get_component(enemy_id, EnemyComponent)
+        velocity = entity_manager.get_component(enemy_id, VelocityComponent)
+
+        # When & Then - 스폰 지연 후 추적, 다음 프레임 돌진
+        ai_system.update(entity_manager, 0.5)
+        assert enemy_comp.current_state == EnemyState.CHASING, "스폰 지연 후 추적 상태여야 함"
+        ai_system.update(entity_manager, 0.1)
+        assert enemy_comp.current_state == EnemyState.ATTACKING, "돌진 범위 안에서는 돌진해야 함"
+        assert velocity.dx == 12.0, "돌진 속도는 speed x 돌진 배수로 플레이어를 향해야 함"
+
+        # When & Then - 돌진 시간 후 기절, 기절 시간 후 쿨다운을 가진 추적
+        ai_system.update(entity_manager, 1.0)
+        assert enemy_comp.current_state == EnemyState.STUNNED, "돌진이 끝나면 기절해야 함"
+        assert velocity.dx == 0.0, "기절 중에는 멈춰야 함"
+        ai_system.update(entity_manager, 0.3)
+        assert enemy_comp.current_state == EnemyState.CHASING, "기절이 끝나면 추적해야 함"
+        assert enemy_comp.attack_cooldown == 3.0, "추적 복귀 시 돌진 쿨다운이 설정되어야 함"
+        ai_system.update(entity_manager, 0.1)
+        assert enemy_comp.current_state == EnemyState.CHASING, "쿨다운 중에는 다시 돌진하지 않아야 함"
+
+    def test_원거리_적_LOD_주기_갱신_성공_시나리오(self) -> None:
+        """2. 먼 적은 갱신 주기마다 한 번, 주기만큼 늘어난 시간으로 갱신 (성공 시나리오)
+
+        목적: LODSchedule이 먼 적의 갱신 빈도를 낮추면서도 타이머 누적 시간은 보존하는지 검증
+        테스트할 범위: EnemyAISystem.update, LODSchedule.schedule
+        커버하는 함수 및 데이터: EnemyComponent.state_timer
+        기대되는 안정성: 4프레임 동안 건너뛴 시간과 갱신 프레임의 시간 합이 매 프레임 갱신과 같음
+        """
+        # Given - 플레이어에게서 700px 떨어진 (가장 느린 단계) 국어선생님
+        entity_manager, enemy_id = self._setup(EnemyType.KOREAN_TEACHER, 1100)
+        ai_system = EnemyAISystem(lod=LODSchedule(distance_bands=(350, 650), intervals=(1, 2, 4)))
+        enemy_comp = entity_manager.get_component(enemy_id, EnemyComponent)
+
+        # When - 8프레임 갱신
+        timers = [enemy_comp.state_timer]
+        for _ in range(8):
+            ai_system.update(entity_manager, 0.01)
+            timers.append(enemy_comp.state_timer)
+
+        # Then - 4프레임마다 한 번, 0.04씩 증가
+        increments = [after - before for before, after in zip(timers, timers[1:]) if after != before]
+        assert len(increments) == 2, "8프레임 중 두 번만 갱신되어야 함"
+        assert all(abs(increment - 0.04) < 1e-9 for increment in increments), "갱신 시 주기(4) x dt 만큼 타이머가 증가해야 함"
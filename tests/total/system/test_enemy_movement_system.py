@@ -0,0 +1,83 @@
+import os
+import sys
+
+import numpy as np
+
+# Add the src directory to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..', 'src')))
+
+from components.enemy_component import EnemyComponent
+from components.enums import EnemyType
+from components.player_component import PlayerComponent
+from components.position_component import PositionComponent
+from components.velocity_component import VelocityComponent
+from core.entity_manager import EntityManager
+from systems.enemy_movement_system import EnemyMovementSystem
+from utils.lod import LODSchedule
+
+
+class TestEnemyMovementSystem:
+    def _setup(self, enemy_xs: list[float]) -> tuple[EntityManager, list[int]]:
+        entity_manager = EntityManager()
+        player = entity_manager.create_entity()
+        entity_manager.add_component(player.id, PlayerComponent())
+        entity_manager.add_component(player.id, PositionComponent(x=400, y=300))
+        enemy_ids = []
+        for enemy_x in enemy_xs:
+            enemy = entity_manager.create_entity()
+            entity_manager.add_component(enemy.id, PositionComponent(x=enemy_x, y=300))
+            entity_manager.add_component(enemy.id, VelocityComponent(dx=0.0, dy=-7.0))
+            entity_manager.add_component(enemy.id, EnemyComponent(enemy_type=EnemyType.KOREAN_TEACHER, speed=4.0))
+            enemy_ids.append(enemy.id)
+        return entity_manager, enemy_ids
+
+    def test_추적_방향과_적별_속력_성공_시나리오(self) -> None:
+        """1. 적마다 자신의 속력으로 목표를 향하고, 목표 위의 적은 멈춤 (성공 시나리오)
+
+        목적: 배열 기반 추적 조향이 방향 정규화와 적별 속력을 올바르게 적용하는지 검증
+        테스트할 범위: EnemyMovementSystem.compute_seek
+        커버하는 함수 및 데이터: pos_x/pos_y/speed 배열
+        기대되는 안정성: 목표와 같은 위치의 적은 NaN 없이 속도 0
+        """
+        # Given - 목표(100, 100) 왼쪽, 위쪽, 대각선, 정확히 목표 위에 있는 적
+        pos_x = np.array([0.0, 100.0, 70.0, 100.0])
+        pos_y = np.array([100.0, 40.0, 60.0, 100.0])
+        speed = np.array([2.0, 3.0, 5.0, 4.0])
+
+        # When
+        vel_x, vel_y = EnemyMovementSystem.compute_seek(pos_x, pos_y, speed, 100.0, 100.0)
+
+        # Then - 목표 방향, 각자의 속력, 목표 위의 적은 0
+        assert np.isfinite(vel_x).all() and np.isfinite(vel_y).all(), "목표 위의 적이 있어도 NaN이 생기지 않아야 함"
+        assert np.allclose(vel_x[:3], [2.0, 0.0, 3.0]) and np.allclose(vel_y[:3], [0.0, 3.0, 4.0]), "목표를 향하는 단위 방향 x 속력이어야 함"
+        assert np.allclose(np.hypot(vel_x[:3], vel_y[:3]), speed[:3]), "적마다 자신의 속력을 유지해야 함"
+        assert vel_x[3] == 0.0 and vel_y[3] == 0.0, "목표 위의 적은 멈춰야 함"
+
+    def test_LOD_차례가_아닌_적_조향_생략_성공_시나리오(self) -> None:
+        """2. LOD 갱신 차례가 아닌 먼 적은 조향 계산에서 빠지고 직전 속도를 유지 (성공 시나리오)
+
+        목적: 이동 LOD가 속도 기록뿐 아니라 추적/분리 조향 계산 자체를 건너뛰는지 검증
+        테스트할 범위: EnemyMovementSystem.update, LODSchedule.schedule
+        커버하는 함수 및 데이터: compute_seek 입력 배열, VelocityComponent.dx/dy
+        기대되는 안정성: 차례가 아닌 적의 속도는 그대로이고 조향 입력에도 포함되지 않음
+        """
+        # Given - 플레이어에게서 50px(매 프레임 단계), 700px(사실상 갱신되지 않는 단계) 떨어진 적
+        entity_manager, (near_id, far_id) = self._setup([350, 1100])
+        system = EnemyMovementSystem(lod=LODSchedule(distance_bands=(100.0,), intervals=(1, 10**9)))
+        steered_xs = []
+        compute_seek = system.compute_seek
+
+        def recording_seek(pos_x, pos_y, speed, target_x, target_y):
+            steered_xs.extend(pos_x.tolist())
+            return compute_seek(pos_x, pos_y, speed, target_x, target_y)
+        system.compute_seek = recording_seek
+
+        # When
+        system.update(entity_manager, 0.016)
+
+        # Then - 가까운 적만 조향, 먼 적은 직전 속도 유지
+        assert steered_xs == [350.0], "갱신 차례인 적만 조향 계산에 들어가야 함"
+        near_velocity = entity_manager.get_component(near_id, VelocityComponent)
+        assert near_velocity.dx == 4.0 and near_velocity.dy == 0.0, "가까운 적은 플레이어를 향해야 함"
+        far_velocity = entity_manager.get_component(far_id, VelocityComponent)
+        assert far_velocity.dx == 0.0 and far_velocity.dy == -7.0, "차례가 아닌 적의 속도는 바뀌지 않아야 함"
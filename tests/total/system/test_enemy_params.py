@@ -0,0 +1,41 @@
+import dataclasses
+import os
+import sys
+
+import pytest
+
+# Add the src directory to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..', 'src')))
+
+from components.enemy_component import EnemyComponent
+from components.enemy_params import ENEMY_PARAMS, MathTeacherParams
+from components.enums import EnemyType
+from core.entity_manager import EntityManager
+from entities.enemy import Enemy
+
+
+class TestEnemyParams:
+    def test_타입별_매개변수_테이블_공유와_불변성_성공_시나리오(self) -> None:
+        """1. 같은 타입의 적은 하나의 불변 매개변수 테이블을 공유 (성공 시나리오)
+
+        목적: 적별 딕셔너리 대신 타입 인덱스로 공유 테이블을 참조하는지 검증
+        테스트할 범위: EnemyComponent.params, Enemy.params, ENEMY_PARAMS
+        커버하는 함수 및 데이터: MathTeacherParams
+        기대되는 안정성: 한 적에서 매개변수를 바꾸려 해도 다른 적에 영향 없음 (변경 불가)
+        """
+        # Given - 팩토리로 생성한 수학선생님 2명
+        entity_manager = EntityManager()
+        first = Enemy.create_enemy_by_type(EnemyType.MATH_TEACHER)
+        second = Enemy.create_enemy_by_type(EnemyType.MATH_TEACHER)
+        first_comp = entity_manager.get_component(first.create_entity(entity_manager, 0, 0).id, EnemyComponent)
+        second_comp = entity_manager.get_component(second.create_entity(entity_manager, 0, 0).id, EnemyComponent)
+
+        # Then - 같은 테이블 객체를 참조
+        assert first_comp.params is second_comp.params is ENEMY_PARAMS[EnemyType.MATH_TEACHER], "같은 타입은 테이블을 공유해야 함"
+        assert isinstance(first.params, MathTeacherParams), "엔티티 객체도 같은 타입 테이블을 반환해야 함"
+        assert first_comp.params.dash_speed_multiplier == 3.0, "기존 돌진 배수 값이 유지되어야 함"
+        assert not hasattr(first_comp.params, '__dict__'), "slots 테이블이어야 함"
+
+        # When & Then - 변경 시도는 거부됨
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first_comp.params.dash_speed_multiplier = 10.0
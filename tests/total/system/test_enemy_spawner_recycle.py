@@ -0,0 +1,102 @@
+import math
+import os
+import sys
+
+import pytest
+
+# Add the src directory to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..', 'src')))
+
+from components.enemy_component import EnemyComponent
+from components.enums import EnemyState, EnemyType
+from components.player_component import PlayerComponent
+from components.position_component import PositionComponent
+from components.velocity_component import VelocityComponent
+from core.entity_manager import EntityManager
+from entities.enemy import Enemy
+from systems.enemy_spawner import EnemySpawner
+from systems.enemy_spawner_system import EnemySpawnerSystem
+from utils.straggler import ring_radius
+
+
+class TestEnemySpawnerRecycle:
+    def test_낙오한_적을_같은_엔티티로_스폰_위치에_재배치_성공_시나리오(self) -> None:
+        """1. 멀리 떨어진 상태가 RECYCLE_DELAY 동안 이어진 적만 재배치 (성공 시나리오)
+
+        목적: 낙오한 적을 파괴/생성 없이 스폰 위치 풀로 옮기는지 검증
+        테스트할 범위: EnemySpawner._recycle_stragglers, StragglerTracker.update, recycle_enemy
+        커버하는 함수 및 데이터: 재배치 거리/지연 시간, 플레이어 주변 재배치 고리
+        기대되는 안정성: 가까이 돌아온 적은 낙오 시간이 초기화되고, 재배치 후에도 엔티티 ID 유지
+        """
+        # Given - 화면 중앙의 플레이어, 멀리 있는 적과 가까운 적
+        entity_manager = EntityManager()
+        player = entity_manager.create_entity()
+        entity_manager.add_component(player.id, PlayerComponent())
+        entity_manager.add_component(player.id, PositionComponent(x=400, y=300))
+        spawner = EnemySpawner(entity_manager)
+        far_enemy = Enemy.create_enemy_by_type(EnemyType.MATH_TEACHER)
+        far_entity = far_enemy.create_entity(entity_manager, 2000, 300)
+        near_enemy = Enemy.create_enemy_by_type(EnemyType.KOREAN_TEACHER)
+        near_entity = near_enemy.create_entity(entity_manager, 450, 300)
+        spawner.active_enemies.extend([far_enemy, near_enemy])
+        far_comp = entity_manager.get_component(far_entity.id, EnemyComponent)
+        far_comp.current_state = EnemyState.CHASING
+        entity_count = len(entity_manager.entities)
+
+        # When/Then - 지연 시간 전에는 그대로
+        spawner._recycle_stragglers(2.0)
+        far_pos = entity_manager.get_component(far_entity.id, PositionComponent)
+        assert far_pos.x == 2000, "지연 시간 전에는 재배치하지 않아야 함"
+
+        # When - 지연 시간 도달
+        spawner._recycle_stragglers(1.5)
+
+        # Then - 플레이어 주변 고리로 이동, 상태 초기화, 엔티티는 재사용
+        assert math.hypot(far_pos.x - 400, far_pos.y - 300) == pytest.approx(spawner.recycle_radius), "플레이어 주변 고리로 옮겨져야 함"
+        assert far_comp.current_state == EnemyState.SPAWNING, "생성 직후 상태로 초기화되어야 함"
+        assert len(entity_manager.entities) == entity_count, "엔티티를 새로 만들거나 지우지 않아야 함"
+        assert entity_manager.get_component(near_entity.id, PositionComponent).x == 450, "가까운 적은 그대로여야 함"
+        assert spawner.total_recycled == 1 and not spawner.stragglers.timers, "재배치 후 낙오 시간이 정리되어야 함"
+
+    def test_게임_루프_스포너는_멀리_간_플레이어_주변으로_재배치_성공_시나리오(self) -> None:
+        """2. main.py가 사용하는 EnemySpawnerSystem은 원점에서 먼 플레이어 주변 화면 밖으로 재배치 (성공 시나리오)
+
+        목적: 재배치 위치가 화면 좌표가 아닌 플레이어 위치 기준이라 재배치된 적이 다시 낙오하지 않는지 검증
+        테스트할 범위: EnemySpawnerSystem._recycle_stragglers, StragglerTracker.update, recycle_enemy
+        커버하는 함수 및 데이터: ring_radius, 낙오 시간, VelocityComponent, EnemyComponent.current_state
+        기대되는 안정성: 가까운 적은 그대로이고, 재배치된 적은 같은 엔티티로 멈춘 채 생성 직후 상태
+        """
+        # Given - 원점에서 5000px 떨어진 플레이어, 화면 근처에 남겨진 적과 플레이어 가까이의 적
+        entity_manager = EntityManager()
+        player = entity_manager.create_entity()
+        entity_manager.add_component(player.id, PlayerComponent())
+        entity_manager.add_component(player.id, PositionComponent(x=5000, y=4000))
+        spawner_system = EnemySpawnerSystem(800, 600)
+        enemy_ids = []
+        for enemy_x, enemy_y in ((400, 300), (5050, 4000)):
+            enemy = entity_manager.create_entity()
+            entity_manager.add_component(enemy.id, PositionComponent(x=enemy_x, y=enemy_y))
+            entity_manager.add_component(enemy.id, VelocityComponent(dx=5.0, dy=0.0))
+            entity_manager.add_component(enemy.id, EnemyComponent(enemy_type=EnemyType.KOREAN_TEACHER, current_state=EnemyState.CHASING))
+            enemy_ids.append(enemy.id)
+        far_id, near_id = enemy_ids
+        far_pos = entity_manager.get_component(far_id, PositionComponent)
+
+        # When/Then - 지연 시간 전에는 그대로
+        spawner_system._recycle_stragglers(entity_manager, 2.0)
+        assert far_pos.x == 400, "지연 시간 전에는 재배치하지 않아야 함"
+
+        # When - 지연 시간 도달 후 한참 더 진행
+        spawner_system._recycle_stragglers(entity_manager, 1.5)
+        recycled_at = (far_pos.x, far_pos.y)
+        for _ in range(10):
+            spawner_system._recycle_stragglers(entity_manager, 1.0)
+
+        # Then - 플레이어 주변 화면 밖 고리에 머물고 다시 재배치되지 않음
+        distance = math.hypot(far_pos.x - 5000, far_pos.y - 4000)
+        assert distance == pytest.approx(ring_radius(800, 600)), "플레이어 주변 고리로 옮겨져야 함"
+        assert distance > math.hypot(400, 300), "재배치 위치는 화면 밖이어야 함"
+        assert (far_pos.x, far_pos.y) == recycled_at and spawner_system.total_recycled == 1, "재배치된 적은 다시 낙오하지 않아야 함"
+        assert entity_manager.get_component(far_id, VelocityComponent).dx == 0.0, "재배치된 적은 멈춰야 함"
+        assert entity_manager.get_component(far_id, EnemyComponent).current_state == EnemyState.SPAWNING, "생성 직후 상태로 초기화되어야 함"
+        assert entity_manager.get_component(near_id, PositionComponent).x == 5050, "가까운 적은 그대로여야 함"
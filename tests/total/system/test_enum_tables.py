@@ -0,0 +1,45 @@
+import os
+import sys
+
+# Add the src directory to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..', 'src')))
+
+from components import enum_tables
+from components.enums import EnemyState, EnemyType, EntityStatus, ItemID, ItemType, ObstacleType, PhysicsBodyType
+
+
+class TestEnumTables:
+    def test_열거형_메타데이터_테이블_크기와_값_조회_성공_시나리오(self) -> None:
+        """1. 모든 테이블이 열거형 멤버 수와 일치하고 프로퍼티가 같은 객체를 반환 (성공 시나리오)
+
+        목적: 열거형 프로퍼티가 모듈 로드 시 만든 튜플을 인덱싱하는지 검증
+        테스트할 범위: components.enum_tables, EnemyType/ItemID 프로퍼티
+        커버하는 함수 및 데이터: ENEMY_*, ITEM_*, OBSTACLE_* 테이블
+        기대되는 안정성: 열거형 멤버가 추가되었는데 테이블을 빠뜨리면 이 테스트가 실패
+        """
+        # Given - 열거형별 테이블
+        tables = {
+            EntityStatus: [enum_tables.ENTITY_STATUS_NAMES],
+            EnemyType: [
+                enum_tables.ENEMY_TYPE_NAMES, enum_tables.ENEMY_BASE_SPEEDS, enum_tables.ENEMY_BASE_HEALTHS,
+                enum_tables.ENEMY_BASE_ATTACK_POWERS, enum_tables.ENEMY_BASE_EXPERIENCE_YIELDS,
+            ],
+            EnemyState: [enum_tables.ENEMY_STATE_NAMES],
+            ItemID: [enum_tables.ITEM_NAMES, enum_tables.ITEM_TYPE_VALUES],
+            PhysicsBodyType: [enum_tables.PHYSICS_BODY_TYPE_NAMES],
+            ObstacleType: [enum_tables.OBSTACLE_NAMES, enum_tables.OBSTACLE_SIZES, enum_tables.OBSTACLE_COLORS],
+        }
+
+        # Then - 크기 일치
+        for enum_class, enum_tables_of_class in tables.items():
+            for table in enum_tables_of_class:
+                assert isinstance(table, tuple), f"{enum_class.__name__} 테이블은 불변 튜플이어야 함"
+                assert len(table) == len(enum_class), f"{enum_class.__name__} 테이블 크기가 멤버 수와 같아야 함"
+
+        # Then - 기존 값 유지, 호출마다 같은 객체 반환 (새로 만들지 않음)
+        assert EnemyType.PRINCIPAL.base_health == 150, "교장선생님 기본 체력은 150이어야 함"
+        assert EnemyType.MATH_TEACHER.display_name == "수학선생님", "표시 이름이 유지되어야 함"
+        assert ItemID.BASEBALL_BAT.item_type is ItemType.WEAPON, "야구 배트는 무기여야 함"
+        assert ItemID.MAGNET.item_type is ItemType.ABILITY, "자석은 능력 아이템이어야 함"
+        assert ItemID.EXPERIENCE_ORB.item_type is ItemType.MISC, "경험치 구슬은 기타여야 함"
+        assert ObstacleType.DESK.size is ObstacleType.DESK.size, "크기 튜플은 매번 같은 객체여야 함"
@@ -0,0 +1,55 @@
+import os
+import sys
+
+import pygame
+
+# Add the src directory to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..', 'src')))
+
+from components.position_component import PositionComponent
+from components.player_component import PlayerComponent
+from components.sprite_component import SpriteComponent
+from components.velocity_component import VelocityComponent
+from core.entity_manager import EntityManager
+from systems.collision_system import CollisionSystem
+from systems.movement_system import MovementSystem
+
+
+class TestExpOrbMagnet:
+    def _create_player(self, entity_manager: EntityManager, x: float, y: float) -> int:
+        player = entity_manager.create_entity()
+        entity_manager.add_component(player.id, PositionComponent(x=x, y=y))
+        entity_manager.add_component(player.id, PlayerComponent())
+        rect = pygame.Rect(0, 0, 50, 50)
+        rect.center = (x, y)
+        entity_manager.add_component(player.id, SpriteComponent(surface=pygame.Surface((50, 50)), rect=rect))
+        return player.id
+
+    def test_획득_반경_내_구슬만_끌려와_수집_성공_시나리오(self) -> None:
+        """1. 획득 반경 안의 구슬은 끌려와 수집되고 밖의 구슬은 남음 (성공 시나리오)
+
+        목적: 자석 수집이 반경 쿼리로 대상 구슬만 골라 끌어당기는지 검증
+        테스트할 범위: CollisionSystem.handle_player_item_collisions
+        커버하는 함수 및 데이터: orb_index, attracted_orbs, PlayerComponent.pickup_radius
+        기대되는 안정성: 반경 밖 구슬은 속도가 붙지 않고 경험치도 지급되지 않음
+        """
+        # Given - 반경 안(거리 70)과 밖(거리 300)의 구슬
+        entity_manager = EntityManager()
+        collision_system = CollisionSystem(800, 600)
+        movement_system = MovementSystem()
+        player_id = self._create_player(entity_manager, 400, 300)
+        collision_system._create_exp_orb(entity_manager, 470, 300, 10)
+        collision_system._create_exp_orb(entity_manager, 100, 300, 20)
+        far_orb_id = max(entity_manager.entities)
+
+        # When - 충분한 프레임 동안 수집/이동 처리
+        for _ in range(60):
+            collision_system.update(entity_manager, 0.3)
+            movement_system.update(entity_manager, 0.3)
+
+        # Then - 가까운 구슬만 수집
+        player_comp = entity_manager.get_component(player_id, PlayerComponent)
+        assert player_comp.experience == 10, "획득 반경 안의 구슬만 수집되어야 함"
+        assert far_orb_id in entity_manager.entities, "반경 밖 구슬은 남아 있어야 함"
+        assert not entity_manager.has_component(far_orb_id, VelocityComponent), "반경 밖 구슬은 끌려오지 않아야 함"
+        assert len(collision_system.attracted_orbs) == 0, "수집된 구슬은 끌려오는 목록에서 제거되어야 함"
@@ -0,0 +1,45 @@
+import os
+import sys
+
+import numpy as np
+
+# Add the src directory to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..', 'src')))
+
+from components.enemy_component import EnemyComponent
+from components.enums import EnemyType, MovementMode
+from systems.enemy_movement_system import EnemyMovementSystem
+
+
+class TestFlocking:
+    def test_군집_모드_정렬과_응집_반영_성공_시나리오(self) -> None:
+        """1. 군집 모드 적은 이웃 방향으로 속도가 휘고, 추적 모드 적은 그대로 (성공 시나리오)
+
+        목적: 보이드 정렬/응집이 군집 모드 적에만 적용되고 속력은 유지되는지 검증
+        테스트할 범위: EnemyMovementSystem.apply_flocking, EnemyComponent.movement_mode
+        커버하는 함수 및 데이터: flock_grid 이웃 쌍, bincount 합산
+        기대되는 안정성: 이웃이 없는 적이나 추적 모드 적의 속도는 바뀌지 않음
+        """
+        # Given - 기본 이동 방식: 수학선생님만 군집
+        assert EnemyComponent(enemy_type=EnemyType.MATH_TEACHER).movement_mode == MovementMode.FLOCK, "수학선생님 기본값은 군집이어야 함"
+        assert EnemyComponent(enemy_type=EnemyType.KOREAN_TEACHER).movement_mode == MovementMode.SEEK, "국어선생님 기본값은 추적이어야 함"
+
+        # Given - 오른쪽으로 추적 중인 3명: 0, 1은 위아래로 붙은 군집, 2는 군집 옆의 추적 모드
+        system = EnemyMovementSystem()
+        pos_x = np.array([0.0, 0.0, 10.0, 1000.0])
+        pos_y = np.array([0.0, 60.0, 30.0, 1000.0])
+        prev_x = np.zeros(4)
+        prev_y = np.array([0.0, 0.0, 4.0, 0.0])
+        speed = np.full(4, 4.0)
+        seek_x = np.full(4, 4.0)
+        seek_y = np.zeros(4)
+        flocking = np.array([True, True, False, True])
+
+        # When
+        vel_x, vel_y = system.apply_flocking([1, 2, 3, 4], pos_x, pos_y, prev_x, prev_y, speed, seek_x, seek_y, flocking)
+
+        # Then - 0은 아래(1 쪽), 1은 위(0 쪽)로 응집, 속력은 유지
+        assert vel_y[0] > 0.0 and vel_y[1] < 0.0, "군집 적은 서로를 향해 모여야 함"
+        assert np.allclose(np.hypot(vel_x[:2], vel_y[:2]), 4.0), "군집 조향 후에도 속력이 유지되어야 함"
+        assert vel_x[2] == 4.0 and vel_y[2] == 0.0, "추적 모드 적은 군집에 영향받지 않아야 함"
+        assert vel_x[3] == 4.0 and vel_y[3] == 0.0, "이웃이 없는 군집 적은 추적 속도를 유지해야 함"
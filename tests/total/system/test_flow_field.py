@@ -0,0 +1,40 @@
+import os
+import sys
+
+import numpy as np
+
+# Add the src directory to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..', 'src')))
+
+from utils.flow_field import FlowField
+
+
+class TestFlowField:
+    def test_흐름장_따라_벽을_돌아_목표_도달_성공_시나리오(self) -> None:
+        """1. 흐름장을 따라가면 벽을 통과하지 않고 목표에 도달 (성공 시나리오)
+
+        목적: BFS 거리 필드와 방향 샘플링이 장애물을 우회하는 경로를 만드는지 검증
+        테스트할 범위: FlowField.set_obstacles, FlowField.build, FlowField.sample
+        커버하는 함수 및 데이터: 목표와 적 사이를 가로막는 세로 벽
+        기대되는 안정성: 이동 중 벽 안으로 들어가지 않고, 목표 셀에서는 valid=False
+        """
+        # Given - 목표(400, 300)와 적(200, 300) 사이의 세로 벽
+        wall = (300.0, 100.0, 340.0, 500.0)
+        flow_field = FlowField(cell_size=20.0, radius_cells=20)
+        flow_field.set_obstacles([wall])
+        flow_field.build(400.0, 300.0)
+        x, y = 200.0, 300.0
+
+        # When - 흐름장 방향으로 조금씩 이동
+        for _ in range(400):
+            dir_x, dir_y, valid = flow_field.sample(np.array([x]), np.array([y]))
+            if not valid[0]:
+                break
+            x += float(dir_x[0]) * 5.0
+            y += float(dir_y[0]) * 5.0
+
+            # Then - 벽 안으로 들어가지 않음
+            assert not (wall[0] <= x <= wall[2] and wall[1] <= y <= wall[3]), "흐름장을 따라가면 벽을 통과해서는 안 됨"
+
+        # Then - 목표 셀에 도달
+        assert abs(x - 400.0) <= 20.0 and abs(y - 300.0) <= 20.0, "흐름장을 따라 목표 셀에 도달해야 함"
@@ -0,0 +1,37 @@
+import math
+import os
+import sys
+
+import numpy as np
+
+# Add the src directory to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..', 'src')))
+
+from systems.homing_missile_system import HomingMissileSystem
+from utils.bullet_pool import BulletPool
+
+
+class TestHomingMissileSystem:
+    def test_회전율_제한_유도와_직진탄_유지_성공_시나리오(self) -> None:
+        """1. 유도탄은 회전율만큼만 목표 쪽으로 돌고 직진탄은 그대로 (성공 시나리오)
+
+        목적: 모든 유도탄의 각도 차를 한 번에 제한하여 방향을 바꾸는지 검증
+        테스트할 범위: HomingMissileSystem.steer
+        커버하는 함수 및 데이터: BulletPool.vx/vy/turn_rate
+        기대되는 안정성: 회전 후에도 속력 유지, 목표 반대편(-179도)에서도 가까운 쪽으로 회전
+        """
+        # Given - 원점의 목표, 오른쪽으로 날아가는 유도탄 2발과 직진탄 1발
+        pool = BulletPool(capacity=8)
+        missiles = pool.spawn(np.array([-100.0, 100.0]), np.array([1.0, -1.0]), np.full(2, 6.0), np.zeros(2), 10.0, 20, 8.0, turn_rate=2.0)
+        straight = pool.spawn(-100.0, 0.0, np.ones(1), np.zeros(1), 10.0, 15, 6.0)
+
+        # When - 최대 회전각 0.2 rad
+        HomingMissileSystem.steer(pool, 0.0, 0.0, 0.1)
+
+        # Then
+        behind_heading = math.atan2(pool.vy[missiles[0]], pool.vx[missiles[0]])
+        assert abs(behind_heading) < 0.02, "목표 방향과의 작은 각도 차는 그대로 보정되어야 함"
+        ahead_heading = math.atan2(pool.vy[missiles[1]], pool.vx[missiles[1]])
+        assert abs(ahead_heading - 0.2) < 1e-9, "뒤쪽 목표는 가까운 방향(위)으로 회전율만큼만 돌아야 함"
+        assert np.allclose(np.hypot(pool.vx[missiles], pool.vy[missiles]), 6.0), "회전 후에도 속력이 유지되어야 함"
+        assert pool.vx[straight[0]] == 1.0 and pool.vy[straight[0]] == 0.0, "직진탄은 방향이 바뀌지 않아야 함"
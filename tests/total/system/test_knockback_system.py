@@ -0,0 +1,94 @@
+import os
+import sys
+
+import pygame
+
+# Add the src directory to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..', 'src')))
+
+from components.attack_component import AttackComponent
+from components.enemy_component import EnemyComponent
+from components.enums import EnemyType
+from components.health_component import HealthComponent
+from components.hitbox_component import HitboxComponent
+from components.knockback_component import KnockbackComponent
+from components.position_component import PositionComponent
+from components.sprite_component import SpriteComponent
+from components.velocity_component import VelocityComponent
+from core.entity_manager import EntityManager
+from systems.collision_system import CollisionSystem
+from systems.knockback_system import KnockbackSystem
+
+
+class TestKnockbackSystem:
+    def test_충격량_합산_감쇠_이동_후_정지_성공_시나리오(self) -> None:
+        """1. 같은 프레임의 충격량은 합산되고, 감쇠하며 v/damping만큼 밀린 뒤 멈춤 (성공 시나리오)
+
+        목적: 충격량 큐를 배열로 합산하고 지수 감쇠로 적분하는지 검증
+        테스트할 범위: KnockbackSystem.add_impulse/update
+        커버하는 함수 및 데이터: KnockbackComponent.vx/mass/damping, active 목록
+        기대되는 안정성: 무거운 적은 덜 밀리고, 멈춘 적은 더 이상 처리하지 않음
+        """
+        # Given - 질량 1과 질량 6인 두 적
+        entity_manager = EntityManager()
+        light = entity_manager.create_entity()
+        entity_manager.add_component(light.id, PositionComponent(x=0.0, y=0.0))
+        entity_manager.add_component(light.id, KnockbackComponent(mass=1.0, damping=4.0))
+        heavy = entity_manager.create_entity()
+        entity_manager.add_component(heavy.id, PositionComponent(x=0.0, y=0.0))
+        entity_manager.add_component(heavy.id, KnockbackComponent(mass=6.0, damping=4.0))
+        system = KnockbackSystem()
+
+        # When - 가벼운 적은 같은 방향으로 두 번(길이가 다른 방향 벡터), 무거운 적은 한 번
+        system.add_impulse(light.id, 3.0, 0.0, 30.0)
+        system.add_impulse(light.id, 0.5, 0.0, 30.0)
+        system.add_impulse(heavy.id, 0.0, 2.0, 60.0)
+        system.update(entity_manager, 0.25)
+
+        # Then - 합산된 충격량이 질량으로 나뉘어 반영
+        light_knockback = entity_manager.get_component(light.id, KnockbackComponent)
+        assert entity_manager.get_component(light.id, PositionComponent).x > 0.0, "충격 방향으로 밀려야 함"
+        assert light_knockback.vx < 60.0, "속도는 감쇠되어야 함"
+
+        # When - 충분히 오래 진행
+        for _ in range(60):
+            system.update(entity_manager, 0.25)
+
+        # Then - 총 이동 거리는 충격량 / (질량 * 감쇠율), 멈추면 활성 목록에서 제거
+        assert abs(entity_manager.get_component(light.id, PositionComponent).x - 60.0 / 4.0) < 0.05, "가벼운 적은 약 15px 밀려야 함"
+        assert abs(entity_manager.get_component(heavy.id, PositionComponent).y - 10.0 / 4.0) < 0.05, "무거운 적은 약 2.5px 밀려야 함"
+        assert not system.active, "멈춘 적은 더 이상 처리하지 않아야 함"
+
+    def test_히트박스_적중시_바깥쪽으로_넉백_성공_시나리오(self) -> None:
+        """2. 무기 적중 시 충돌 시스템이 충격량을 쌓고 넉백 시스템이 적을 밀어냄 (성공 시나리오)
+
+        목적: 충돌 처리는 충격량 추가만 하고 이동은 넉백 시스템이 담당하는지 검증
+        테스트할 범위: CollisionSystem(knockback=...), KnockbackSystem.update
+        커버하는 함수 및 데이터: CollisionSystem.KNOCKBACK_IMPULSE, PositionComponent
+        기대되는 안정성: 적중 프레임에는 위치가 바뀌지 않고 다음 넉백 갱신에서 이동
+        """
+        # Given - 히트박스 오른쪽의 적
+        entity_manager = EntityManager()
+        knockback_system = KnockbackSystem()
+        collision_system = CollisionSystem(800, 600, knockback=knockback_system)
+        enemy = entity_manager.create_entity()
+        entity_manager.add_component(enemy.id, EnemyComponent(enemy_type=EnemyType.KOREAN_TEACHER))
+        entity_manager.add_component(enemy.id, PositionComponent(x=150, y=100))
+        entity_manager.add_component(enemy.id, VelocityComponent(dx=0, dy=0))
+        entity_manager.add_component(enemy.id, HealthComponent(base_maximum=100, current=100, maximum=100))
+        entity_manager.add_component(enemy.id, KnockbackComponent())
+        entity_manager.add_component(enemy.id, SpriteComponent(surface=pygame.Surface((30, 30)), rect=pygame.Rect(135, 85, 30, 30)))
+        hitbox = entity_manager.create_entity()
+        entity_manager.add_component(hitbox.id, PositionComponent(x=100, y=100))
+        entity_manager.add_component(hitbox.id, AttackComponent(damage=10))
+        entity_manager.add_component(hitbox.id, HitboxComponent(width=120, height=360, angle=0, duration=5.0))
+
+        # When
+        collision_system.update(entity_manager, 0.1)
+        enemy_pos = entity_manager.get_component(enemy.id, PositionComponent)
+        x_after_hit = enemy_pos.x
+        knockback_system.update(entity_manager, 0.25)
+
+        # Then
+        assert x_after_hit == 150, "충돌 처리 중에는 위치를 직접 바꾸지 않아야 함"
+        assert enemy_pos.x > 150 and abs(enemy_pos.y - 100) < 1e-9, "히트박스 중심에서 바깥쪽으로 밀려야 함"
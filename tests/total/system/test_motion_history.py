@@ -0,0 +1,75 @@
+import os
+import sys
+
+# Add the src directory to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..', 'src')))
+
+from components.enemy_component import EnemyComponent
+from components.enums import EnemyState, EnemyType
+from components.motion_history_component import MotionHistoryComponent
+from components.player_component import PlayerComponent
+from components.position_component import PositionComponent
+from components.velocity_component import VelocityComponent
+from core.entity_manager import EntityManager
+from systems.enemy_ai_system import EnemyAISystem
+from systems.motion_history_system import MotionHistorySystem
+
+
+class TestMotionHistory:
+    def test_링버퍼_순서와_평활_속도_예측_성공_시나리오(self) -> None:
+        """1. 용량을 넘겨 기록해도 최신 위치 순서와 속도 예측이 유지됨 (성공 시나리오)
+
+        목적: MotionHistoryComponent가 고정 크기 버퍼로 최근 위치를 보관하고 속도를 평활하는지 검증
+        테스트할 범위: MotionHistoryComponent.push/predict/recent_positions
+        커버하는 함수 및 데이터: positions, velocity_x, velocity_y
+        기대되는 안정성: 등속 이동이 계속되면 평활 속도가 실제 속도로 수렴
+        """
+        # Given - 용량 4의 기록
+        history = MotionHistoryComponent(capacity=4)
+
+        # When - x 방향으로 dt 0.5마다 5px씩 30번 이동 (속도 10)
+        for step in range(30):
+            history.push(step * 5.0, 100.0, 0.5)
+
+        # Then
+        assert history.recent_positions()[:, 0].tolist() == [130.0, 135.0, 140.0, 145.0], "가장 오래된 것부터 최근 4개 위치여야 함"
+        assert abs(history.velocity_x - 10.0) < 1e-3, "평활 속도가 실제 속도로 수렴해야 함"
+        predicted_x, predicted_y = history.predict(2.0)
+        assert abs(predicted_x - 165.0) < 1e-2 and predicted_y == 100.0, "예측 위치는 마지막 위치 + 속도 x 선행 시간이어야 함"
+
+    def test_수학선생님_돌진이_플레이어_이동_방향을_선행_성공_시나리오(self) -> None:
+        """2. 위로 이동하는 플레이어를 향한 돌진은 위쪽으로 치우침 (성공 시나리오)
+
+        목적: 돌진 진입 시 플레이어 이동 기록으로 선행 조준하는지 검증
+        테스트할 범위: MotionHistorySystem.update, EnemyAISystem._on_enter_state
+        커버하는 함수 및 데이터: VelocityComponent.dx/dy
+        기대되는 안정성: 돌진 속력은 선행 조준과 무관하게 speed x 돌진 배수
+        """
+        # Given - 위쪽으로 이동 중인 플레이어와 왼쪽 100px의 수학선생님
+        entity_manager = EntityManager()
+        player = entity_manager.create_entity()
+        entity_manager.add_component(player.id, PlayerComponent())
+        player_pos = PositionComponent(x=400, y=300)
+        entity_manager.add_component(player.id, player_pos)
+        entity_manager.add_component(player.id, MotionHistoryComponent())
+        enemy = entity_manager.create_entity()
+        entity_manager.add_component(enemy.id, PositionComponent(x=300, y=300))
+        entity_manager.add_component(enemy.id, VelocityComponent(dx=0, dy=0))
+        entity_manager.add_component(enemy.id, EnemyComponent(enemy_type=EnemyType.MATH_TEACHER, speed=4.0))
+        history_system = MotionHistorySystem()
+        for _ in range(20):
+            player_pos.y -= 1.0
+            history_system.update(entity_manager, 0.25)
+        player_pos.y = 300
+
+        # When - 스폰 지연 후 추적, 다음 프레임 돌진
+        ai_system = EnemyAISystem()
+        ai_system.update(entity_manager, 0.5)
+        ai_system.update(entity_manager, 0.1)
+
+        # Then
+        enemy_comp = entity_manager.get_component(enemy.id, EnemyComponent)
+        velocity = entity_manager.get_component(enemy.id, VelocityComponent)
+        assert enemy_comp.current_state == EnemyState.ATTACKING, "돌진 상태여야 함"
+        assert velocity.dy < 0.0, "플레이어 이동 방향(위)으로 선행 조준해야 함"
+        assert abs((velocity.dx ** 2 + velocity.dy ** 2) ** 0.5 - 12.0) < 1e-9, "돌진 속력은 유지되어야 함"
@@ -0,0 +1,85 @@
+import os
+import random
+import sys
+
+import pygame
+
+# Add the src directory to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..', 'src')))
+
+from components.enums import ObstacleType
+from components.position_component import PositionComponent
+from components.projectile_component import ProjectileComponent
+from components.sprite_component import SpriteComponent
+from components.velocity_component import VelocityComponent
+from core.entity_manager import EntityManager
+from entities.obstacles import create_obstacle
+from systems.obstacle_system import ObstacleSystem
+from utils.bvh import StaticBVH
+
+
+class TestObstacleSystem:
+    def test_BVH_원_쿼리_전수조사와_일치_성공_시나리오(self) -> None:
+        """1. BVH 원 쿼리가 모든 박스 전수조사와 같은지 검증 (성공 시나리오)
+
+        목적: 중앙값 분할 트리 탐색이 겹치는 박스를 누락하지 않는지 확인
+        테스트할 범위: StaticBVH.query_circle
+        커버하는 함수 및 데이터: 무작위 크기/위치의 박스 100개
+        기대되는 안정성: 트리 가지치기 후에도 결과가 전수조사와 동일
+        """
+        # Given - 무작위 박스로 구성한 BVH
+        rng = random.Random(3)
+        boxes = []
+        for _ in range(100):
+            x, y = rng.uniform(0, 800), rng.uniform(0, 600)
+            boxes.append((x, y, x + rng.uniform(5, 80), y + rng.uniform(5, 80)))
+        bvh = StaticBVH(boxes)
+
+        for cx, cy, radius in [(400, 300, 50), (0, 0, 10), (750, 550, 120)]:
+            # When - 원 쿼리 실행
+            result = set(bvh.query_circle(cx, cy, radius))
+
+            # Then - 전수조사와 동일
+            expected = {
+                i for i, (x0, y0, x1, y1) in enumerate(boxes)
+                if (cx - min(max(cx, x0), x1)) ** 2 + (cy - min(max(cy, y0), y1)) ** 2 <= radius ** 2
+            }
+            assert result == expected, f"({cx}, {cy}, {radius}) 쿼리 결과가 전수조사와 달라서는 안 됨"
+
+    def test_장애물에_겹친_이동체_밀어내기와_투사체_반사_성공_시나리오(self) -> None:
+        """2. 장애물과 겹친 이동체는 밀려나고 투사체는 반사 (성공 시나리오)
+
+        목적: 적/플레이어는 장애물을 통과하지 못하고 바운스 투사체는 튕겨나는지 검증
+        테스트할 범위: ObstacleSystem.build, ObstacleSystem.update
+        커버하는 함수 및 데이터: PositionComponent, VelocityComponent, ProjectileComponent.bounces
+        기대되는 안정성: 바운스가 없는 투사체는 장애물에 닿으면 소멸
+        """
+        # Given - 기둥(400, 300, 40x40) 하나와 왼쪽 면에 겹친 이동체/투사체
+        entity_manager = EntityManager()
+        create_obstacle(entity_manager, ObstacleType.PILLAR, 400, 300)
+        obstacle_system = ObstacleSystem()
+        obstacle_system.build(entity_manager)
+
+        walker = self._create_mover(entity_manager, 372, 300, 20)
+        bouncing = self._create_mover(entity_manager, 375, 300, 10)
+        entity_manager.add_component(bouncing, ProjectileComponent(bounces=1))
+        plain = self._create_mover(entity_manager, 375, 300, 10)
+        entity_manager.add_component(plain, ProjectileComponent())
+
+        # When - 장애물 처리
+        obstacle_system.update(entity_manager, 0.3)
+
+        # Then - 이동체는 왼쪽 면 밖으로, 투사체는 반사/소멸
+        walker_pos = entity_manager.get_component(walker, PositionComponent)
+        assert walker_pos.x <= 380 - 10 + 1e-9, "이동체는 장애물 밖으로 밀려나야 함"
+        bouncing_vel = entity_manager.get_component(bouncing, VelocityComponent)
+        assert bouncing_vel.dx < 0, "바운스 투사체는 x축으로 반사되어야 함"
+        assert entity_manager.get_component(bouncing, ProjectileComponent).bounces == 0, "반사 시 바운스 횟수가 줄어야 함"
+        assert plain not in entity_manager.entities, "바운스가 없는 투사체는 소멸해야 함"
+
+    def _create_mover(self, entity_manager: EntityManager, x: float, y: float, size: int) -> int:
+        entity = entity_manager.create_entity()
+        entity_manager.add_component(entity.id, PositionComponent(x=x, y=y))
+        entity_manager.add_component(entity.id, VelocityComponent(dx=5, dy=0))
+        entity_manager.add_component(entity.id, SpriteComponent(surface=pygame.Surface((size, size)), rect=pygame.Rect(0, 0, size, size)))
+        return entity.id
@@ -0,0 +1,67 @@
+import math
+import os
+import random
+import sys
+
+# Add the src directory to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..', 'src')))
+
+from components.enums import CollisionLayer
+from utils.occupancy_grid import OccupancyGrid
+
+
+def _brute_force_ray(boxes, origin, angle, max_distance, mask):
+    dx, dy = math.cos(angle), math.sin(angle)
+    best = (math.inf, None)
+    # 작은 간격으로 광선을 따라가며 처음 겹치는 도형을 찾음
+    steps = int(max_distance / 0.1)
+    for step in range(steps + 1):
+        t = step * 0.1
+        x, y = origin[0] + dx * t, origin[1] + dy * t
+        for entity_id, box, layer in boxes:
+            if layer & mask and box[0] <= x <= box[2] and box[1] <= y <= box[3]:
+                return t, entity_id
+    return best
+
+
+class TestOccupancyGrid:
+    def test_레이캐스트_가장_가까운_도형_적중_성공_시나리오(self) -> None:
+        """1. DDA 레이캐스트가 가장 가까운 도형을 찾는지 검증 (성공 시나리오)
+
+        목적: 여러 셀에 걸친 상자와 레이어 마스크를 포함해 첫 적중을 정확히 반환
+        테스트할 범위: OccupancyGrid.raycast
+        커버하는 함수 및 데이터: add_static_box, CollisionLayer 마스크
+        기대되는 안정성: 마스크에 없는 레이어는 광선을 막지 않음
+        """
+        # Given - 무작위 상자: 작은 상자는 마스크 검증용 다른 레이어, 큰 상자는 장애물
+        rng = random.Random(17)
+        grid = OccupancyGrid(cell_size=40.0)
+        boxes = []
+        for entity_id in range(40):
+            x, y, size = rng.uniform(0, 800), rng.uniform(0, 600), rng.uniform(10, 60)
+            box = (x, y, x + size, y + size)
+            boxes.append((entity_id, box, CollisionLayer.ENEMY))
+            grid.add_static_box(entity_id, box, CollisionLayer.ENEMY)
+        for entity_id in range(100, 110):
+            x, y = rng.uniform(0, 760), rng.uniform(0, 560)
+            box = (x, y, x + rng.uniform(10, 90), y + rng.uniform(10, 90))
+            boxes.append((entity_id, box, CollisionLayer.OBSTACLE))
+            grid.add_static_box(entity_id, box)
+
+        for mask in [CollisionLayer.ALL, CollisionLayer.OBSTACLE]:
+            for _ in range(10):
+                origin = (rng.uniform(0, 800), rng.uniform(0, 600))
+                angle = rng.uniform(-math.pi, math.pi)
+
+                # When - 레이캐스트 실행
+                hit = grid.raycast(origin, (math.cos(angle), math.sin(angle)), 300.0, mask)
+
+                # Then - 촘촘한 샘플링 결과와 같은 도형, 거의 같은 거리
+                expected_t, expected_id = _brute_force_ray(boxes, origin, angle, 300.0, mask)
+                if expected_id is None:
+                    assert hit is None or hit.distance > 299.9, "막힘이 없는 광선은 적중이 없어야 함"
+                    continue
+                assert hit is not None, "도형이 있는 광선은 적중해야 함"
+                assert hit.distance <= expected_t + 1e-6, "샘플링보다 늦게 적중해서는 안 됨"
+                assert hit.distance >= expected_t - 0.1 - 1e-6, "샘플링보다 훨씬 이르게 적중해서는 안 됨"
+                assert hit.layer & mask, "마스크에 포함된 레이어만 적중해야 함"
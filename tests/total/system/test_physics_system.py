@@ -0,0 +1,107 @@
+import os
+import sys
+
+import pygame
+import pytest
+
+# Add the src directory to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..', 'src')))
+
+pytest.importorskip('pymunk')
+
+from components.attack_component import AttackComponent
+from components.enemy_component import EnemyComponent
+from components.enums import EnemyType, EntityStatus
+from components.health_component import HealthComponent
+from components.position_component import PositionComponent
+from components.projectile_component import ProjectileComponent
+from components.sprite_component import SpriteComponent
+from components.velocity_component import VelocityComponent
+from core.entity_manager import EntityManager
+from systems.collision_system import CollisionSystem
+from systems.movement_system import MovementSystem
+from systems.physics_system import PymunkPhysicsSystem
+
+
+def _add_sprite(entity_manager: EntityManager, entity_id: int, x: float, y: float, size: int) -> None:
+    rect = pygame.Rect(0, 0, size, size)
+    rect.center = (x, y)
+    entity_manager.add_component(entity_id, SpriteComponent(surface=pygame.Surface((size, size)), rect=rect))
+
+
+class TestPymunkPhysicsSystem:
+    def test_pymunk_브로드페이즈_투사체_적중_성공_시나리오(self) -> None:
+        """1. pymunk 백엔드로 이동/충돌한 투사체가 적에게 데미지 (성공 시나리오)
+
+        목적: 컴포넌트 -> 바디 미러링, 스텝, 위치 동기화, 충돌 콜백 연동 검증
+        테스트할 범위: PymunkPhysicsSystem.integrate, CollisionSystem(physics=...)
+        커버하는 함수 및 데이터: ProjectileComponent.prev_x, PositionComponent, HealthComponent
+        기대되는 안정성: 투사체가 적을 통과하는 동안 데미지는 한 번만 적용
+        """
+        # Given - 적을 향해 날아가는 관통 투사체
+        entity_manager = EntityManager()
+        physics = PymunkPhysicsSystem()
+        collision_system = CollisionSystem(800, 600, physics=physics)
+
+        enemy = entity_manager.create_entity()
+        entity_manager.add_component(enemy.id, PositionComponent(x=200, y=100))
+        entity_manager.add_component(enemy.id, VelocityComponent(dx=0, dy=0))
+        entity_manager.add_component(enemy.id, EnemyComponent(enemy_type=EnemyType.KOREAN_TEACHER))
+        entity_manager.add_component(enemy.id, HealthComponent(base_maximum=100, current=100, maximum=100, status=EntityStatus.ALIVE))
+        _add_sprite(entity_manager, enemy.id, 200, 100, 30)
+
+        projectile = entity_manager.create_entity()
+        entity_manager.add_component(projectile.id, PositionComponent(x=100, y=100))
+        entity_manager.add_component(projectile.id, VelocityComponent(dx=100, dy=0))
+        entity_manager.add_component(projectile.id, AttackComponent(damage=10))
+        entity_manager.add_component(projectile.id, ProjectileComponent(pierce=5))
+        _add_sprite(entity_manager, projectile.id, 100, 100, 15)
+
+        # When - 투사체가 적을 완전히 통과할 때까지 스텝
+        for _ in range(20):
+            physics.update(entity_manager, 0.1)
+            collision_system.update(entity_manager, 0.1)
+
+        # Then - 위치가 동기화되고 데미지는 한 번만 적용
+        projectile_pos = entity_manager.get_component(projectile.id, PositionComponent)
+        assert projectile_pos.x == pytest.approx(300.0), "pymunk 스텝 결과가 위치 컴포넌트에 동기화되어야 함"
+        health = entity_manager.get_component(enemy.id, HealthComponent)
+        assert health.current == 90, "관통 중인 접촉에서는 한 번만 데미지를 받아야 함"
+
+    def test_두_백엔드_모두_빠른_투사체_터널링_없음_성공_시나리오(self) -> None:
+        """2. 한 스텝에 적을 건너뛰는 투사체도 기본/pymunk 백엔드 모두에서 적중 (성공 시나리오)
+
+        목적: pymunk 백엔드에서도 투사체가 스텝 끝 겹침이 아닌 이동 경로 스윕으로 판정되는지 검증
+        테스트할 범위: MovementSystem.integrate, PymunkPhysicsSystem.integrate, CollisionSystem.update
+        커버하는 함수 및 데이터: ProjectileComponent.prev_x/prev_y, SpatialGrid.query_segment_indices
+        기대되는 안정성: 백엔드 선택과 관계없이 같은 데미지
+        """
+        for physics in (None, PymunkPhysicsSystem()):
+            # Given - 10px 공이 0.5초 스텝마다 100px 이동, 경로 중간(150)에 30px 적
+            entity_manager = EntityManager()
+            movement_system = physics if physics is not None else MovementSystem()
+            collision_system = CollisionSystem(800, 600, physics=physics)
+
+            enemy = entity_manager.create_entity()
+            entity_manager.add_component(enemy.id, PositionComponent(x=150, y=100))
+            entity_manager.add_component(enemy.id, VelocityComponent(dx=0, dy=0))
+            entity_manager.add_component(enemy.id, EnemyComponent(enemy_type=EnemyType.KOREAN_TEACHER))
+            entity_manager.add_component(enemy.id, HealthComponent(base_maximum=100, current=100, maximum=100, status=EntityStatus.ALIVE))
+            _add_sprite(entity_manager, enemy.id, 150, 100, 30)
+
+            projectile = entity_manager.create_entity()
+            entity_manager.add_component(projectile.id, PositionComponent(x=100, y=100))
+            entity_manager.add_component(projectile.id, VelocityComponent(dx=200, dy=0))
+            entity_manager.add_component(projectile.id, AttackComponent(damage=10))
+            entity_manager.add_component(projectile.id, ProjectileComponent(pierce=5))
+            _add_sprite(entity_manager, projectile.id, 100, 100, 10)
+
+            # When - 두 스텝 모두 적과 겹치지 않는 위치(200, 300)에서 끝남
+            for _ in range(2):
+                movement_system.update(entity_manager, 0.5)
+                collision_system.update(entity_manager, 0.5)
+
+            # Then - 지나간 적은 한 번 맞음
+            backend = "pymunk" if physics is not None else "기본"
+            health = entity_manager.get_component(enemy.id, HealthComponent)
+            assert health.current == 90, f"{backend} 백엔드에서 이동 경로상의 적이 맞아야 함"
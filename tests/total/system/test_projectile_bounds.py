@@ -0,0 +1,49 @@
+import os
+import sys
+
+# Add the src directory to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..', 'src')))
+
+from components.position_component import PositionComponent
+from components.projectile_component import ProjectileComponent
+from components.velocity_component import VelocityComponent
+from core.entity_manager import EntityManager
+from systems.collision_system import CollisionSystem
+
+
+class TestProjectileBounds:
+    def _create_projectile(self, entity_manager: EntityManager, x: float, y: float, dx: float, dy: float, projectile: ProjectileComponent) -> int:
+        entity = entity_manager.create_entity()
+        entity_manager.add_component(entity.id, PositionComponent(x=x, y=y))
+        entity_manager.add_component(entity.id, VelocityComponent(dx=dx, dy=dy))
+        entity_manager.add_component(entity.id, projectile)
+        return entity.id
+
+    def test_경계_반사와_수명_만료_소멸_성공_시나리오(self) -> None:
+        """1. 경계 반사, 경계 이탈 소멸, 수명/사거리 만료 소멸 (성공 시나리오)
+
+        목적: 배열 연산 기반 경계 처리가 기존 규칙과 수명 제한을 함께 적용하는지 검증
+        테스트할 범위: CollisionSystem.handle_projectile_wall_collisions
+        커버하는 함수 및 데이터: ProjectileComponent.bounces/max_lifetime/max_distance
+        기대되는 안정성: 바운스가 남은 투사체도 수명이 다하면 소멸
+        """
+        # Given - 반사/이탈/수명 만료/사거리 만료 투사체
+        entity_manager = EntityManager()
+        collision_system = CollisionSystem(800, 600)
+        reflected = self._create_projectile(entity_manager, 805, 300, 10, 0, ProjectileComponent(bounces=2))
+        escaped = self._create_projectile(entity_manager, 400, -5, 0, -10, ProjectileComponent())
+        old = self._create_projectile(entity_manager, 400, 300, 10, 0, ProjectileComponent(bounces=5, max_lifetime=1.0, lifetime=0.9))
+        far = self._create_projectile(entity_manager, 400, 300, 10, 0, ProjectileComponent(bounces=5, max_distance=100.0, distance_traveled=99.0))
+        fresh = self._create_projectile(entity_manager, 400, 300, 10, 0, ProjectileComponent(max_lifetime=10.0, max_distance=100.0))
+
+        # When - 한 프레임 경계 처리
+        collision_system.handle_projectile_wall_collisions(entity_manager, 0.2)
+
+        # Then - 반사 투사체만 방향이 바뀌고 만료/이탈 투사체는 소멸
+        assert entity_manager.get_component(reflected, VelocityComponent).dx == -10, "경계에서 x 속도가 반전되어야 함"
+        assert entity_manager.get_component(reflected, PositionComponent).x == 800, "반사된 투사체는 화면 안으로 돌아와야 함"
+        assert entity_manager.get_component(reflected, ProjectileComponent).bounces == 1, "반사 시 바운스가 줄어야 함"
+        assert escaped not in entity_manager.entities, "바운스가 없는 투사체는 화면 밖에서 소멸해야 함"
+        assert old not in entity_manager.entities, "수명이 다한 투사체는 소멸해야 함"
+        assert far not in entity_manager.entities, "사거리를 넘은 투사체는 소멸해야 함"
+        assert entity_manager.get_component(fresh, ProjectileComponent).distance_traveled == 2.0, "이동 거리가 누적되어야 함"
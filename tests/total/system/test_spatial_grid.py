@@ -0,0 +1,96 @@
+import math
+import os
+import random
+import sys
+
+# Add the src directory to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..', 'src')))
+
+from utils.spatial_grid import SpatialGrid
+
+
+def _brute_force_sector(points: list[tuple[int, float, float]], center: tuple[float, float], radius: float, angle: float, arc: float) -> set[int]:
+    result = set()
+    for entity_id, x, y in points:
+        dx, dy = x - center[0], y - center[1]
+        if dx * dx + dy * dy > radius * radius:
+            continue
+        angle_diff = math.atan2(dy, dx) - math.radians(angle)
+        angle_diff = (angle_diff + math.pi) % (2 * math.pi) - math.pi
+        if abs(angle_diff) <= math.radians(arc) / 2:
+            result.add(entity_id)
+    return result
+
+
+class TestSpatialGrid:
+    def test_반경_쿼리_전수조사와_일치_성공_시나리오(self) -> None:
+        """1. 격자 반경 쿼리가 전수조사 결과와 같은지 검증 (성공 시나리오)
+
+        목적: 셀 슬라이스 기반 후보 수집이 누락 없이 동작하는지 확인
+        테스트할 범위: SpatialGrid.rebuild, SpatialGrid.query_radius
+        커버하는 함수 및 데이터: 화면 밖 음수 좌표를 포함한 무작위 점
+        기대되는 안정성: 셀 경계와 음수 좌표에서도 결과 누락 없음
+        """
+        # Given - 화면 밖까지 퍼진 무작위 점
+        rng = random.Random(7)
+        points = [(i, rng.uniform(-50, 850), rng.uniform(-50, 650)) for i in range(300)]
+        grid = SpatialGrid(cell_size=48.0)
+        grid.rebuild([p[0] for p in points], [p[1] for p in points], [p[2] for p in points])
+
+        # When - 반경 쿼리 실행
+        result = set(grid.query_radius(400.0, 300.0, 150.0).tolist())
+
+        # Then - 전수조사와 동일
+        expected = {i for i, x, y in points if (x - 400.0) ** 2 + (y - 300.0) ** 2 <= 150.0 ** 2}
+        assert result == expected, "반경 쿼리 결과가 전수조사와 달라서는 안 됨"
+
+    def test_부채꼴_쿼리_atan2_판정과_일치_성공_시나리오(self) -> None:
+        """2. 내적 기반 부채꼴 판정이 atan2 판정과 같은지 검증 (성공 시나리오)
+
+        목적: 야구방망이 각도(90/180/360도)에서 기존 atan2 판정과 동일한 결과 보장
+        테스트할 범위: SpatialGrid.entities_in_sector
+        커버하는 함수 및 데이터: 방향 각도, 부채꼴 각도, 반경
+        기대되는 안정성: 각도 정규화 없이도 경계를 넘는 방향(예: 170도)에서 동일
+        """
+        # Given - 무작위 점과 격자
+        rng = random.Random(11)
+        points = [(i, rng.uniform(0, 800), rng.uniform(0, 600)) for i in range(300)]
+        grid = SpatialGrid()
+        grid.rebuild([p[0] for p in points], [p[1] for p in points], [p[2] for p in points])
+
+        for angle, arc in [(0.0, 90.0), (170.0, 90.0), (-45.0, 180.0), (30.0, 360.0)]:
+            # When - 부채꼴 쿼리 실행
+            result = set(grid.entities_in_sector((400.0, 300.0), 120.0, angle, arc).tolist())
+
+            # Then - 기존 atan2 판정과 동일
+            expected = _brute_force_sector(points, (400.0, 300.0), 120.0, angle, arc)
+            assert result == expected, f"angle={angle}, arc={arc} 부채꼴 판정이 달라서는 안 됨"
+
+    def test_이웃_쌍_쿼리_전수조사와_일치_성공_시나리오(self) -> None:
+        """3. 그리드 이웃 쌍이 O(n²) 전수조사 결과와 같은지 검증 (성공 시나리오)
+
+        목적: 적 군집 분리에 쓰이는 이웃 쌍 전개가 누락/중복 없이 동작하는지 확인
+        테스트할 범위: SpatialGrid.neighbor_pairs
+        커버하는 함수 및 데이터: 셀 크기보다 큰 반경, 같은 좌표에 겹친 점
+        기대되는 안정성: 자기 자신과의 쌍은 제외하고 (i, j), (j, i)를 모두 반환
+        """
+        # Given - 겹친 점을 포함한 무작위 점
+        rng = random.Random(5)
+        points = [(i, rng.uniform(0, 400), rng.uniform(0, 300)) for i in range(200)]
+        points.append((200, points[0][1], points[0][2]))
+        grid = SpatialGrid(cell_size=20.0)
+        grid.rebuild([p[0] for p in points], [p[1] for p in points], [p[2] for p in points])
+
+        # When - 셀 크기보다 큰 반경으로 이웃 쌍 조회
+        first, second = grid.neighbor_pairs(30.0)
+        result = list(zip(first.tolist(), second.tolist()))
+
+        # Then - 전수조사와 동일하고 중복 없음
+        expected = {
+            (i, j)
+            for i, (_, xi, yi) in enumerate(points)
+            for j, (_, xj, yj) in enumerate(points)
+            if i != j and (xi - xj) ** 2 + (yi - yj) ** 2 <= 30.0 ** 2
+        }
+        assert len(result) == len(set(result)), "이웃 쌍이 중복되어서는 안 됨"
+        assert set(result) == expected, "이웃 쌍이 전수조사와 달라서는 안 됨"